@@ -0,0 +1,80 @@
+"""
+Import-time benchmark of the BACAP_Parser package.
+
+Every statement is measured in a fresh interpreter (best of ``--repeat`` runs). The script exits with code 1
+if ``import BACAP_Parser`` eagerly imports any submodule, if a statement is slower than ``--budget`` milliseconds,
+or if a public name of the package is a submodule after the submodules were imported (e.g. ``Color``),
+so it can be used in CI to guard against import-time regressions.
+
+Usage: python benchmarks/import_time.py [--repeat 5] [--budget 150]
+"""
+import argparse
+import subprocess
+import sys
+
+STATEMENTS = (
+    "import BACAP_Parser",
+    "from BACAP_Parser import Color",
+    "from BACAP_Parser import nbt_decoder",
+    "from BACAP_Parser import Parser",
+)
+
+MEASURE = """
+import sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+submodules = sorted(name for name in sys.modules if name.startswith("BACAP_Parser."))
+print(elapsed * 1000, ",".join(submodules))
+"""
+
+# Imports submodules first, like the ``bacap-parser`` entry point, then checks that public names are not the submodules
+SHADOWED_NAMES = """
+import BACAP_Parser.Advancement, BACAP_Parser.cli
+import BACAP_Parser
+from types import ModuleType
+# vars() does not call the lazy __getattr__ of the package, which could hide the bound submodules
+print(",".join(name for name in BACAP_Parser.__all__ if isinstance(vars(BACAP_Parser).get(name), ModuleType)))
+"""
+
+
+def shadowed_names() -> list[str]:
+    output = subprocess.run([sys.executable, "-c", SHADOWED_NAMES], check=True, capture_output=True, text=True).stdout.strip()
+    return output.split(",") if output else []
+
+
+def measure(statement: str) -> tuple[float, list[str]]:
+    output = subprocess.run([sys.executable, "-c", MEASURE.format(statement=statement)],
+                            check=True, capture_output=True, text=True).stdout.split()
+    return float(output[0]), output[1].split(",") if len(output) > 1 else []
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="runs per statement, the best one is reported")
+    parser.add_argument("--budget", type=float, default=150.0, help="maximum time of a statement in milliseconds")
+    args = parser.parse_args()
+
+    failed = False
+    for statement in STATEMENTS:
+        runs = [measure(statement) for _ in range(args.repeat)]
+        best, submodules = min(runs)
+        print(f"{best:8.2f} ms  {len(submodules):3} submodules  {statement}")
+
+        if best > args.budget:
+            print(f"    slower than the budget of {args.budget} ms")
+            failed = True
+        if statement == "import BACAP_Parser" and submodules:
+            print(f"    the package must not import submodules eagerly: {', '.join(submodules)}")
+            failed = True
+
+    shadowed = shadowed_names()
+    if shadowed:
+        print(f"public names bound to submodules: {', '.join(shadowed)}")
+        failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,17 +1,26 @@
 from collections.abc import Iterable, Iterator
 from functools import reduce
+from itertools import chain, islice
 from pathlib import Path
 from typing import Literal, Type, Any
 
-from .AdvType import AdvType
+from .AdvType import AdvType, MultipleTypesMatch, NoTypesMatch
 from .ExtendedDict import ExtendedDict
-from .constants import DEFAULT_MINECRAFT_DESCRIPTION_COLOR, DEFAULT_MINECRAFT_FRAME, DEFAULT_MINECRAFT_FRAME_COLOR_MAP
+from .constants import COMPLETION_FIELDS, DEFAULT_LOCALE, DEFAULT_MINECRAFT_DESCRIPTION_COLOR, DEFAULT_MINECRAFT_FRAME, DEFAULT_MINECRAFT_FRAME_COLOR_MAP
 from .Color import Color
-from .CriteriaList import CriteriaList
+from .ContentCache import ContentCache
+from .CriteriaList import CriteriaList, FrozenCriteriaList
+from .DataIndex import DataIndex
 from .Datapack import Datapack
 from .Item import Item
+from .LangIndex import LangIndex
+from .PrefixIndex import PrefixIndex
+from .Profiler import active_observer, timed
 from .Rewards import Exp, Trophy, Reward
-from .utils import path_to_mc_path, safe_load_json_file, trim_path_to_namespace
+from .Schema import AdvancementRecord, AdvancementSchema, SchemaField
+from .SymbolTable import SymbolTable
+from .TextComponent import TextComponent
+from .utils import content_hash, cut_namespace, normalize_id, normalized_json, path_to_mc_path, to_collection, trim_path_to_namespace
 
 
 class AdvancementException(Exception):
@@ -23,6 +32,16 @@ class AdvancementException(Exception):
     def __init__(self, message="Something went wrong"):
         super().__init__(message)
 
+    def __reduce__(self):
+        # Subclasses have other __init__ signatures, so exceptions are restored without calling __init__
+        return _restore_exception, (type(self), self.args)
+
+
+def _restore_exception(cls: type[AdvancementException], args: tuple) -> AdvancementException:
+    exception = cls.__new__(cls)
+    exception.args = args
+    return exception
+
 
 class JSONParsingError(AdvancementException):
     """
@@ -58,28 +77,90 @@ class MissingDescriptionField(AdvancementException):
         super().__init__("Advancement does not contain a description")
 
 
+class UnrecognizedType(AdvancementException):
+    """
+    Exception raised in non-strict mode when no AdvType or several AdvTypes match the advancement.
+    """
+    def __init__(self, reason: NoTypesMatch | MultipleTypesMatch):
+        super().__init__(str(reason))
+
+
+class MalformedAdvancement(AdvancementException):
+    """
+    Exception raised in non-strict mode when the advancement JSON has an unexpected structure.
+    """
+    def __init__(self, reason: Exception):
+        super().__init__(f"Advancement JSON has an unexpected structure: {reason!r}")
+
+
+# Fields of the advancement JSON read by the factory and Advancement, extend it to extract additional fields
+DEFAULT_ADVANCEMENT_SCHEMA = AdvancementSchema((
+    SchemaField("reward_function", ("rewards", "function"), types=str, required=True, error=InvalidRewardFunction),
+    SchemaField("title", ("display", "title", "translate"), ("display", "title", "text"), types=str, required=True, error=MissingTitleField),
+    SchemaField("description", ("display", "description", "translate"), ("display", "description", "text"), types=str, required=True,
+                error=MissingDescriptionField),
+    SchemaField("description_color", ("display", "description", "color"), types=str),
+    SchemaField("description_extra", ("display", "description", "extra"), types=list),
+    SchemaField("icon", ("display", "icon"), types=dict, required=True),
+    SchemaField("frame", ("display", "frame"), types=str),
+    SchemaField("hidden", ("display", "hidden"), types=bool, default=False),
+    SchemaField("background", ("display", "background"), types=str),
+))
+
+
 class BaseAdvancement:
-    def __init__(self, path: Path, adv_json: ExtendedDict | None, datapack: Datapack):
+    def __init__(self, path: Path, adv_json: ExtendedDict | None, datapack: Datapack, mc_path: str | None = None):
         """
         Initializes a new instance of the BaseAdvancement class.
         :param path: The file path to the advancement JSON file.
         :param adv_json: Parsed JSON file as dict.
+        :param mc_path: The Minecraft path of the advancement, if None, it is computed from the path and the namespaces of the datapack.
         """
         self._json = adv_json
         self._path = path
         self._datapack = datapack
 
-        self._filename = path.stem
-        trimmed_path = trim_path_to_namespace(self._path, self._datapack.namespaces)
-        self._mc_path = path_to_mc_path(trimmed_path)
-        self._namespace = trimmed_path.parts[0]
-        self._criteria_list = CriteriaList(self._json["criteria"])
+        if mc_path is None:
+            mc_path = path_to_mc_path(trim_path_to_namespace(self._path, self._datapack.namespaces))
+        self._mc_path = mc_path
+        self._namespace, relative_path = mc_path.split(":", 1)
+        self._filename = relative_path.rsplit("/", 1)[-1]
+        self._criteria_list = self._parse_criteria()
 
         if self._json:
             self._parent = self._json.get("parent")
         else:
             self._parent = None
 
+        self._fingerprint: str | None = None
+
+    def _parse_criteria(self) -> CriteriaList:
+        """
+        :return: CriteriaList of the advancement, empty if the JSON could not be parsed.
+        """
+        if self._json is None:
+            return CriteriaList(None)
+        return self._datapack.symbol_table.content.derived(self._json, "criteria", lambda: FrozenCriteriaList(self._json["criteria"]))
+
+    def _intern_strings(self, symbol_table: SymbolTable):
+        """
+        Replaces the raw JSON strings and repeated identifiers of the advancement with the instances stored in the symbol table.
+        :param symbol_table: SymbolTable instance.
+        """
+        # JSON shared with sibling datapacks is interned by the ContentCache before other threads can read it,
+        # its criteria are created from the interned JSON
+        if not symbol_table.content.owns(self._json):
+            self.__intern_content(symbol_table)
+        self._mc_path = symbol_table.intern(self._mc_path)
+        self._namespace = symbol_table.intern(self._namespace)
+        self._filename = symbol_table.intern(self._filename)
+        self._parent = symbol_table.intern(self._parent)
+
+    def __intern_content(self, symbol_table: SymbolTable):
+        symbol_table.intern_values(self._json)
+        for criteria in self._criteria_list:
+            criteria._intern_strings(symbol_table)
+
     @property
     def path(self) -> Path:
         """
@@ -87,6 +168,13 @@ class BaseAdvancement:
         """
         return self._path
 
+    @property
+    def datapack(self) -> Datapack:
+        """
+        :return: The Datapack instance of the advancement.
+        """
+        return self._datapack
+
     @property
     def json_string(self) -> str:
         """
@@ -97,7 +185,7 @@ class BaseAdvancement:
     @property
     def json(self) -> dict | None:
         """
-        :return: The JSON content of the advancement.
+        :return: The read-only JSON content of the advancement (FrozenDict), use ``copy.deepcopy`` to get a mutable copy.
         """
         return self._json
 
@@ -132,10 +220,26 @@ class BaseAdvancement:
     @property
     def criteria_list(self) -> CriteriaList:
         """
-        Returns a 'CriteriaList' of criteria for the advancement
+        Returns a 'CriteriaList' of criteria for the advancement, read-only if it is parsed from the JSON (FrozenCriteriaList)
         """
         return self._criteria_list
 
+    def _fingerprint_parts(self) -> list[str]:
+        """
+        :return: Strings that define the content of the advancement.
+        """
+        return [type(self).__name__, normalized_json(self._json)]
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        :return: Stable hash of the normalized JSON of the advancement (and its reward functions for normal advancements),
+        computed during load. Equal fingerprints mean equal content, regardless of the datapack and file path.
+        """
+        if self._fingerprint is None:
+            self._fingerprint = content_hash(*self._fingerprint_parts())
+        return self._fingerprint
+
     # To sort in alphabetic order by mcpath
     def __gt__(self, other):
         return self.mc_path > other.mc_path
@@ -162,16 +266,23 @@ class InvalidAdvancement(BaseAdvancement):
     Inherits from BaseAdvancement.
     """
 
-    def __init__(self, reason: AdvancementException, path: Path, adv_json: dict | None, datapack: Datapack):
+    def __init__(self, reason: AdvancementException, path: Path, adv_json: dict | None, datapack: Datapack, mc_path: str | None = None):
         """
         Initializes a new instance of the InvalidAdvancement class.
         :param path: The file path to the advancement JSON file.
         :param datapack: The name of datapack.
         :param reason (str, optional): The reason why the advancement is considered invalid.
+        :param mc_path: The Minecraft path of the advancement, computed from the path if None.
         """
-        super().__init__(path, adv_json, datapack)
+        super().__init__(path, adv_json, datapack, mc_path)
         self._reason = reason
 
+    def _parse_criteria(self) -> CriteriaList:
+        try:
+            return super()._parse_criteria()
+        except (KeyError, TypeError, AttributeError):
+            return CriteriaList()
+
     @property
     def reason(self) -> AdvancementException:
         """
@@ -186,13 +297,14 @@ class TechnicalAdvancement(BaseAdvancement):
     Inherits from BaseAdvancement.
     """
 
-    def __init__(self, path: Path, datapack: Datapack, adv_json):
+    def __init__(self, path: Path, datapack: Datapack, adv_json, mc_path: str | None = None):
         """
         Initializes a new instance of the TechnicalAdvancement class.
         :param path: The file path to the advancement JSON file.
         :param datapack: The name of datapack.
+        :param mc_path: The Minecraft path of the advancement, computed from the path if None.
         """
-        super().__init__(path, adv_json, datapack)
+        super().__init__(path, adv_json, datapack, mc_path)
 
 
 class Advancement(BaseAdvancement):
@@ -202,7 +314,7 @@ class Advancement(BaseAdvancement):
     """
 
     def __init__(self, path: Path, adv_json: ExtendedDict, datapack: Datapack, reward_mcpath: str, tab: str, color: Color, frame: str, adv_type: AdvType,
-                 hidden: bool):
+                 hidden: bool, record: AdvancementRecord | None = None, mc_path: str | None = None):
         """
         Creates a new instance of the Advancement class
 
@@ -213,22 +325,30 @@ class Advancement(BaseAdvancement):
         :param frame: The frame type for advancement.
         :param adv_type: The AdvType class of advancement.
         :param hidden: Whether the advancement is hidden.
+        :param record: AdvancementRecord extracted by the schema of the datapack, if None, it is extracted from adv_json.
+        :param mc_path: The Minecraft path of the advancement, computed from the path if None.
         :return: An instance of Advancement.
+        :raises Exception: If the record is not given and adv_json does not match the schema, see ``AdvancementSchema.extract``.
         """
 
-        super().__init__(path, adv_json, datapack)
+        super().__init__(path, adv_json, datapack, mc_path)
+        if record is None:
+            record = datapack.schema.extract(adv_json)
+            if isinstance(record, Exception):
+                raise record
+        self._record = record
         self._tab = tab
         self._color = color
         self._frame = frame
         self._hidden = hidden
         self._type = adv_type
-        self._reward_mcpath = reward_mcpath
-        self._title = self._json["display"]["title"]["translate"]
-        self._description = self._json["display"]["description"]["translate"]
-        if "extra" in self._json["display"]["description"]:
+        self._reward_mcpath = normalize_id(reward_mcpath)
+        self._title = record["title"]
+        self._description = record["description"]
+        if record["description_extra"] is not None:
             self._get_description_from_extra()
-        self._background = self._json["display"].get("background")
-        self._icon = Item(self._json["display"]["icon"])
+        self._background = record["background"]
+        self._icon = datapack.symbol_table.content.derived(adv_json, "icon", lambda: Item(record["icon"]))
 
         if self._datapack.reward_namespace_path is not None:
             self._exp = self._initialize_reward("exp", self._datapack.exp_class)
@@ -239,14 +359,49 @@ class Advancement(BaseAdvancement):
             self._reward = None
             self._trophy = None
 
+    def _intern_strings(self, symbol_table: SymbolTable):
+        super()._intern_strings(symbol_table)
+        self._tab = symbol_table.intern(self._tab)
+        self._frame = symbol_table.intern(self._frame)
+        self._reward_mcpath = symbol_table.intern(self._reward_mcpath)
+        self._title = symbol_table.intern(self._title)
+        self._description = symbol_table.intern(self._description)
+        self._background = symbol_table.intern(self._background)
+        self._icon = symbol_table.items.canonical(self._icon, symbol_table)
+        for reward in (self._reward, self._trophy):
+            if reward is not None:
+                reward._item = symbol_table.items.canonical(reward.item, symbol_table)
+
+    def _fingerprint_parts(self) -> list[str]:
+        parts = super()._fingerprint_parts()
+        for reward in (self._exp, self._reward, self._trophy):
+            parts.append(reward.raw_text if reward is not None else "")
+        return parts
+
     def _get_description_from_extra(self):
-        for item in self._json["display"]["description"].get("extra", []):
-            if not item:
+        self._description = self._render_description()
+
+    def _render_description(self, lang_index: LangIndex | None = None, locale: str = DEFAULT_LOCALE) -> str:
+        """
+        Flattens the description component with its ``extra`` parts.
+        The root content is always kept, ``extra`` parts only if their color is the advancement color or they are line breaks,
+        so parts with another or no color (e.g. notes of addons) are skipped.
+        :param lang_index: LangIndex used to translate the description, if None, the raw keys are used.
+        :param locale: Locale, e.g. ``en_us``.
+        :return: Description text.
+        """
+        description = self._json["display"]["description"]
+        if lang_index is None:
+            parts = [self._record["description"]]
+        else:
+            parts = [TextComponent({key: value for key, value in description.items() if key != "extra"}, lang_index, locale).plain]
+        for part in description.get("extra", ()):
+            if not part or not isinstance(part, dict):
                 continue
-            text_value = item.get_with_multiple_values("text", "translate", default="")
-            if isinstance(item, dict) and (item.get("color") == self._color.value or text_value == "\n" or text_value.rstrip("\n") == ""):
-                self._description += text_value
-        self._description = self._description.rstrip("\n")
+            text = TextComponent.of(part, lang_index, locale).plain
+            if part.get("color") == self._color.value or text.rstrip("\n") == "":
+                parts.append(text)
+        return "".join(parts).rstrip("\n")
 
     def _initialize_reward(self, name: Literal["exp", "reward", "trophy"], cls: Type[Exp | Reward | Trophy]):
         """
@@ -255,9 +410,12 @@ class Advancement(BaseAdvancement):
         :return: Instance of the reward class or None if initialization fails.
         """
         reward_path = self._build_reward_path(name)
-        if reward_path.exists():
+        if reward_path is not None:
+            content = self._datapack.symbol_table.content
             try:
-                return cls(reward_path, self._build_reward_mcpath(name))
+                if active_observer.get() is None:
+                    return content.reward(cls, reward_path, self._build_reward_mcpath(name))
+                return timed("rewards", reward_path, content.reward, cls, reward_path, self._build_reward_mcpath(name))
             except ValueError:
                 return None
         return None
@@ -266,8 +424,12 @@ class Advancement(BaseAdvancement):
         namespace, folders = self._reward_mcpath.split(":", 1)
         return f"{namespace}:{reward_type}/{folders}"
 
-    def _build_reward_path(self, reward_type: Literal["exp", "reward", "trophy"]) -> Path:
-        return self._datapack.reward_namespace_path / f"function/{reward_type}/{self._reward_mcpath.split(":", 1)[1]}.mcfunction"
+    def _build_reward_path(self, reward_type: Literal["exp", "reward", "trophy"]) -> Path | None:
+        """
+        :return: Path to the reward function in the winning layer of the datapack, None if it does not exist.
+        """
+        resource = f"{self._datapack.reward_namespace}/function/{reward_type}/{self._reward_mcpath.split(":", 1)[1]}.mcfunction"
+        return self._datapack.data_index.resolve(resource)
 
     @property
     def title(self) -> str:
@@ -283,6 +445,25 @@ class Advancement(BaseAdvancement):
         """
         return self._description
 
+    def title_text(self, locale: str = DEFAULT_LOCALE) -> str:
+        """
+        :param locale: Locale, e.g. ``en_us``.
+        :return: Title translated with the LangIndex of the datapack, or the raw title if it is not translated.
+        """
+        lang_index = self._datapack.lang_index
+        return lang_index.translate(self._title, locale) if lang_index is not None else self._title
+
+    def description_text(self, locale: str = DEFAULT_LOCALE) -> str:
+        """
+        :param locale: Locale, e.g. ``en_us``.
+        :return: Description translated with the LangIndex of the datapack, or the raw description if it is not translated.
+        The texts of the ``extra`` parts are appended like in ``description``.
+        """
+        lang_index = self._datapack.lang_index
+        if lang_index is None:
+            return self._description
+        return self._render_description(lang_index, locale)
+
     @property
     def type(self) -> AdvType:
         """
@@ -346,6 +527,13 @@ class Advancement(BaseAdvancement):
         """
         return self._icon
 
+    @property
+    def record(self) -> AdvancementRecord:
+        """
+        :return: AdvancementRecord with the fields extracted by the schema of the datapack, including user-declared fields.
+        """
+        return self._record
+
     @property
     def reward_mcpath(self) -> str:
         """
@@ -388,56 +576,132 @@ class AdvancementManager:
         """
         self._datapack = datapack
 
-        self._advancement_folders = self._get_advancement_folders(datapack.data_path)
-        self._technical_tabs_paths = [
-            advancement_folder / technical_tab
-            for advancement_folder in self._advancement_folders
-            for technical_tab in technical_tabs
-            if (advancement_folder / technical_tab).is_dir()
-        ]
+        self._technical_tabs = to_collection(technical_tabs, frozenset) if technical_tabs is not None else frozenset()
+        self._technical_tabs_paths: list[Path] | None = None
 
         self._advancements_dict: dict[Path, InvalidAdvancement | TechnicalAdvancement | Advancement] = {}
-        self.__load_advancements()
-        self._advancements_list: list = list(self._advancements_dict.values())
+        self._lint_issues: list = []
 
-    def __load_advancements(self):
-        for adv_folder in self._advancement_folders:
-            for adv_path in adv_folder.rglob('*.json'):
-                self._advancements_dict[adv_path] = _AdvancementFactory.load_advancement(adv_path, self)
+        self.__load_advancements(_AdvancementFactory if datapack.observer is None else _ProfiledAdvancementFactory)
 
-    @staticmethod
-    def _get_advancement_folders(data_path) -> list[Path]:
-        advancement_folders = []
+        # Advancements are ordered by mc_path, independent of the order of the files on disk
+        self._advancements_dict = dict(sorted(self._advancements_dict.items(), key=lambda item: item[1].mc_path))
+        self._advancements_list: list = list(self._advancements_dict.values())
+        self._completion_indexes: dict[str, PrefixIndex] = {}
+        self._stats: "AdvancementStats | None" = None
+        self.__build_fingerprints()
+
+        if datapack.lint_checks:
+            from .Lint import LintReport
+            for check in datapack.lint_checks:
+                self._lint_issues.extend(check.check_manager(self))
+            self._lint_report = LintReport(self._lint_issues)
+        else:
+            self._lint_report = None
 
-        for namespace in data_path.iterdir():
-            if not namespace.is_dir():
-                continue
+    def __load_advancements(self, factory: type["_AdvancementFactory"]):
+        symbol_table = self._datapack.symbol_table
+        lint_checks = self._datapack.lint_checks
+        for entry in factory.walk(self._datapack.data_index, self._technical_tabs):
+            advancement = factory.load_advancement(entry, self)
+            advancement._intern_strings(symbol_table)
+            advancement._fingerprint = content_hash(*advancement._fingerprint_parts())
+            self._advancements_dict[entry.path] = advancement
+            for check in lint_checks:
+                self._lint_issues.extend(check.check_advancement(advancement))
 
-            advancement_path = namespace / "advancement"
+    def __build_fingerprints(self):
+        """
+        Rolls up fingerprints of the advancements into fingerprints of the tabs (first folder of the mc_path),
+        namespaces and the whole manager, like a Merkle tree.
+        """
+        tabs: dict[str, list[str]] = {}
+        for adv in self._advancements_list:
+            namespace, path = adv.mc_path.split(":", 1)
+            tab = path.split("/", 1)[0] if "/" in path else ""
+            tabs.setdefault(f"{namespace}:{tab}", []).extend((adv.mc_path, adv.fingerprint))
+        self._tab_fingerprints = {tab: content_hash(*parts) for tab, parts in sorted(tabs.items())}
+
+        namespaces: dict[str, list[str]] = {}
+        for tab, fingerprint in self._tab_fingerprints.items():
+            namespaces.setdefault(tab.split(":", 1)[0], []).extend((tab, fingerprint))
+        self._namespace_fingerprints = {namespace: content_hash(*parts) for namespace, parts in namespaces.items()}
 
-            if advancement_path.exists() and advancement_path.is_dir():
-                advancement_folders.append(advancement_path)
+        self._fingerprint = content_hash(*chain.from_iterable(self._namespace_fingerprints.items()))
 
-        return advancement_folders
+    def _intern_strings(self, symbol_table: SymbolTable):
+        """
+        Moves the strings of all advancements to another symbol table.
+        :param symbol_table: SymbolTable instance.
+        """
+        for advancement in self._advancements_list:
+            advancement._intern_strings(symbol_table)
 
     @property
     def technical_tabs_paths(self) -> list[Path]:
         """
-        :return: A list of paths to the technical tabs.
-        """
+        :return: A list of paths to the technical tabs in all layers of the datapack.
+        """
+        if self._technical_tabs_paths is None:
+            data_index = self._datapack.data_index
+            self._technical_tabs_paths = [
+                layer / namespace / "advancement" / technical_tab
+                for layer in data_index.layers
+                for namespace in data_index.namespaces
+                for technical_tab in self._technical_tabs
+                if (layer / namespace / "advancement" / technical_tab).is_dir()
+            ]
         return self._technical_tabs_paths
 
+    @property
+    def fingerprint(self) -> str:
+        """
+        :return: Root hash of the fingerprints of all advancements, changes if any advancement or its reward functions change.
+        """
+        return self._fingerprint
+
+    @property
+    def namespace_fingerprints(self) -> dict[str, str]:
+        """
+        :return: Dict where key is a namespace and value is the hash of the fingerprints of its tabs.
+        """
+        return self._namespace_fingerprints
+
+    @property
+    def tab_fingerprints(self) -> dict[str, str]:
+        """
+        :return: Dict where key is a tab as ``namespace:tab`` (the first folder of the mc_path)
+        and value is the hash of the fingerprints of its advancements.
+        """
+        return self._tab_fingerprints
+
+    @property
+    def lint_report(self) -> "LintReport | None":
+        """
+        :return: LintReport with the issues found by the lint checks of the datapack during the load, None if the datapack is not linted.
+        """
+        return self._lint_report
+
+    def stats(self) -> "AdvancementStats":
+        """
+        :return: AdvancementStats column store of the advancements of the datapack, built on the first call.
+        """
+        if self._stats is None or self._stats.symbol_table is not self._datapack.symbol_table:
+            from .Stats import AdvancementStats
+            self._stats = AdvancementStats(self._advancements_list, self._datapack.symbol_table)
+        return self._stats
+
     @property
     def adv_list(self) -> list[Advancement | InvalidAdvancement | TechnicalAdvancement]:
         """
-        :return: A list of Advancement instances.
+        :return: A list of Advancement instances, sorted by mc_path.
         """
         return self._advancements_list
 
     @property
     def adv_dict(self) -> dict[Path, Advancement | InvalidAdvancement | TechnicalAdvancement]:
         """
-        :return: A dictionary of Advancement instances.
+        :return: A dictionary of Advancement instances, ordered by mc_path.
         """
         return self._advancements_dict
 
@@ -535,6 +799,103 @@ class AdvancementManager:
                 advancement_list.append(adv)
         return advancement_list
 
+    def _completion_index(self, field: str) -> PrefixIndex:
+        """
+        :param field: Attribute from ``constants.COMPLETION_FIELDS``.
+        :return: PrefixIndex of the advancements by the field, built on the first use.
+        :raises ValueError: If the field does not support completions.
+        """
+        if field not in COMPLETION_FIELDS:
+            raise ValueError(f"Completions are not supported for \"{field}\", possible fields: {COMPLETION_FIELDS}")
+
+        index = self._completion_indexes.get(field)
+        if index is None:
+            if field == "mc_path":
+                items = ((adv.mc_path, adv) for adv in self._advancements_list)
+            else:
+                items = ((getattr(adv, field), adv) for adv in self._advancements_list if isinstance(adv, Advancement))
+            index = self._completion_indexes[field] = PrefixIndex(items, casefold=field != "mc_path")
+        return index
+
+    @property
+    def mc_path_index(self) -> PrefixIndex:
+        """
+        :return: PrefixIndex of all advancements by mc_path, built on the first use.
+        """
+        return self._completion_index("mc_path")
+
+    def get(self, mc_path: str) -> Advancement | InvalidAdvancement | TechnicalAdvancement | None:
+        """
+        :param mc_path: Minecraft path of the advancement, e.g. ``blazeandcave:mining/stone_age``.
+        :return: Advancement with the mc_path, or None if it does not exist.
+        """
+        found = self.mc_path_index.get(mc_path)
+        return found[0] if found else None
+
+    def prefix(self, prefix: str) -> Iterator[Advancement | InvalidAdvancement | TechnicalAdvancement]:
+        """
+        Returns advancements whose mc_path starts with the prefix using binary search in O(log n + k),
+        e.g. ``blazeandcave:mining/`` for all advancements of a folder and its sub-folders.
+        :param prefix: Start of the mc_path, case-sensitive.
+        :return: Iterator of the advancements, sorted by mc_path.
+        """
+        return (adv for _, adv in self.mc_path_index.prefix(prefix))
+
+    def range(self, lo: str | None = None, hi: str | None = None) -> Iterator[Advancement | InvalidAdvancement | TechnicalAdvancement]:
+        """
+        Returns advancements with ``lo <= mc_path < hi`` using binary search in O(log n + k).
+        :param lo: Inclusive lower bound of the mc_path, None if not bounded.
+        :param hi: Exclusive upper bound of the mc_path, None if not bounded.
+        :return: Iterator of the advancements, sorted by mc_path.
+        """
+        return (adv for _, adv in self.mc_path_index.range(lo, hi))
+
+    def __iter__(self) -> Iterator[Advancement | InvalidAdvancement | TechnicalAdvancement]:
+        return iter(self._advancements_list)
+
+    def iter_completions(self, prefix: str, field: str = "mc_path", tab: str | None = None, adv_type: AdvType | str | None = None,
+                         skip_invalid: bool = True, skip_technical: bool = True) -> Iterator[tuple[str, Advancement | InvalidAdvancement | TechnicalAdvancement]]:
+        """
+        Returns Iterator of completions for the prefix in alphabetical order, see ``complete``.
+        """
+        type_name = adv_type.name if isinstance(adv_type, AdvType) else adv_type
+        for _, adv in self._completion_index(field).prefix(prefix):
+            if not self.__advancement_type_skip_check(adv, skip_invalid, skip_technical, False):
+                continue
+            if tab is not None and getattr(adv, "tab", None) != tab:
+                continue
+            if type_name is not None and (not isinstance(adv, Advancement) or adv.type.name != type_name):
+                continue
+            yield getattr(adv, field), adv
+
+    def complete(self, prefix: str, limit: int | None = 10, field: str = "mc_path", tab: str | None = None, adv_type: AdvType | str | None = None,
+                 skip_invalid: bool = True, skip_technical: bool = True) -> list[tuple[str, Advancement | InvalidAdvancement | TechnicalAdvancement]]:
+        """
+        Returns completions of the prefix using a sorted index with binary search, e.g. for command autocompletion.
+        :param prefix: Start of the mc_path (case-sensitive) or title (case-insensitive).
+        :param limit: Maximum number of completions, None if no limit.
+        :param field: Attribute to complete, one of ``constants.COMPLETION_FIELDS``.
+        :param tab: Return only advancements of this tab.
+        :param adv_type: Return only advancements of this AdvType (instance or name).
+        :param skip_invalid: Skip invalid Advancement if True.
+        :param skip_technical: Skip technical Advancement if True.
+        :return: A list of (completed value, advancement) tuples in alphabetical order.
+        :raises ValueError: If the field does not support completions.
+        """
+        return list(islice(self.iter_completions(prefix, field, tab, adv_type, skip_invalid, skip_technical), limit))
+
+    def diff(self, other: "AdvancementManager") -> "DiffReport":
+        """
+        Compares advancements of this (old) and other (new) manager, matched by mc_path.
+        Advancements with equal fingerprints are skipped without comparing their fields.
+        :param other: AdvancementManager of the new version of the datapack.
+        :return: DiffReport with added, removed and changed advancements.
+        """
+        from .Diff import DiffReport, diff_advancements
+        if self._fingerprint == other.fingerprint:
+            return DiffReport()
+        return DiffReport(diff_advancements(self._datapack.name, self._advancements_list, other.adv_list))
+
     @property
     def datapack(self) -> Datapack:
         """
@@ -548,34 +909,78 @@ class AdvancementManager:
         :param path_to_adv: Path to the advancement file.
         :return: True if the advancement path is relative to technical paths, else False.
         """
-        return any(path_to_adv.is_relative_to(t_p) for t_p in self._technical_tabs_paths)
+        parts = trim_path_to_namespace(path_to_adv, self._datapack.namespaces).parts
+        return len(parts) > 3 and parts[1] == "advancement" and parts[2] in self._technical_tabs
+
+
+class _AdvancementEntry:
+    """
+    Advancement file found by ``_AdvancementFactory.walk``, classified from the components of its resource path.
+    """
+    __slots__ = ("path", "namespace", "mc_path", "folder", "technical")
+
+    def __init__(self, resource: str, path: str, technical_tabs: frozenset[str]):
+        """
+        :param resource: Resource path of the file, e.g. ``blazeandcave/advancement/mining/stone_age.json``.
+        :param path: Path to the file in the winning layer.
+        :param technical_tabs: Names of the technical tabs of the datapack.
+        """
+        namespace, _, relative_path = resource.split("/", 2)
+        relative_path = relative_path.rsplit(".", 1)[0]
+        self.path = Path(path)
+        self.namespace = namespace
+        self.mc_path = f"{namespace}:{relative_path}"
+        # First folder inside advancement/, None for files directly in it
+        self.folder = relative_path.split("/", 1)[0] if "/" in relative_path else None
+        self.technical = self.folder in technical_tabs
 
 
 class _AdvancementFactory:
+    @staticmethod
+    def walk(data_index: DataIndex, technical_tabs: frozenset[str]) -> Iterable[_AdvancementEntry]:
+        for resource, path in data_index.iter_advancements():
+            yield _AdvancementEntry(resource, path, technical_tabs)
+
     @classmethod
-    def load_advancement(cls, path: Path, advancement_manager: AdvancementManager) -> Advancement | TechnicalAdvancement | InvalidAdvancement:
-        adv_json: ExtendedDict = safe_load_json_file(path)
+    def load_advancement(cls, entry: _AdvancementEntry, advancement_manager: AdvancementManager) -> Advancement | TechnicalAdvancement | InvalidAdvancement:
+        path = entry.path
+        adv_json: ExtendedDict = cls._load_json(path, advancement_manager.datapack.symbol_table.content)
 
         if cls._is_not_parsable_json(adv_json):
-            return InvalidAdvancement(path=path, adv_json=adv_json, reason=JSONParsingError(), datapack=advancement_manager.datapack)
-
-        if advancement_manager.is_technical_advancement(path):
-            return TechnicalAdvancement(path, advancement_manager.datapack, adv_json)
-
-        if cls._is_invalid_reward(adv_json):
-            return InvalidAdvancement(path=path, adv_json=adv_json, reason=InvalidRewardFunction(), datapack=advancement_manager.datapack)
+            return InvalidAdvancement(path=path, adv_json=adv_json, reason=JSONParsingError(), datapack=advancement_manager.datapack, mc_path=entry.mc_path)
+
+        if advancement_manager.datapack.strict:
+            return cls._create_advancement(entry, adv_json, advancement_manager)
+
+        try:
+            return cls._create_advancement(entry, adv_json, advancement_manager)
+        except (NoTypesMatch, MultipleTypesMatch) as e:
+            reason = UnrecognizedType(e)
+        except AdvancementException as e:
+            reason = e
+        except Exception as e:
+            # A single unexpected file must not abort loading of the datapack in non-strict mode
+            reason = MalformedAdvancement(e)
+        return InvalidAdvancement(path=path, adv_json=adv_json, reason=reason, datapack=advancement_manager.datapack, mc_path=entry.mc_path)
 
-        reward_mcpath = adv_json["rewards"]["function"]
+    @classmethod
+    def _create_advancement(cls, entry: _AdvancementEntry, adv_json: ExtendedDict,
+                            advancement_manager: AdvancementManager) -> Advancement | TechnicalAdvancement | InvalidAdvancement:
+        path = entry.path
+        if entry.technical:
+            return TechnicalAdvancement(path, advancement_manager.datapack, adv_json, entry.mc_path)
 
-        if cls._has_no_title(adv_json):
-            return InvalidAdvancement(path=path, adv_json=adv_json, reason=MissingTitleField(), datapack=advancement_manager.datapack)
+        record = cls._extract(path, adv_json, advancement_manager.datapack.schema)
+        if isinstance(record, Exception):
+            reason = record if isinstance(record, AdvancementException) else MalformedAdvancement(record)
+            return InvalidAdvancement(path=path, adv_json=adv_json, reason=reason, datapack=advancement_manager.datapack, mc_path=entry.mc_path)
 
-        if cls._has_no_description(adv_json):
-            return InvalidAdvancement(path=path, adv_json=adv_json, reason=MissingDescriptionField(), datapack=advancement_manager.datapack)
+        # Function ids without a namespace are in the minecraft namespace
+        reward_mcpath = normalize_id(record["reward_function"])
 
         tab: str = cls._get_tab(reward_mcpath)
-        color_data = adv_json["display"]["description"].get("color")
-        frame_data = adv_json["display"].get("frame")
+        color_data = record["description_color"]
+        frame_data = record["frame"]
 
         if frame_data:
             frame: str = frame_data
@@ -590,36 +995,57 @@ class _AdvancementFactory:
             color: Color = DEFAULT_MINECRAFT_DESCRIPTION_COLOR
 
 
-        hidden: bool = adv_json["display"].get("hidden", False)
+        hidden: bool = record["hidden"]
+
+        adv_type: AdvType = cls._recognize_type(path, advancement_manager, frame, color, tab)
 
-        adv_type: AdvType = advancement_manager.datapack.adv_type_manager.recognize_type(frame=frame, color=color, tab=tab)
+        return Advancement(path, adv_json, advancement_manager.datapack, reward_mcpath, tab, color, frame, adv_type, hidden, record, entry.mc_path)
 
-        return Advancement(path, adv_json, advancement_manager.datapack, reward_mcpath, tab, color, frame, adv_type, hidden)
+    @staticmethod
+    def _load_json(path: Path, content: ContentCache) -> ExtendedDict | None:
+        return content.load_json(path)
+
+    @staticmethod
+    def _extract(path: Path, adv_json: ExtendedDict, schema: AdvancementSchema) -> AdvancementRecord | Exception:
+        """
+        :return: AdvancementRecord with the fields of the schema, or the reason why the advancement is invalid.
+        """
+        return schema.extract(adv_json)
+
+    @staticmethod
+    def _recognize_type(path: Path, advancement_manager: AdvancementManager, frame: str, color: Color, tab: str) -> AdvType:
+        return advancement_manager.datapack.adv_type_manager.recognize_type(frame=frame, color=color, tab=tab)
 
     @staticmethod
     def _get_tab(reward_mcpath: str) -> str:
-        return reward_mcpath.split(":", 1)[1].split("/", 1)[0]
+        return cut_namespace(reward_mcpath).split("/", 1)[0]
 
     @staticmethod
     def _is_not_parsable_json(advancement_json: ExtendedDict) -> bool:
         return advancement_json is None
 
+
+class _ProfiledAdvancementFactory(_AdvancementFactory):
+    """
+    Advancement factory that reports the duration of every loading stage to the active LoadObserver.
+    """
+
+    @staticmethod
+    def walk(data_index: DataIndex, technical_tabs: frozenset[str]) -> Iterable[_AdvancementEntry]:
+        return timed("walk", None, lambda: list(_AdvancementFactory.walk(data_index, technical_tabs)))
+
+    @classmethod
+    def load_advancement(cls, entry: _AdvancementEntry, advancement_manager: AdvancementManager) -> Advancement | TechnicalAdvancement | InvalidAdvancement:
+        return timed("advancement", entry.path, super().load_advancement, entry, advancement_manager)
+
     @staticmethod
-    def _has_no_title(advancement_json: ExtendedDict) -> bool:
-        required_keys = (
-            ("display", "title", "translate"),
-            ("display", "title", "text")
-        )
-        return not any(advancement_json.can_access_keypath(keys) for keys in required_keys)
+    def _load_json(path: Path, content: ContentCache) -> ExtendedDict | None:
+        return timed("json_decode", path, _AdvancementFactory._load_json, path, content)
 
     @staticmethod
-    def _has_no_description(advancement_json: ExtendedDict) -> bool:
-        required_keys = (
-            ("display", "description", "translate"),
-            ("display", "description", "text")
-        )
-        return not any(advancement_json.can_access_keypath(keys) for keys in required_keys)
+    def _extract(path: Path, adv_json: ExtendedDict, schema: AdvancementSchema) -> AdvancementRecord | Exception:
+        return timed("validation", path, _AdvancementFactory._extract, path, adv_json, schema)
 
     @staticmethod
-    def _is_invalid_reward(advancement_json: ExtendedDict) -> bool:
-        return not advancement_json.can_access_keypath(("rewards", "function"))
+    def _recognize_type(path: Path, advancement_manager: AdvancementManager, frame: str, color: Color, tab: str) -> AdvType:
+        return timed("type_recognition", path, _AdvancementFactory._recognize_type, path, advancement_manager, frame, color, tab)
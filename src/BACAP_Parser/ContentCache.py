@@ -0,0 +1,150 @@
+import copy
+import hashlib
+import threading
+import weakref
+from collections.abc import Callable, Hashable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .ExtendedDict import FrozenDict
+from .utils import safe_load_json_string
+
+if TYPE_CHECKING:
+    from .Rewards import DefaultReward
+    from .SymbolTable import SymbolTable
+
+
+class ContentCache:
+    """
+    Parsed advancement and reward files shared between the datapacks loaded with the same SymbolTable.
+
+    Sibling datapacks (e.g. bacaped and bacaped_hardcore) contain mostly identical files. Files are identified by
+    a hash of their bytes, the first datapack parses them, and the next ones reuse the parsed JSON and the values
+    derived from it (criteria, icon), so loading a sibling datapack costs mostly reading and hashing.
+    Rewards are shallow copies of the first parsed reward with their own path and mcpath, so parsed items are shared.
+
+    Shared JSON is a read-only FrozenDict and criteria are a FrozenCriteriaList, so changes of one advancement
+    cannot leak to the others. Entries are held weakly and disappear with the last advancement that uses them,
+    e.g. after the datapacks are reloaded or removed.
+
+    The cache is safe to use from several threads (e.g. ``discover_datapacks``): lookups and insertions are locked,
+    and shared JSON is interned into the symbol table before it is published, so it is not changed while other threads read it.
+    """
+
+    def __init__(self, symbol_table: "SymbolTable | None" = None):
+        """
+        :param symbol_table: SymbolTable that interns the strings of the shared JSON, if None, the JSON is not interned.
+        """
+        self._symbol_table = symbol_table
+        self._lock = threading.RLock()
+        self._json: weakref.WeakValueDictionary[bytes, FrozenDict] = weakref.WeakValueDictionary()
+        # id of a shared JSON object -> values derived from it, removed when the JSON is freed
+        self._derived: dict[int, dict[Hashable, Any]] = {}
+        self._rewards: weakref.WeakValueDictionary[tuple[type, bytes], "DefaultReward"] = weakref.WeakValueDictionary()
+        self._lookups = 0
+        self._hits = 0
+
+    @staticmethod
+    def __digest(data: bytes) -> bytes:
+        return hashlib.blake2b(data, digest_size=16).digest()
+
+    def load_json(self, path: Path) -> FrozenDict | None:
+        """
+        :param path: Path to a JSON file.
+        :return: Parsed read-only JSON, the same object for files with equal bytes, None if the file is not valid JSON.
+        """
+        data = path.read_bytes()
+        digest = self.__digest(data)
+        with self._lock:
+            self._lookups += 1
+            adv_json = self._json.get(digest)
+            if adv_json is not None:
+                self._hits += 1
+                return adv_json
+
+            adv_json = safe_load_json_string(data.decode("utf-8"), FrozenDict)
+            if not isinstance(adv_json, FrozenDict):
+                # Invalid JSON or not an object, it is not shared
+                return adv_json
+            if self._symbol_table is not None:
+                self._symbol_table.intern_values(adv_json)
+            self._json[digest] = adv_json
+            self._derived[id(adv_json)] = {}
+            weakref.finalize(adv_json, self._derived.pop, id(adv_json), None)
+            return adv_json
+
+    def owns(self, source: Any) -> bool:
+        """
+        :param source: Parsed JSON.
+        :return: True if the JSON was returned by ``load_json`` of this cache, so its strings are already interned.
+        """
+        return id(source) in self._derived
+
+    def derived[T](self, source: Any, key: Hashable, factory: Callable[[], T]) -> T:
+        """
+        :param source: JSON returned by ``load_json``.
+        :param key: Name of the derived value.
+        :param factory: Function that computes the value from the source.
+        :return: Value computed once for the shared source, or a new value if the source is not shared.
+        """
+        with self._lock:
+            values = self._derived.get(id(source))
+            if values is None:
+                return factory()
+            if key not in values:
+                values[key] = factory()
+            return values[key]
+
+    def reward[T: "DefaultReward"](self, cls: type[T], path: Path, mcpath: str) -> T:
+        """
+        :param cls: Reward class, e.g. ``Datapack.exp_class``.
+        :param path: Path to the reward function.
+        :param mcpath: Minecraft path of the reward.
+        :return: Reward instance, parsed once for every class and file content.
+        :raises ValueError: If the reward file is invalid, see the reward class.
+        """
+        key = (cls, self.__digest(path.read_bytes()))
+        with self._lock:
+            self._lookups += 1
+            shared = self._rewards.get(key)
+            if shared is None:
+                reward = self._rewards[key] = cls(path, mcpath)
+                return reward
+
+            self._hits += 1
+            reward = copy.copy(shared)
+            reward._path = path
+            reward._mcpath = mcpath
+            # The entry follows the latest copy, so it outlives the datapack that parsed the file when that one is reloaded
+            self._rewards[key] = reward
+            return reward
+
+    def clear(self):
+        """
+        Forgets the shared content, e.g. after all datapacks are loaded. Loaded advancements keep their values.
+        Entries of advancements that are freed are forgotten without it.
+        """
+        with self._lock:
+            self._json.clear()
+            self._derived.clear()
+            self._rewards.clear()
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """
+        :return: Dict with the number of unique JSON and reward files, total lookups and lookups of already parsed files.
+        """
+        return {"json": len(self._json), "rewards": len(self._rewards), "lookups": self._lookups, "hits": self._hits}
+
+    def __getstate__(self):
+        # Derived values are keyed by object ids, which do not survive pickling, and locks cannot be pickled
+        return {"_symbol_table": self._symbol_table}
+
+    def __setstate__(self, state):
+        self.__init__(state.get("_symbol_table"))
+
+    def __len__(self) -> int:
+        return len(self._json) + len(self._rewards)
+
+    def __repr__(self):
+        return f"ContentCache(json: {len(self._json)}, rewards: {len(self._rewards)})"
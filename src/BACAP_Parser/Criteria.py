@@ -29,6 +29,15 @@ class Criteria:
     def conditions(self) -> dict | None:
         return self._conditions
 
+    def _intern_strings(self, symbol_table):
+        """
+        Replaces strings of the criteria with the instances stored in the symbol table.
+        :param symbol_table: SymbolTable instance.
+        """
+        self._name = symbol_table.intern(self._name)
+        self._trigger = symbol_table.intern(self._trigger)
+        symbol_table.intern_values(self._conditions)
+
     def __repr__(self):
         return f"<Criteria name={self._name}, trigger={self._trigger}"
 
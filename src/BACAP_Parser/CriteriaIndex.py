@@ -0,0 +1,118 @@
+from collections.abc import Iterable, Iterator
+
+from .Advancement import BaseAdvancement
+from .constants import CRITERIA_ID_KEYS
+from .patterns import plain_id_pattern, resource_location_pattern
+from .utils import normalize_id
+
+
+def _collect_ids(conditions, ids: set[str], id_key: bool = False):
+    if isinstance(conditions, dict):
+        for key, value in conditions.items():
+            if isinstance(key, str) and resource_location_pattern.match(key):
+                ids.add(key)
+            _collect_ids(value, ids, key in CRITERIA_ID_KEYS)
+    elif isinstance(conditions, list):
+        for value in conditions:
+            _collect_ids(value, ids, id_key)
+    elif isinstance(conditions, str):
+        if resource_location_pattern.match(conditions):
+            ids.add(conditions)
+        elif id_key and plain_id_pattern.match(conditions):
+            ids.add(normalize_id(conditions))
+
+
+class CriteriaIndex:
+    """
+    Inverted index from criteria triggers, criteria names and item/entity/block ids found in criteria conditions
+    to the advancements that own these criteria.
+    Triggers and ids are stored with the ``minecraft`` namespace if they do not have one.
+    """
+
+    def __init__(self, advancements: Iterable[BaseAdvancement] = ()):
+        """
+        :param advancements: Advancements to index.
+        """
+        self._triggers: dict[str, dict[BaseAdvancement, None]] = {}
+        self._names: dict[str, dict[BaseAdvancement, None]] = {}
+        self._ids: dict[str, dict[BaseAdvancement, None]] = {}
+        self.add(advancements)
+
+    @staticmethod
+    def __keys(advancement: BaseAdvancement) -> tuple[set[str], set[str], set[str]]:
+        triggers, names, ids = set(), set(), set()
+        for criteria in advancement.criteria_list:
+            triggers.add(normalize_id(criteria.trigger))
+            names.add(criteria.name)
+            _collect_ids(criteria.conditions, ids)
+        return triggers, names, ids
+
+    def add(self, advancements: Iterable[BaseAdvancement]):
+        """
+        Adds advancements to the index.
+        :param advancements: Iterable object with advancements.
+        """
+        for advancement in advancements:
+            for index, keys in zip((self._triggers, self._names, self._ids), self.__keys(advancement)):
+                for key in keys:
+                    index.setdefault(key, {})[advancement] = None
+
+    def remove(self, advancements: Iterable[BaseAdvancement]):
+        """
+        Removes advancements from the index.
+        :param advancements: Iterable object with advancements.
+        """
+        for advancement in advancements:
+            for index, keys in zip((self._triggers, self._names, self._ids), self.__keys(advancement)):
+                for key in keys:
+                    owners = index.get(key)
+                    if owners is None:
+                        continue
+                    owners.pop(advancement, None)
+                    if not owners:
+                        del index[key]
+
+    def by_trigger(self, trigger: str) -> list[BaseAdvancement]:
+        """
+        :param trigger: Criteria trigger, e.g. ``minecraft:inventory_changed`` or ``inventory_changed``.
+        :return: A list of advancements that have at least one criteria with this trigger.
+        """
+        return list(self._triggers.get(normalize_id(trigger), ()))
+
+    def by_criteria_name(self, name: str) -> list[BaseAdvancement]:
+        """
+        :param name: Name of the criteria.
+        :return: A list of advancements that have a criteria with this name.
+        """
+        return list(self._names.get(name, ()))
+
+    def by_condition_id(self, id_: str) -> list[BaseAdvancement]:
+        """
+        :param id_: Item, entity, block (or any other) id or tag, e.g. ``minecraft:diamond``, ``zombie`` or ``#minecraft:logs``.
+        :return: A list of advancements that reference this id in the criteria conditions.
+        """
+        return list(self._ids.get(normalize_id(id_), ()))
+
+    @property
+    def triggers(self) -> Iterator[str]:
+        """
+        :return: Iterator over all indexed triggers.
+        """
+        return iter(self._triggers)
+
+    @property
+    def criteria_names(self) -> Iterator[str]:
+        """
+        :return: Iterator over all indexed criteria names.
+        """
+        return iter(self._names)
+
+    @property
+    def condition_ids(self) -> Iterator[str]:
+        """
+        :return: Iterator over all indexed ids from the criteria conditions.
+        """
+        return iter(self._ids)
+
+    def __repr__(self):
+        return f"CriteriaIndex(triggers: {len(self._triggers)}, names: {len(self._names)}, ids: {len(self._ids)})"
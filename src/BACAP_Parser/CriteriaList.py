@@ -1,15 +1,26 @@
+import copy
 from collections.abc import Callable, Iterable
-from typing import Union
+from itertools import chain
+from typing import SupportsIndex, Union
 
 from .Criteria import Criteria
 
 
 class CriteriaList(list):
+    """
+    List of Criteria with a hash index by (name, trigger) pair,
+    so membership checks and set-like operations do not scan the list.
+    """
+
     def __init__(self, adv_criteria: Union[dict, Criteria, list, "CriteriaList", None] = None, *args, **kwargs):
         """
         :param adv_criteria: dict with parsed criteria JSON, list of Criteria, CriteriaList, single Criteria or None
         """
         super().__init__(*args, **kwargs)
+        self._keys: dict[tuple[str, str], int] = {}
+        self._names: dict[str, int] = {}
+        self.__index(self)
+
         if adv_criteria is None:
             return
 
@@ -31,6 +42,35 @@ class CriteriaList(list):
         else:
             raise TypeError("Argument must be a dict, Criteria object, or a list of Criteria objects")
 
+    def __index(self, criteria_list: Iterable[Criteria]):
+        for criteria in criteria_list:
+            key = (criteria.name, criteria.trigger)
+            self._keys[key] = self._keys.get(key, 0) + 1
+            self._names[criteria.name] = self._names.get(criteria.name, 0) + 1
+
+    def __unindex(self, criteria_list: Iterable[Criteria]):
+        for criteria in criteria_list:
+            key = (criteria.name, criteria.trigger)
+            if self._keys[key] == 1:
+                del self._keys[key]
+            else:
+                self._keys[key] -= 1
+
+            if self._names[criteria.name] == 1:
+                del self._names[criteria.name]
+            else:
+                self._names[criteria.name] -= 1
+
+    @staticmethod
+    def __check_type(criteria_list: Iterable) -> list[Criteria]:
+        criteria_list = list(criteria_list)
+        if not all(isinstance(criteria, Criteria) for criteria in criteria_list):
+            raise TypeError("All elements must be instances of the Criteria class")
+        return criteria_list
+
+    def __reduce__(self):
+        return self.__class__, (list(self),)
+
     def is_all_impossible(self) -> bool:
         """
         :return: True if all criteria are impossible, False otherwise
@@ -42,21 +82,60 @@ class CriteriaList(list):
 
     def append(self, criteria: Criteria):
         if not isinstance(criteria, Criteria):
-            return TypeError("Element must be an instance of the Criteria class")
+            raise TypeError("Element must be an instance of the Criteria class")
         super().append(criteria)
+        self.__index((criteria,))
 
     def __str__(self):
         return super().__str__()
 
     def extend(self, criteria_list: Union["CriteriaList", Iterable[Criteria]]):
-        if not all(isinstance(criteria, Criteria) for criteria in criteria_list):
-            raise TypeError("All elements must be instances of the Criteria class")
+        criteria_list = self.__check_type(criteria_list)
         super().extend(criteria_list)
+        self.__index(criteria_list)
+
+    def __iadd__(self, criteria_list: Union["CriteriaList", Iterable[Criteria]]) -> "CriteriaList":
+        self.extend(criteria_list)
+        return self
+
+    def __imul__(self, value: SupportsIndex) -> "CriteriaList":
+        super().__imul__(value)
+        self._keys.clear()
+        self._names.clear()
+        self.__index(self)
+        return self
 
     def insert(self, __index, __object):
         if not isinstance(__object, Criteria):
-            return TypeError("Element must be an instance of the Criteria class")
+            raise TypeError("Element must be an instance of the Criteria class")
         super().insert(__index, __object)
+        self.__index((__object,))
+
+    def __setitem__(self, index: SupportsIndex | slice, value: Criteria | Iterable[Criteria]):
+        if isinstance(index, slice):
+            new = value = self.__check_type(value)
+            old = super().__getitem__(index)
+        else:
+            new = self.__check_type((value,))
+            old = (super().__getitem__(index),)
+        super().__setitem__(index, value)
+        self.__unindex(old)
+        self.__index(new)
+
+    def __delitem__(self, index: SupportsIndex | slice):
+        old = super().__getitem__(index)
+        super().__delitem__(index)
+        self.__unindex(old if isinstance(index, slice) else (old,))
+
+    def pop(self, index: SupportsIndex = -1) -> Criteria:
+        criteria = super().pop(index)
+        self.__unindex((criteria,))
+        return criteria
+
+    def clear(self):
+        super().clear()
+        self._keys.clear()
+        self._names.clear()
 
     def sort(self, *, key: Callable = None, reverse: bool = False):
         if key is None:
@@ -70,20 +149,34 @@ class CriteriaList(list):
         """
         if isinstance(criteria, Criteria):
             return super().count(criteria)
-        return sum(crt.name == criteria for crt in self)
+        return self._names.get(criteria, 0)
 
     def remove(self, criteria: Criteria | str, **kwargs):
         """
+        Removes all matching criteria in a single pass, does nothing if there are no matches.
         :param criteria: Criteria to remove (will check both trigger and name string equation), or criteria name
         """
         if isinstance(criteria, Criteria):
-            for crit in self:
-                if criteria.name == crit.name and criteria.trigger == crit.trigger:
-                    self.remove(criteria)
+            key = (criteria.name, criteria.trigger)
+            if key not in self._keys:
+                return
+            self[:] = [crit for crit in self if (crit.name, crit.trigger) != key]
         else:
-            for criteria in self:
-                if criteria.name == criteria:
-                    self.remove(criteria)
+            if criteria not in self._names:
+                return
+            self[:] = [crit for crit in self if crit.name != criteria]
+
+    def by_trigger(self) -> dict[str, "CriteriaList"]:
+        """
+        :return: Dict where key is a trigger and value is a CriteriaList with criteria of this trigger, in the list order.
+        """
+        groups: dict[str, CriteriaList] = {}
+        for criteria in self:
+            group = groups.get(criteria.trigger)
+            if group is None:
+                group = groups[criteria.trigger] = CriteriaList()
+            group.append(criteria)
+        return groups
 
     def __eq__(self, other: "CriteriaList") -> bool:
         if not isinstance(other, CriteriaList):
@@ -97,7 +190,7 @@ class CriteriaList(list):
         """
         if not isinstance(criteria, Criteria):
             raise TypeError("Element must be an instance of the Criteria class")
-        return any(crt.name == criteria.name and crt.trigger == criteria.trigger for crt in self)
+        return (criteria.name, criteria.trigger) in self._keys
 
     def __ne__(self, other: "CriteriaList") -> bool:
         return super().__ne__(other)
@@ -107,7 +200,7 @@ class CriteriaList(list):
         :param other: Other CriteriaList
         :return: New CriteriaList that contains both lists
         """
-        if not isinstance(other, self.__class__):
+        if not isinstance(other, CriteriaList):
             raise TypeError("Element must be an instance of the CriteriaList class")
         new_list = CriteriaList(self)
         new_list.extend(other)
@@ -116,36 +209,58 @@ class CriteriaList(list):
     def __or__(self, other: "CriteriaList") -> "CriteriaList":
         """
         :param other: Other CriteriaList
-        :return: New CriteriaList that contains elements from both lists
+        :return: New CriteriaList that contains elements from both lists without duplicates (by name and trigger)
         """
-        if not isinstance(other, self.__class__):
+        if not isinstance(other, CriteriaList):
             raise TypeError("Element must be an instance of the CriteriaList class")
-        return self + other
+        new_list = CriteriaList()
+        for crit in chain(self, other):
+            if (crit.name, crit.trigger) not in new_list._keys:
+                new_list.append(crit)
+        return new_list
 
     def __and__(self, other):
         """
         :param other: Other CriteriaList
         :return: New CriteriaList that contains elements that are in both lists
         """
-        if not isinstance(other, self.__class__):
+        if not isinstance(other, CriteriaList):
             raise TypeError("Other element must be an instance of the CriteriaList class")
-        new_list = CriteriaList()
-        for crit in self:
-            if crit in self and crit in other:
-                new_list.append(crit)
-        return new_list
+        return CriteriaList([crit for crit in self if (crit.name, crit.trigger) in other._keys])
 
     def __xor__(self, other: "CriteriaList"):
-        if not isinstance(other, self.__class__):
+        """
+        :param other: Other CriteriaList
+        :return: New CriteriaList that contains elements that are only in one of the lists
+        """
+        if not isinstance(other, CriteriaList):
             raise TypeError("Other element must be an instance of the CriteriaList class")
-        new_list = CriteriaList()
+        return CriteriaList([crit for crit in self if (crit.name, crit.trigger) not in other._keys] +
+                            [crit for crit in other if (crit.name, crit.trigger) not in self._keys])
 
-        for crit in self:
-            if crit not in other:
-                new_list.append(crit)
 
-        for crit in other:
-            if crit not in self:
-                new_list.append(crit)
+def _read_only(self, *args, **kwargs):
+    raise TypeError(f"{type(self).__name__} is read-only, copy it with CriteriaList(...) to modify it")
+
+
+class FrozenCriteriaList(CriteriaList):
+    """
+    Read-only CriteriaList that is shared between advancements with identical JSON, see ``ContentCache``.
+    Set-like operations and ``copy.deepcopy`` return new, mutable CriteriaList instances.
+    """
+
+    def __init__(self, adv_criteria: Union[dict, Criteria, list, CriteriaList, None] = None):
+        """
+        :param adv_criteria: dict with parsed criteria JSON, list of Criteria, CriteriaList, single Criteria or None
+        """
+        # Filled through a mutable list, the mutators of this class raise
+        criteria_list = CriteriaList(adv_criteria)
+        list.__init__(self, criteria_list)
+        self._keys = criteria_list._keys
+        self._names = criteria_list._names
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
 
-        return new_list
\ No newline at end of file
+    def __deepcopy__(self, memo: dict) -> CriteriaList:
+        return CriteriaList(copy.deepcopy(list(self), memo))
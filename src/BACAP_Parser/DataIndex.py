@@ -0,0 +1,131 @@
+import os
+from collections.abc import Collection, Iterable, Iterator
+from pathlib import Path
+
+from .PrefixIndex import PrefixIndex
+
+
+class DataIndex:
+    """
+    Layered virtual file index of the ``data`` folders of a datapack: the base ``data`` folder and the ``data`` folders
+    of the applied overlays. Every layer is scanned once, and every resource path
+    (e.g. ``blazeandcave/advancement/mining/stone_age.json``) resolves to the file of the layer with the highest precedence,
+    so reads do not check the existence of the file in every layer.
+    """
+
+    def __init__(self, layers: Iterable[Path], include_namespaces: Collection[str] | None = None, include_folders: Collection[str] | None = None,
+                 exclude_folders: Collection[str] | None = None):
+        """
+        :param layers: Paths to the ``data`` folders, from the lowest to the highest precedence.
+        Layers that do not exist are skipped.
+        :param include_namespaces: Namespaces whose ``advancement`` folders are scanned, if None, all namespaces.
+        Other folders of the namespaces (e.g. functions) are always scanned.
+        :param include_folders: Folders inside ``advancement`` (tabs) that are scanned, if None, all folders.
+        Files directly in ``advancement`` are skipped if it is given.
+        :param exclude_folders: Folders inside ``advancement`` (tabs) that are not scanned.
+        """
+        self._layers = [layer for layer in layers if layer.is_dir()]
+        self._include_namespaces = include_namespaces
+        self._include_folders = include_folders
+        self._exclude_folders = exclude_folders
+        self._files: dict[str, str] = {}
+        self._advancements: dict[str, str] = {}
+        self._namespaces: dict[str, Path] = {}
+        self._sorted_files: PrefixIndex[str] | None = None
+
+        for layer in self._layers:
+            self.__scan(layer)
+
+    def __scan(self, layer: Path):
+        """
+        Walks the layer with ``os.scandir``, resource paths are built from the names of the entries without Path objects.
+        Symlinks to folders are not followed, excluded advancement folders are pruned without being listed.
+        """
+        # (folder, resource path of the folder, advancement level: 0 outside, 1 in <namespace>/advancement, 2 in its sub-folders)
+        stack = [(str(layer), "", 0)]
+        while stack:
+            folder, prefix, level = stack.pop()
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        if entry.is_symlink():
+                            continue
+                        child_level = level
+                        if not prefix:
+                            self._namespaces[entry.name] = layer / entry.name
+                        elif level == 0 and entry.name == "advancement" and prefix.count("/") == 1:
+                            if self._include_namespaces is not None and prefix[:-1] not in self._include_namespaces:
+                                continue
+                            child_level = 1
+                        elif level == 1:
+                            if not self.__includes_folder(entry.name):
+                                continue
+                            child_level = 2
+                        stack.append((entry.path, f"{prefix}{entry.name}/", child_level))
+                    elif prefix:
+                        is_advancement = level > 0 and entry.name.endswith(".json")
+                        if is_advancement and level == 1 and self._include_folders is not None:
+                            continue
+                        resource = prefix + entry.name
+                        self._files[resource] = entry.path
+                        if is_advancement:
+                            self._advancements[resource] = entry.path
+
+    def __includes_folder(self, folder: str) -> bool:
+        if self._include_folders is not None and folder not in self._include_folders:
+            return False
+        return self._exclude_folders is None or folder not in self._exclude_folders
+
+    @property
+    def layers(self) -> list[Path]:
+        """
+        :return: A list of existing ``data`` folders, from the lowest to the highest precedence.
+        """
+        return self._layers
+
+    @property
+    def namespaces(self) -> list[str]:
+        """
+        :return: A sorted list of namespace names from all layers.
+        """
+        return sorted(self._namespaces)
+
+    def namespace_path(self, namespace: str) -> Path | None:
+        """
+        :param namespace: Name of the namespace.
+        :return: Path to the namespace folder in the layer with the highest precedence that contains it, None if it does not exist.
+        """
+        return self._namespaces.get(namespace)
+
+    def resolve(self, resource: str) -> Path | None:
+        """
+        :param resource: Resource path relative to the ``data`` folder, e.g. ``bacap_rewards/function/exp/mining/stone_age.mcfunction``.
+        :return: Path to the file in the winning layer, None if no layer contains it.
+        """
+        path = self._files.get(resource)
+        return Path(path) if path is not None else None
+
+    def iter_prefix(self, prefix: str) -> Iterator[tuple[str, Path]]:
+        """
+        :param prefix: Start of the resource paths, e.g. ``blazeandcave/advancement/``.
+        :return: Iterator of (resource path, path to the file in the winning layer) pairs, sorted by resource path.
+        """
+        if self._sorted_files is None:
+            self._sorted_files = PrefixIndex(self._files.items())
+        return ((resource, Path(path)) for resource, path in self._sorted_files.prefix(prefix))
+
+    def iter_advancements(self) -> Iterator[tuple[str, str]]:
+        """
+        :return: Iterator of (resource path, path to the file in the winning layer) pairs of the ``.json`` files
+        in the ``advancement`` folders of all namespaces, collected during the scan, in no particular order.
+        """
+        return iter(self._advancements.items())
+
+    def __contains__(self, resource: str) -> bool:
+        return resource in self._files
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def __repr__(self):
+        return f"DataIndex(layers: {len(self._layers)}, files: {len(self._files)})"
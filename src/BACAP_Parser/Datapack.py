@@ -6,7 +6,12 @@ from .utils import to_collection
 from .AdvType import AdvTypeManager
 from .TabNameMapper import TabNameMapper
 from .Rewards import Exp, Reward, Trophy
+from .Schema import AdvancementSchema
+from .DataIndex import DataIndex
+from .LangIndex import LangIndex
 from .PackMCMeta import PackMCMeta
+from .Profiler import LoadObserver, active_observer, timed
+from .SymbolTable import SymbolTable
 
 class Datapack:
     """
@@ -14,7 +19,11 @@ class Datapack:
     """
     def __init__(self, name: str, path: Path, adv_type_manager: AdvTypeManager, reward_namespace: str | None = None,
                  technical_tabs: Iterable[str] | None = None, tab_name_mapper: TabNameMapper = TabNameMapper(),
-                 exp_class: Type[Exp] = Exp, reward_class: Type[Reward] = Reward, trophy_class: Type[Trophy] = Trophy):
+                 exp_class: Type[Exp] = Exp, reward_class: Type[Reward] = Reward, trophy_class: Type[Trophy] = Trophy,
+                 symbol_table: SymbolTable | None = None, observer: LoadObserver | None = None, pack_format: int | None = None,
+                 strict: bool = True, lint: Iterable["LintCheck"] | bool = False, lang_index: LangIndex | None = None,
+                 schema: AdvancementSchema | None = None, include_namespaces: Iterable[str] | None = None, include_tabs: Iterable[str] | None = None,
+                 exclude_tabs: Iterable[str] | None = None, skip_technical: bool = False):
         """
         :param name: Name of the datapack that will be used to identify it in Parser instance
         :param path: Path to the datapack folder, zip-files are not supported
@@ -30,11 +39,32 @@ class Datapack:
             The provided class must inherit from the base `Reward` class.
         :param trophy_class: Specifies the class to be used for parsing the trophy part of the achievement.
             The provided class must inherit from the base `Trophy` class.
+        :param symbol_table: SymbolTable instance used to intern repeated strings of the advancements.
+        Pass the same instance to several datapacks (e.g. ``parser.symbol_table``) to share strings between them,
+        if not specified, the datapack creates its own table.
+        :param observer: LoadObserver instance (e.g. ProfileCollector) that receives durations of the loading stages.
+        If None, loading is not measured.
+        :param pack_format: Pack format used to choose the applied overlays, all files are read through the layered DataIndex
+        of the base data folder and these overlays. If None, the highest format of the pack and its overlays is used.
+        :param strict: If False, advancements whose type cannot be recognized or whose JSON has an unexpected structure
+        are loaded as InvalidAdvancement instead of raising an exception.
+        :param lint: LintCheck instances to run during the load, True to run ``DEFAULT_LINT_CHECKS``, False to not lint.
+        The found issues are available in ``lint_report``.
+        :param lang_index: LangIndex used to translate titles and descriptions, see ``Advancement.title_text``.
+        :param schema: AdvancementSchema used to validate and extract the advancement JSON,
+        e.g. ``DEFAULT_ADVANCEMENT_SCHEMA.extend(...)`` with additional fields available in ``Advancement.record``.
+        If None, ``DEFAULT_ADVANCEMENT_SCHEMA`` is used.
+        :param include_namespaces: Load advancements only from these namespaces, if None, from all namespaces.
+        :param include_tabs: Load only advancements in these folders of the ``advancement`` folder (tabs), if None, all folders.
+        :param exclude_tabs: Do not load advancements in these folders of the ``advancement`` folder.
+        :param skip_technical: Do not load advancements in the technical tabs.
+        Excluded folders are pruned while the datapack is scanned, so their files are not read, and their rewards are not parsed.
+        They are also missing from ``data_index``.
         :raises NotImplementedError: If a zipped datapack path is given.
         :raises FileNotFoundError: If reward_namespace does not exist in the datapack namespaces.
-        :raises ValueError: If exp_class, reward_class, reward_class are not inherited from Exp, Reward, Trophy classes.
+        :raises ValueError: If exp_class, reward_class, reward_class are not inherited from Exp, Reward, Trophy classes,
+        or if the schema does not contain the fields of ``DEFAULT_ADVANCEMENT_SCHEMA``.
         """
-        from .Advancement import AdvancementManager
         self._name = name
 
         if path.suffix == '.zip':
@@ -42,18 +72,12 @@ class Datapack:
 
         self._path = path
 
-        technical_tabs = to_collection(technical_tabs, tuple)
-
-        self._pack_mcmeta = PackMCMeta(self._path)
+        self._technical_tabs = to_collection(technical_tabs, tuple) if technical_tabs is not None else ()
 
-        self._namespaces = [entry for entry in self._pack_mcmeta.data_path.iterdir() if entry.is_dir()]
-
-        if reward_namespace is not None:
-            if reward_namespace not in [entry.name for entry in self._namespaces]:
-                raise FileNotFoundError(f"Reward namespace \"{reward_namespace}\" does not exist, possible namespaces: {[entry.name for entry in self._namespaces]}")
-            self._reward_namespace_path = next(entry for entry in self._namespaces if entry.name == reward_namespace)
-        else:
-            self._reward_namespace_path = None
+        self._include_namespaces = to_collection(include_namespaces, frozenset) if include_namespaces is not None else None
+        self._include_tabs = to_collection(include_tabs, frozenset) if include_tabs is not None else None
+        self._exclude_tabs = to_collection(exclude_tabs, frozenset) if exclude_tabs is not None else frozenset()
+        self._skip_technical = skip_technical
 
         self._reward_namespace = reward_namespace
 
@@ -68,7 +92,77 @@ class Datapack:
 
         self._tab_name_mapper = tab_name_mapper
 
-        self._advancement_manager = AdvancementManager(datapack=self, technical_tabs=technical_tabs)
+        self._symbol_table = symbol_table if symbol_table is not None else SymbolTable()
+
+        self._observer = observer
+
+        self._pack_format = pack_format
+
+        self._strict = strict
+
+        self._lang_index = lang_index
+
+        from .Advancement import DEFAULT_ADVANCEMENT_SCHEMA
+        if schema is None:
+            schema = DEFAULT_ADVANCEMENT_SCHEMA
+        missing_fields = [name for name in DEFAULT_ADVANCEMENT_SCHEMA.field_names if name not in schema]
+        if missing_fields:
+            raise ValueError(f"Schema does not contain the required fields: {missing_fields}, extend DEFAULT_ADVANCEMENT_SCHEMA instead")
+        self._schema = schema
+
+        if lint is True:
+            from .Lint import DEFAULT_LINT_CHECKS
+            lint = DEFAULT_LINT_CHECKS
+        self._lint_checks = tuple(lint) if lint else ()
+
+        self.__load()
+
+    def __load(self):
+        if self._observer is None:
+            self.__load_layers()
+            return
+
+        token = active_observer.set(self._observer)
+        try:
+            self.__load_layers()
+        finally:
+            active_observer.reset(token)
+
+    def __load_layers(self):
+        from .Advancement import AdvancementManager
+
+        self._pack_mcmeta = PackMCMeta(self._path, self._pack_format)
+
+        exclude_folders = self._exclude_tabs | frozenset(self._technical_tabs) if self._skip_technical else self._exclude_tabs
+        if self._observer is None:
+            self._data_index = DataIndex(self._pack_mcmeta.data_paths, self._include_namespaces, self._include_tabs, exclude_folders)
+        else:
+            self._data_index = timed("index", self._path, DataIndex, self._pack_mcmeta.data_paths, self._include_namespaces, self._include_tabs, exclude_folders)
+
+        self._namespaces = [self._data_index.namespace_path(namespace) for namespace in self._data_index.namespaces]
+
+        if self._reward_namespace is not None:
+            if self._reward_namespace not in self._data_index.namespaces:
+                raise FileNotFoundError(f"Reward namespace \"{self._reward_namespace}\" does not exist, possible namespaces: {self._data_index.namespaces}")
+            self._reward_namespace_path = self._data_index.namespace_path(self._reward_namespace)
+        else:
+            self._reward_namespace_path = None
+
+        self._advancement_manager = AdvancementManager(datapack=self, technical_tabs=self._technical_tabs)
+
+    def reload(self):
+        """
+        Re-reads ``pack.mcmeta`` and all advancements of the datapack from the disk.
+        The new advancements replace the old ones only if loading succeeds.
+        Use ``Parser.reload`` for datapacks added to a Parser, so its indexes stay in sync.
+        :raises FileNotFoundError: If reward_namespace does not exist in the datapack namespaces anymore.
+        """
+        state = (self._pack_mcmeta, self._data_index, self._namespaces, self._reward_namespace_path, self._advancement_manager)
+        try:
+            self.__load()
+        except Exception:
+            self._pack_mcmeta, self._data_index, self._namespaces, self._reward_namespace_path, self._advancement_manager = state
+            raise
 
     @staticmethod
     def __check_inheritance(base_class: type, derived_class: type):
@@ -83,6 +177,12 @@ class Datapack:
         if not issubclass(derived_class, base_class):
             raise ValueError(f"`{derived_class.__name__}` must inherit from `{base_class.__name__}`.")
 
+    def __getstate__(self) -> dict:
+        # The observer only measures the load and may hold locks (e.g. ProfileCollector), it is not pickled
+        state = self.__dict__.copy()
+        state["_observer"] = None
+        return state
+
     def __repr__(self):
         return f"Datapack('{self._name}')"
 
@@ -114,6 +214,62 @@ class Datapack:
         """
         return self._advancement_manager
 
+    @property
+    def fingerprint(self) -> str:
+        """
+        :return: Content hash of all advancements of the datapack, see ``AdvancementManager.fingerprint``
+        """
+        return self._advancement_manager.fingerprint
+
+    @property
+    def namespace_fingerprints(self) -> dict[str, str]:
+        """
+        :return: Content hashes of the namespaces of the datapack, see ``AdvancementManager.namespace_fingerprints``
+        """
+        return self._advancement_manager.namespace_fingerprints
+
+    @property
+    def tab_fingerprints(self) -> dict[str, str]:
+        """
+        :return: Content hashes of the tabs of the datapack, see ``AdvancementManager.tab_fingerprints``
+        """
+        return self._advancement_manager.tab_fingerprints
+
+    @property
+    def technical_tabs(self) -> tuple[str, ...]:
+        """
+        :return: tabs with technical advancements
+        """
+        return self._technical_tabs
+
+    @property
+    def include_namespaces(self) -> frozenset[str] | None:
+        """
+        :return: Namespaces whose advancements are loaded, None if all namespaces are loaded.
+        """
+        return self._include_namespaces
+
+    @property
+    def include_tabs(self) -> frozenset[str] | None:
+        """
+        :return: Tabs (folders of the ``advancement`` folder) whose advancements are loaded, None if all tabs are loaded.
+        """
+        return self._include_tabs
+
+    @property
+    def exclude_tabs(self) -> frozenset[str]:
+        """
+        :return: Tabs (folders of the ``advancement`` folder) whose advancements are not loaded.
+        """
+        return self._exclude_tabs
+
+    @property
+    def skip_technical(self) -> bool:
+        """
+        :return: Whether advancements in the technical tabs are not loaded.
+        """
+        return self._skip_technical
+
     @property
     def reward_namespace(self):
         """
@@ -163,10 +319,97 @@ class Datapack:
         """
         return self._trophy_class
 
+    @property
+    def symbol_table(self) -> SymbolTable:
+        """
+        :return: SymbolTable instance that stores interned strings of the datapack
+        """
+        return self._symbol_table
+
+    def _adopt_symbol_table(self, symbol_table: SymbolTable):
+        """
+        Re-interns all strings of the datapack into another symbol table and uses it from now on.
+        :param symbol_table: SymbolTable instance
+        """
+        if symbol_table is self._symbol_table:
+            return
+        self._advancement_manager._intern_strings(symbol_table)
+        self._symbol_table = symbol_table
+
+    @property
+    def observer(self) -> LoadObserver | None:
+        """
+        :return: LoadObserver that receives durations of the loading stages, or None
+        """
+        return self._observer
+
+    @observer.setter
+    def observer(self, observer: LoadObserver | None):
+        """
+        :param observer: LoadObserver that will be used by the next ``reload``, or None to disable measuring.
+        """
+        self._observer = observer
+
     @property
     def pack_mcmeta(self):
         return self._pack_mcmeta
 
     @property
     def data_path(self) -> path:
-        return self._pack_mcmeta.data_path
\ No newline at end of file
+        return self._pack_mcmeta.data_path
+
+    @property
+    def lang_index(self) -> LangIndex | None:
+        """
+        :return: LangIndex used to translate titles and descriptions, or None
+        """
+        return self._lang_index
+
+    @lang_index.setter
+    def lang_index(self, lang_index: LangIndex | None):
+        """
+        :param lang_index: LangIndex used to translate titles and descriptions, or None to not translate them.
+        """
+        self._lang_index = lang_index
+
+    @property
+    def strict(self) -> bool:
+        """
+        :return: False if invalid advancements are loaded as InvalidAdvancement instead of raising an exception
+        """
+        return self._strict
+
+    @property
+    def schema(self) -> AdvancementSchema:
+        """
+        :return: AdvancementSchema used to validate and extract the advancement JSON
+        """
+        return self._schema
+
+    @property
+    def lint_checks(self) -> tuple["LintCheck", ...]:
+        """
+        :return: LintCheck instances that run during the load
+        """
+        return self._lint_checks
+
+    @property
+    def lint_report(self) -> "LintReport | None":
+        """
+        :return: LintReport with the issues found during the last load, None if the datapack is not linted
+        """
+        return self._advancement_manager.lint_report
+
+    @property
+    def data_index(self) -> DataIndex:
+        """
+        :return: DataIndex of the base data folder and the applied overlays, all files of the datapack are read through it
+        """
+        return self._data_index
+
+    @property
+    def pack_format(self) -> int:
+        """
+        :return: Pack format used to choose the applied overlays
+        """
+        return self._pack_mcmeta.target_pack_format
\ No newline at end of file
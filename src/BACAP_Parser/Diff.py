@@ -0,0 +1,257 @@
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from .Advancement import Advancement, BaseAdvancement, InvalidAdvancement
+from .constants import DIFF_FIELD_KINDS, DIFF_KINDS
+
+
+def _item_snapshot(item) -> dict[str, Any] | None:
+    if item is None:
+        return None
+    return {"id": item.id, "components": item.components or None}
+
+
+def _snapshot(adv: BaseAdvancement) -> dict[str, Any]:
+    """
+    :return: Comparable values of the parsed fields of the advancement.
+    """
+    snapshot: dict[str, Any] = {"class": type(adv).__name__, "parent": adv.parent}
+    if isinstance(adv, InvalidAdvancement):
+        snapshot["reason"] = str(adv.reason)
+
+    if isinstance(adv, Advancement):
+        snapshot.update({
+            "title": adv.title,
+            "description": adv.description,
+            "tab": adv.tab,
+            "frame": adv.frame,
+            "type": adv.type.name,
+            "color": adv.color.value if adv.color else None,
+            "hidden": adv.hidden,
+            "background": adv.background,
+            "icon": _item_snapshot(adv.icon),
+            "reward_mcpath": adv.reward_mcpath,
+            "exp": adv.exp.value if adv.exp else None,
+            "reward": {**_item_snapshot(adv.reward.item), "amount": adv.reward.item.amount} if adv.reward else None,
+            "trophy": {**_item_snapshot(adv.trophy.item), "name": adv.trophy.item.name,
+                       "description": adv.trophy.item.description} if adv.trophy else None,
+        })
+    return snapshot
+
+
+def _criteria_snapshot(adv: BaseAdvancement) -> dict[str, dict[str, Any]]:
+    return {criteria.name: {"trigger": criteria.trigger, "conditions": criteria.conditions} for criteria in adv.criteria_list}
+
+
+def compare_advancements(old: BaseAdvancement, new: BaseAdvancement) -> dict[str, tuple[Any, Any]]:
+    """
+    Compares parsed fields of two versions of an advancement.
+
+    :param old: Old version of the advancement.
+    :param new: New version of the advancement.
+    :return: Dict where key is a changed field and value is a tuple of (old value, new value).
+    Criteria are reported as ``criteria.<name>`` fields, the value of a missing criteria is None.
+    If only fields that are not parsed changed, the whole JSON is reported as the ``json`` field.
+    """
+    fields: dict[str, tuple[Any, Any]] = {}
+
+    old_snapshot, new_snapshot = _snapshot(old), _snapshot(new)
+    for field in old_snapshot.keys() | new_snapshot.keys():
+        old_value, new_value = old_snapshot.get(field), new_snapshot.get(field)
+        if old_value != new_value:
+            fields[field] = (old_value, new_value)
+
+    old_criteria, new_criteria = _criteria_snapshot(old), _criteria_snapshot(new)
+    for name in old_criteria.keys() | new_criteria.keys():
+        old_value, new_value = old_criteria.get(name), new_criteria.get(name)
+        if old_value != new_value:
+            fields[f"criteria.{name}"] = (old_value, new_value)
+
+    if not fields and old.json != new.json:
+        fields["json"] = (old.json, new.json)
+
+    return dict(sorted(fields.items()))
+
+
+class AdvancementDiff:
+    """
+    Difference of a single advancement between two versions of a datapack.
+    """
+    __slots__ = ("_datapack", "_mc_path", "_old", "_new", "_fields", "_kinds")
+
+    def __init__(self, datapack: str, mc_path: str, old: BaseAdvancement | None, new: BaseAdvancement | None,
+                 fields: dict[str, tuple[Any, Any]] | None = None):
+        """
+        :param datapack: Name of the datapack.
+        :param mc_path: Minecraft path of the advancement.
+        :param old: Old version of the advancement, None if the advancement was added.
+        :param new: New version of the advancement, None if the advancement was removed.
+        :param fields: Changed fields, see ``compare_advancements``.
+        """
+        self._datapack = datapack
+        self._mc_path = mc_path
+        self._old = old
+        self._new = new
+        self._fields = fields or {}
+
+        if old is None:
+            self._kinds = frozenset(("added",))
+        elif new is None:
+            self._kinds = frozenset(("removed",))
+        else:
+            self._kinds = frozenset(DIFF_FIELD_KINDS.get(field.split(".", 1)[0], "modified") for field in self._fields)
+
+    @property
+    def datapack(self) -> str:
+        """
+        :return: Name of the datapack.
+        """
+        return self._datapack
+
+    @property
+    def mc_path(self) -> str:
+        """
+        :return: Minecraft path of the advancement.
+        """
+        return self._mc_path
+
+    @property
+    def old(self) -> BaseAdvancement | None:
+        """
+        :return: Old version of the advancement, None if the advancement was added.
+        """
+        return self._old
+
+    @property
+    def new(self) -> BaseAdvancement | None:
+        """
+        :return: New version of the advancement, None if the advancement was removed.
+        """
+        return self._new
+
+    @property
+    def fields(self) -> dict[str, tuple[Any, Any]]:
+        """
+        :return: Dict where key is a changed field and value is a tuple of (old value, new value).
+        """
+        return self._fields
+
+    @property
+    def kinds(self) -> frozenset[str]:
+        """
+        :return: Kinds of the change, see ``constants.DIFF_KINDS``.
+        """
+        return self._kinds
+
+    def as_dict(self) -> dict[str, Any]:
+        """
+        :return: JSON-serializable representation of the difference.
+        """
+        return {"datapack": self._datapack, "mc_path": self._mc_path, "kinds": sorted(self._kinds),
+                "fields": {field: {"old": old, "new": new} for field, (old, new) in self._fields.items()}}
+
+    def __repr__(self):
+        return f"AdvancementDiff([{self._datapack}] {self._mc_path}, {', '.join(sorted(self._kinds))})"
+
+
+def diff_advancements(datapack: str, old: Iterable[BaseAdvancement], new: Iterable[BaseAdvancement]) -> list[AdvancementDiff]:
+    """
+    Matches two versions of the advancements by mc_path and compares them.
+    Advancements with equal fingerprints are skipped without comparing their fields.
+
+    :param datapack: Name of the datapack.
+    :param old: Old advancements.
+    :param new: New advancements.
+    :return: A list of differences sorted by mc_path.
+    """
+    old_advancements = {adv.mc_path: adv for adv in old}
+    new_advancements = {adv.mc_path: adv for adv in new}
+
+    entries = []
+    for mc_path in sorted(old_advancements.keys() | new_advancements.keys()):
+        old_adv, new_adv = old_advancements.get(mc_path), new_advancements.get(mc_path)
+        if old_adv is None or new_adv is None:
+            entries.append(AdvancementDiff(datapack, mc_path, old_adv, new_adv))
+        elif old_adv.fingerprint != new_adv.fingerprint:
+            fields = compare_advancements(old_adv, new_adv)
+            if fields:
+                entries.append(AdvancementDiff(datapack, mc_path, old_adv, new_adv, fields))
+    return entries
+
+
+class DiffReport:
+    """
+    Structural difference between two versions of parsed datapacks.
+    """
+
+    def __init__(self, entries: Iterable[AdvancementDiff] = ()):
+        """
+        :param entries: Differences of the advancements.
+        """
+        self._entries = list(entries)
+
+    @property
+    def entries(self) -> list[AdvancementDiff]:
+        """
+        :return: A list of all differences.
+        """
+        return self._entries
+
+    @property
+    def added(self) -> list[AdvancementDiff]:
+        """
+        :return: A list of added advancements.
+        """
+        return self.by_kind("added")
+
+    @property
+    def removed(self) -> list[AdvancementDiff]:
+        """
+        :return: A list of removed advancements.
+        """
+        return self.by_kind("removed")
+
+    @property
+    def changed(self) -> list[AdvancementDiff]:
+        """
+        :return: A list of advancements that exist in both versions and have changes.
+        """
+        return [entry for entry in self._entries if entry.old is not None and entry.new is not None]
+
+    def by_kind(self, kind: str) -> list[AdvancementDiff]:
+        """
+        :param kind: Kind of the change, see ``constants.DIFF_KINDS``.
+        :return: A list of differences of this kind.
+        :raises ValueError: If the kind is unknown.
+        """
+        if kind not in DIFF_KINDS:
+            raise ValueError(f"Unknown diff kind \"{kind}\", possible kinds: {DIFF_KINDS}")
+        return [entry for entry in self._entries if kind in entry.kinds]
+
+    def summary(self) -> dict[str, int]:
+        """
+        :return: Dict with the number of differences of every kind.
+        """
+        counts = dict.fromkeys(DIFF_KINDS, 0)
+        for entry in self._entries:
+            for kind in entry.kinds:
+                counts[kind] += 1
+        return counts
+
+    def as_dict(self) -> dict[str, Any]:
+        """
+        :return: JSON-serializable representation of the report.
+        """
+        return {"summary": self.summary(), "entries": [entry.as_dict() for entry in self._entries]}
+
+    def __iter__(self) -> Iterator[AdvancementDiff]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __bool__(self) -> bool:
+        return bool(self._entries)
+
+    def __repr__(self):
+        return f"DiffReport({', '.join(f'{kind}: {count}' for kind, count in self.summary().items() if count)})"
@@ -0,0 +1,250 @@
+import os
+import zipfile
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Type
+
+from .AdvType import AdvTypeManager
+from .Datapack import Datapack
+from .PackMCMeta import PackMCMeta
+from .Rewards import Exp, Reward, Trophy
+from .TabNameMapper import TabNameMapper
+from .utils import to_collection
+
+
+class DatapackProfile:
+    """
+    Describes how to construct a Datapack for packs with a known namespace layout, e.g. BACAP or one of its addons.
+    A discovered pack matches the profile if it contains all namespaces of the profile.
+    """
+
+    def __init__(self, name: str, namespaces: Iterable[str] | str, adv_type_manager: AdvTypeManager, reward_namespace: str | None = None,
+                 technical_tabs: Iterable[str] | None = None, tab_name_mapper: TabNameMapper = TabNameMapper(),
+                 exp_class: Type[Exp] = Exp, reward_class: Type[Reward] = Reward, trophy_class: Type[Trophy] = Trophy):
+        """
+        :param name: Name of the profile.
+        :param namespaces: Namespaces that identify the pack, the reward namespace is always required.
+        :param adv_type_manager: AdvTypeManager instance for the matched datapacks.
+        :param reward_namespace: Namespace where rewards are stored, see ``Datapack``.
+        :param technical_tabs: A list of tabs with technical advancements, see ``Datapack``.
+        :param tab_name_mapper: TabNameMapper instance, see ``Datapack``.
+        :param exp_class: Class used to parse the experience, see ``Datapack``.
+        :param reward_class: Class used to parse the item reward, see ``Datapack``.
+        :param trophy_class: Class used to parse the trophy, see ``Datapack``.
+        """
+        self._name = name
+        self._namespaces = to_collection(namespaces, frozenset)
+        if reward_namespace is not None:
+            self._namespaces |= {reward_namespace}
+        self._adv_type_manager = adv_type_manager
+        self._reward_namespace = reward_namespace
+        self._technical_tabs = technical_tabs
+        self._tab_name_mapper = tab_name_mapper
+        self._exp_class = exp_class
+        self._reward_class = reward_class
+        self._trophy_class = trophy_class
+
+    @property
+    def name(self) -> str:
+        """
+        :return: Name of the profile.
+        """
+        return self._name
+
+    @property
+    def namespaces(self) -> frozenset[str]:
+        """
+        :return: Namespaces that identify the pack.
+        """
+        return self._namespaces
+
+    def matches(self, namespaces: Iterable[str]) -> bool:
+        """
+        :param namespaces: Namespaces of the pack.
+        :return: True if the pack contains all namespaces of the profile, else False.
+        """
+        return self._namespaces <= set(namespaces)
+
+    def create(self, name: str, path: Path, **kwargs) -> Datapack:
+        """
+        :param name: Name of the datapack.
+        :param path: Path to the datapack folder.
+        :param kwargs: Other arguments of the Datapack, e.g. ``symbol_table`` or ``observer``.
+        :return: Loaded Datapack instance.
+        """
+        return Datapack(name=name, path=path, adv_type_manager=self._adv_type_manager, reward_namespace=self._reward_namespace,
+                        technical_tabs=self._technical_tabs, tab_name_mapper=self._tab_name_mapper, exp_class=self._exp_class,
+                        reward_class=self._reward_class, trophy_class=self._trophy_class, **kwargs)
+
+    def __repr__(self):
+        return f"DatapackProfile('{self._name}', {sorted(self._namespaces)})"
+
+
+class DiscoveredDatapack:
+    """
+    Result of the discovery of a single pack in a ``datapacks`` folder.
+    """
+
+    def __init__(self, name: str, path: Path):
+        """
+        :param name: Name of the pack, the folder name or the zip file name without the suffix.
+        :param path: Path to the pack folder or zip file.
+        """
+        self._name = name
+        self._path = path
+        self._pack_mcmeta: PackMCMeta | None = None
+        self._namespaces: frozenset[str] = frozenset()
+        self._profile: DatapackProfile | None = None
+        self._datapack: Datapack | None = None
+        self._error: Exception | None = None
+
+    @property
+    def name(self) -> str:
+        """
+        :return: Name of the pack, the folder name or the zip file name without the suffix.
+        """
+        return self._name
+
+    @property
+    def path(self) -> Path:
+        """
+        :return: Path to the pack folder or zip file.
+        """
+        return self._path
+
+    @property
+    def is_zip(self) -> bool:
+        """
+        :return: True if the pack is a zip file, else False.
+        """
+        return self._path.suffix == ".zip"
+
+    @property
+    def pack_mcmeta(self) -> PackMCMeta | None:
+        """
+        :return: Validated PackMCMeta of the pack, None if the validation failed.
+        """
+        return self._pack_mcmeta
+
+    @property
+    def namespaces(self) -> frozenset[str]:
+        """
+        :return: Namespaces of the pack from the base data folder and the applied overlays.
+        """
+        return self._namespaces
+
+    @property
+    def profile(self) -> DatapackProfile | None:
+        """
+        :return: Matched DatapackProfile, None if no profile matches the pack.
+        """
+        return self._profile
+
+    @property
+    def datapack(self) -> Datapack | None:
+        """
+        :return: Loaded Datapack instance, None if the pack was not loaded.
+        """
+        return self._datapack
+
+    @property
+    def error(self) -> Exception | None:
+        """
+        :return: Exception raised during the validation or loading of the pack, None if there was no error.
+        """
+        return self._error
+
+    def __repr__(self):
+        status = f"error: {self._error!r}" if self._error else f"profile: {self._profile.name if self._profile else None}"
+        return f"DiscoveredDatapack('{self._name}', {status})"
+
+
+def _validate(candidate: DiscoveredDatapack, profiles: list[DatapackProfile], extract_to: Path | None):
+    """
+    Validates pack.mcmeta of the candidate, reads its namespaces and matches the most specific profile.
+    """
+    try:
+        if candidate.is_zip:
+            if extract_to is not None:
+                candidate._path = _extract(candidate.path, extract_to / candidate.name)
+                root = candidate.path
+            else:
+                root = zipfile.Path(candidate.path)
+        else:
+            root = candidate.path
+
+        candidate._pack_mcmeta = PackMCMeta(root)
+        candidate._namespaces = frozenset(
+            entry.name for data_path in candidate.pack_mcmeta.data_paths for entry in data_path.iterdir() if entry.is_dir()
+        )
+    except (OSError, ValueError, KeyError, zipfile.BadZipFile) as e:
+        candidate._error = e
+        return
+
+    matched = [profile for profile in profiles if profile.matches(candidate.namespaces)]
+    if matched:
+        candidate._profile = max(matched, key=lambda profile: len(profile.namespaces))
+
+    if candidate.is_zip and candidate.profile is not None:
+        candidate._error = NotImplementedError("Zipped datapacks not supported, pass extract_to to unpack them")
+
+
+def _extract(path: Path, destination: Path) -> Path:
+    """
+    Extracts the zip file, if the destination folder does not exist or is older than the zip file.
+    :return: Path to the destination folder.
+    """
+    if not destination.is_dir() or destination.stat().st_mtime < path.stat().st_mtime:
+        with zipfile.ZipFile(path) as archive:
+            archive.extractall(destination)
+        os.utime(destination)
+    return destination
+
+
+def _load(candidate: DiscoveredDatapack, kwargs: dict):
+    try:
+        candidate._datapack = candidate.profile.create(candidate.name, candidate.path, **kwargs)
+    except Exception as e:
+        candidate._error = e
+
+
+def discover_datapacks(folder: Path, profiles: Iterable[DatapackProfile], extract_to: Path | None = None, load: bool = True,
+                       max_workers: int | None = None, **kwargs) -> list[DiscoveredDatapack]:
+    """
+    Scans a ``datapacks`` folder for pack folders and zip files, validates their ``pack.mcmeta`` concurrently,
+    matches every pack to the profile with the most namespaces it contains and loads the matched packs in threads.
+    Errors are recorded in the results instead of being raised.
+
+    Threads overlap the file system work (listing folders, reading files and zips), JSON and NBT parsing still runs
+    one thread at a time because of the GIL, so loading is faster mostly on slow or network drives.
+    Threads are used instead of processes because the loaded packs can share one SymbolTable
+    (e.g. ``symbol_table=parser.symbol_table``), whose registries are locked, instead of being pickled back.
+
+    :param folder: Path to the ``datapacks`` folder of a world.
+    :param profiles: Known DatapackProfile instances.
+    :param extract_to: Folder to unpack zipped packs to, if None, zipped packs are validated and matched but not loaded.
+    :param load: Whether to load the matched packs.
+    :param max_workers: Maximum number of threads, if None, the ``ThreadPoolExecutor`` default is used.
+    :param kwargs: Other arguments of the loaded Datapack instances, e.g. ``observer`` or ``pack_format``.
+    :return: A list of DiscoveredDatapack instances sorted by name.
+    :raises FileNotFoundError: If the folder does not exist.
+    """
+    if not folder.is_dir():
+        raise FileNotFoundError(f"Datapacks folder \"{folder}\" not found, or it is not a directory")
+
+    profiles = list(profiles)
+    candidates = sorted(
+        (DiscoveredDatapack(entry.stem if entry.suffix == ".zip" else entry.name, entry)
+         for entry in folder.iterdir() if entry.is_dir() or entry.suffix == ".zip"),
+        key=lambda candidate: candidate.name
+    )
+
+    with ThreadPoolExecutor(max_workers) as executor:
+        list(executor.map(lambda candidate: _validate(candidate, profiles, extract_to), candidates))
+
+        if load:
+            matched = [candidate for candidate in candidates if candidate.profile is not None and candidate.error is None]
+            list(executor.map(lambda candidate: _load(candidate, kwargs), matched))
+
+    return candidates
@@ -1,3 +1,4 @@
+import copy
 from collections.abc import Iterable, Hashable
 from typing import Any
 
@@ -50,4 +51,49 @@ class ExtendedDict(dict):
         for key in keys:
             if key in self:
                 return self[key]
-        return default
\ No newline at end of file
+        return default
+
+def _read_only(self, *args, **kwargs):
+    raise TypeError(f"{type(self).__name__} is read-only, copy it with copy.deepcopy to modify it")
+
+
+def _freeze_list(data: list) -> "FrozenList":
+    return FrozenList(_freeze_list(value) if type(value) is list else value for value in data)
+
+
+class FrozenList(list):
+    """
+    Read-only list of a FrozenDict.
+    """
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+
+    def __reduce__(self):
+        return self.__class__, (list(self),)
+
+    def __deepcopy__(self, memo: dict) -> list:
+        return [copy.deepcopy(value, memo) for value in self]
+
+
+class FrozenDict(ExtendedDict):
+    """
+    Read-only ExtendedDict of parsed JSON that is shared between advancements, see ``ContentCache``.
+    Nested lists are FrozenList instances, use it as ``object_hook`` of ``json.loads`` to freeze nested dicts.
+    ``copy.deepcopy`` returns a mutable ExtendedDict with mutable nested dicts and lists.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        for key, value in self.items():
+            if type(value) is list:
+                dict.__setitem__(self, key, _freeze_list(value))
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        return self.__class__, (dict(self),)
+
+    def __deepcopy__(self, memo: dict) -> ExtendedDict:
+        return ExtendedDict({key: copy.deepcopy(value, memo) for key, value in self.items()})
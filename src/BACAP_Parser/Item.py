@@ -1,8 +1,10 @@
+import threading
 from typing import Literal
 
 
 from .ExtendedDict import ExtendedDict
 from .Color import Color
+from .utils import normalized_json
 
 
 
@@ -51,6 +53,20 @@ class Item:
         else:
             return bool(self._components.get("enchantments", False))
 
+    def _intern_strings(self, symbol_table):
+        """
+        Replaces strings of the item with the instances stored in the symbol table.
+        :param symbol_table: SymbolTable instance.
+        """
+        self._id = symbol_table.intern(self._id)
+        symbol_table.intern_values(self._components)
+
+    def _flyweight_key(self) -> tuple:
+        """
+        :return: Structural key of the item, equal for items with the same class, id, components and other attributes.
+        """
+        return type(self), self._id, normalized_json(self._components) if self._components else ""
+
     def __repr__(self):
         return f"{self.__class__.__name__}(\"{self._id}\")"
 
@@ -82,6 +98,9 @@ class RewardItem(Item):
         """
         return self._amount
 
+    def _flyweight_key(self) -> tuple:
+        return *super()._flyweight_key(), self._type, self._amount
+
     def __repr__(self):
         return f"{self.__class__.__name__}(id:\"{self._id}\", amount:\"{self._amount}\", type:\"{self.type}\")"
 
@@ -117,8 +136,72 @@ class TrophyItem(Item):
         """
         return self._description
 
+    def _flyweight_key(self) -> tuple:
+        return *super()._flyweight_key(), self._name, self._color, self._description
+
     def __repr__(self):
         return f"{self.__class__.__name__}(id:\"{self._id}\", name:\"{self._name}\")"
 
     def __str__(self):
-        return self.__repr__()
\ No newline at end of file
+        return self.__repr__()
+
+
+class ItemRegistry:
+    """
+    Registry of shared Item instances.
+
+    Many icons and reward items are the same id and components combination, the registry keeps a single instance
+    of every structurally equal item, so advancements share the Item objects and their component dicts.
+    Registered items are shared and must not be modified. Registration is locked, so datapacks loaded in threads
+    (e.g. ``discover_datapacks``) get the same instances.
+    """
+
+    def __init__(self):
+        self._items: dict[tuple, Item] = {}
+        self._lookups = 0
+        self._lock = threading.Lock()
+
+    def canonical[T: Item | None](self, item: T, symbol_table=None) -> T:
+        """
+        :param item: Item instance or None.
+        :param symbol_table: SymbolTable used to intern the strings of a newly registered item.
+        :return: The registered instance structurally equal to the item, or the item itself if it is new.
+        """
+        if item is None:
+            return None
+        key = item._flyweight_key()
+        with self._lock:
+            self._lookups += 1
+            registered = self._items.get(key)
+            if registered is not None:
+                return registered
+
+            if symbol_table is not None:
+                item._intern_strings(symbol_table)
+            self._items[key] = item
+            return item
+
+    def __getstate__(self) -> dict:
+        # Locks cannot be pickled
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @property
+    def stats(self) -> dict[str, int | float]:
+        """
+        :return: Dict with the number of registered items, total lookups, lookups that returned a registered item
+        and the share of deduplicated items.
+        """
+        hits = self._lookups - len(self._items)
+        return {"items": len(self._items), "lookups": self._lookups, "hits": hits, "dedup_ratio": hits / self._lookups if self._lookups else 0.0}
+
+    def __repr__(self):
+        return f"ItemRegistry(items: {len(self._items)})"
@@ -0,0 +1,282 @@
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+import zipfile
+from array import array
+from collections.abc import Iterable
+from pathlib import Path
+
+from .constants import DEFAULT_LOCALE
+
+_MAGIC = b"BLNG"
+_VERSION = 1
+
+# magic, version, number of keys, size of the keys blob
+_HEADER = struct.Struct("<4sIII")
+
+
+class _LocaleTable:
+    """
+    Read-only sorted key -> string table of a single locale, stored in one buffer (bytes or mmap):
+    header, key offsets (n + 1), value offsets (n + 1), utf-8 keys blob, utf-8 values blob.
+    Lookups are binary searches over the keys blob, no per-key Python objects are created.
+    """
+
+    def __init__(self, buffer: bytes | mmap.mmap, file=None):
+        self._buffer = buffer
+        self._file = file
+        magic, version, count, keys_size = _HEADER.unpack_from(buffer, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("Not a language table or an unsupported version")
+
+        view = memoryview(buffer)
+        offsets_size = (count + 1) * 4
+        self._count = count
+        self._key_offsets = view[_HEADER.size:_HEADER.size + offsets_size].cast("I")
+        self._value_offsets = view[_HEADER.size + offsets_size:_HEADER.size + 2 * offsets_size].cast("I")
+        self._keys_start = _HEADER.size + 2 * offsets_size
+        self._values_start = self._keys_start + keys_size
+        view.release()
+
+    @staticmethod
+    def build(translations: dict[str, str]) -> bytes:
+        """
+        :param translations: Dict where key is a translation key and value is the translated string.
+        :return: Binary representation of the table.
+        """
+        keys = sorted(translations)
+        key_offsets, value_offsets = array("I", [0]), array("I", [0])
+        keys_blob, values_blob = bytearray(), bytearray()
+        for key in keys:
+            keys_blob += key.encode("utf-8")
+            values_blob += str(translations[key]).encode("utf-8")
+            key_offsets.append(len(keys_blob))
+            value_offsets.append(len(values_blob))
+        header = _HEADER.pack(_MAGIC, _VERSION, len(keys), len(keys_blob))
+        return b"".join((header, key_offsets.tobytes(), value_offsets.tobytes(), keys_blob, values_blob))
+
+    def __key(self, i: int) -> bytes:
+        return self._buffer[self._keys_start + self._key_offsets[i]:self._keys_start + self._key_offsets[i + 1]]
+
+    def get(self, key: str) -> str | None:
+        # utf-8 byte order is the same as code point order, so the keys are sorted as bytes
+        target = key.encode("utf-8")
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.__key(mid) < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._count and self.__key(lo) == target:
+            return self._buffer[self._values_start + self._value_offsets[lo]:self._values_start + self._value_offsets[lo + 1]].decode("utf-8")
+        return None
+
+    def close(self):
+        self._key_offsets.release()
+        self._value_offsets.release()
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+        if self._file is not None:
+            self._file.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+
+class LangIndex:
+    """
+    Index of Minecraft language files (``assets/<namespace>/lang/<locale>.json``) from resource pack folders,
+    zip files, lang folders or single lang files.
+
+    Sources are only scanned when the index is created, a locale is read on its first lookup and stored as a compact
+    sorted key -> string table. With ``storage``, tables are written to files and memory-mapped,
+    so worker processes share the pages of the same locale and later runs skip JSON parsing.
+    A table is rebuilt when the list of its sources, their sizes or modification times change.
+    """
+
+    def __init__(self, *sources: Path, storage: Path | None = None, fallback_locale: str | None = DEFAULT_LOCALE):
+        """
+        :param sources: Resource pack folders or zip files, folders with lang files or single lang files.
+        If several sources contain a key, the later source wins, like in the resource pack list.
+        :param storage: Folder for the memory-mapped locale tables, if None, tables are kept in memory.
+        :param fallback_locale: Locale used for keys that are missing in the requested locale, None to disable the fallback.
+        :raises FileNotFoundError: If a source does not exist.
+        """
+        self._storage = storage
+        self._fallback_locale = fallback_locale
+        self._lock = threading.Lock()
+        self._sources: dict[str, list[tuple[Path, str | None]]] = {}
+        self._tables: dict[str, _LocaleTable] = {}
+
+        for source in sources:
+            self.__scan(source)
+
+        if storage is not None:
+            storage.mkdir(parents=True, exist_ok=True)
+
+    def __add_source(self, locale: str, path: Path, member: str | None = None):
+        self._sources.setdefault(locale.lower(), []).append((path, member))
+
+    def __scan(self, source: Path):
+        if not source.exists():
+            raise FileNotFoundError(f"Language source \"{source}\" not found")
+
+        if source.suffix == ".zip":
+            with zipfile.ZipFile(source) as archive:
+                for member in sorted(archive.namelist()):
+                    parts = member.split("/")
+                    if len(parts) == 4 and parts[0] == "assets" and parts[2] == "lang" and parts[3].endswith(".json"):
+                        self.__add_source(parts[3][:-5], source, member)
+
+        elif source.is_file():
+            self.__add_source(source.stem, source)
+
+        elif (source / "assets").is_dir():
+            for path in sorted((source / "assets").glob("*/lang/*.json")):
+                self.__add_source(path.stem, path)
+
+        else:
+            for path in sorted(source.glob("*.json")):
+                self.__add_source(path.stem, path)
+
+    @property
+    def locales(self) -> list[str]:
+        """
+        :return: A sorted list of available locales.
+        """
+        return sorted(self._sources)
+
+    @property
+    def loaded_locales(self) -> list[str]:
+        """
+        :return: A sorted list of locales that are loaded.
+        """
+        return sorted(self._tables)
+
+    @property
+    def fallback_locale(self) -> str | None:
+        """
+        :return: Locale used for keys that are missing in the requested locale.
+        """
+        return self._fallback_locale
+
+    def __read_translations(self, locale: str) -> dict[str, str]:
+        translations: dict[str, str] = {}
+        for path, member in self._sources[locale]:
+            if member is None:
+                text = path.read_text(encoding="utf-8")
+            else:
+                with zipfile.ZipFile(path) as archive:
+                    text = archive.read(member).decode("utf-8")
+            translations.update(json.loads(text))
+        return translations
+
+    def __sources_digest(self, locale: str) -> str:
+        digest = hashlib.blake2b(digest_size=8)
+        for path, member in self._sources[locale]:
+            stat = path.stat()
+            digest.update(f"{path.resolve()}\0{member or ''}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode("utf-8"))
+        return digest.hexdigest()
+
+    def __remove_stale_tables(self, locale: str, table_path: Path):
+        for path in self._storage.glob(f"{locale}.*.lang.bin"):
+            if path != table_path:
+                try:
+                    path.unlink()
+                except OSError:
+                    # Still mapped by another process on Windows, it is removed by a later rebuild
+                    pass
+
+    def __load(self, locale: str) -> _LocaleTable | None:
+        if locale not in self._sources:
+            return None
+
+        if self._storage is None:
+            return _LocaleTable(_LocaleTable.build(self.__read_translations(locale)))
+
+        # The table name contains a hash of the source list, so a table built from other, changed or removed sources is not reused
+        table_path = self._storage / f"{locale}.{self.__sources_digest(locale)}.lang.bin"
+        if not table_path.exists():
+            temporary_path = table_path.with_suffix(f".{os.getpid()}.tmp")
+            temporary_path.write_bytes(_LocaleTable.build(self.__read_translations(locale)))
+            os.replace(temporary_path, table_path)
+            self.__remove_stale_tables(locale, table_path)
+
+        file = table_path.open("rb")
+        return _LocaleTable(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ), file)
+
+    def __table(self, locale: str) -> _LocaleTable | None:
+        locale = locale.lower()
+        table = self._tables.get(locale)
+        if table is None and locale in self._sources:
+            with self._lock:
+                table = self._tables.get(locale)
+                if table is None:
+                    table = self._tables[locale] = self.__load(locale)
+        return table
+
+    def get(self, key: str, locale: str = DEFAULT_LOCALE, default: str | None = None) -> str | None:
+        """
+        :param key: Translation key, e.g. ``advancements.blazeandcave.mining.stone_age.title``.
+        :param locale: Locale, e.g. ``en_us``.
+        :param default: Value returned if neither the locale nor the fallback locale contain the key.
+        :return: Translated string.
+        """
+        for candidate in (locale, self._fallback_locale):
+            if candidate is None:
+                continue
+            table = self.__table(candidate)
+            if table is not None:
+                value = table.get(key)
+                if value is not None:
+                    return value
+        return default
+
+    def translate(self, key: str, locale: str = DEFAULT_LOCALE) -> str:
+        """
+        :param key: Translation key.
+        :param locale: Locale, e.g. ``en_us``.
+        :return: Translated string, or the key itself if it is not translated, like Minecraft does.
+        """
+        return self.get(key, locale, key)
+
+    def load(self, locales: Iterable[str] | None = None):
+        """
+        Loads locales in advance, e.g. before forking worker processes.
+        :param locales: Locales to load, if None, all available locales are loaded.
+        """
+        for locale in locales if locales is not None else self._sources:
+            self.__table(locale)
+
+    def unload(self, locale: str | None = None):
+        """
+        Frees the table of the locale, it is loaded again on the next lookup.
+        :param locale: Locale to unload, if None, all locales are unloaded.
+        """
+        with self._lock:
+            locales = [locale.lower()] if locale is not None else list(self._tables)
+            for name in locales:
+                table = self._tables.pop(name, None)
+                if table is not None:
+                    table.close()
+
+    def __getstate__(self) -> dict:
+        # Loaded tables and the lock are not pickled, locales are loaded again on the first lookup
+        state = self.__dict__.copy()
+        state["_lock"] = None
+        state["_tables"] = {}
+        return state
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __contains__(self, locale: str) -> bool:
+        return locale.lower() in self._sources
+
+    def __repr__(self):
+        return f"LangIndex(locales: {len(self._sources)}, loaded: {len(self._tables)})"
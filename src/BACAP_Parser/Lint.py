@@ -0,0 +1,297 @@
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from .Advancement import Advancement, AdvancementManager, BaseAdvancement, InvalidAdvancement, UnrecognizedType
+from .Color import Color
+from .constants import LINT_SEVERITIES
+from .utils import normalize_id
+
+
+class LintIssue:
+    """
+    A single problem found by a LintCheck.
+    """
+    __slots__ = ("_check", "_severity", "_datapack", "_mc_path", "_message")
+
+    def __init__(self, check: str, severity: str, datapack: str, mc_path: str | None, message: str):
+        """
+        :param check: Name of the check that found the issue.
+        :param severity: Severity of the issue, one of ``constants.LINT_SEVERITIES``.
+        :param datapack: Name of the datapack.
+        :param mc_path: Minecraft path of the advancement, None if the issue is not related to a single advancement.
+        :param message: Description of the issue.
+        """
+        self._check = check
+        self._severity = severity
+        self._datapack = datapack
+        self._mc_path = mc_path
+        self._message = message
+
+    @property
+    def check(self) -> str:
+        """
+        :return: Name of the check that found the issue.
+        """
+        return self._check
+
+    @property
+    def severity(self) -> str:
+        """
+        :return: Severity of the issue, one of ``constants.LINT_SEVERITIES``.
+        """
+        return self._severity
+
+    @property
+    def datapack(self) -> str:
+        """
+        :return: Name of the datapack.
+        """
+        return self._datapack
+
+    @property
+    def mc_path(self) -> str | None:
+        """
+        :return: Minecraft path of the advancement, None if the issue is not related to a single advancement.
+        """
+        return self._mc_path
+
+    @property
+    def message(self) -> str:
+        """
+        :return: Description of the issue.
+        """
+        return self._message
+
+    def as_dict(self) -> dict[str, Any]:
+        """
+        :return: JSON-serializable representation of the issue.
+        """
+        return {"check": self._check, "severity": self._severity, "datapack": self._datapack, "mc_path": self._mc_path, "message": self._message}
+
+    def __repr__(self):
+        return f"LintIssue({self._severity}, {self._check}, [{self._datapack}] {self._mc_path}: {self._message})"
+
+
+class LintCheck:
+    """
+    Base class of the lint checks that run while a datapack is loaded, see ``Datapack(lint=...)``.
+
+    ``check_advancement`` is called for every advancement right after it is loaded, ``check_manager`` is called once
+    after all advancements are loaded, for checks that compare advancements with each other.
+    Checks must not keep state between calls, the same instance can be used by datapacks loaded in parallel.
+    """
+    name = "check"
+    severity = "warning"
+
+    def check_advancement(self, advancement: BaseAdvancement) -> Iterable[LintIssue]:
+        """
+        :param advancement: Loaded advancement.
+        :return: Issues of the advancement.
+        """
+        return ()
+
+    def check_manager(self, manager: AdvancementManager) -> Iterable[LintIssue]:
+        """
+        :param manager: AdvancementManager with all loaded advancements.
+        :return: Issues of the datapack.
+        """
+        return ()
+
+    def issue(self, datapack: str, mc_path: str | None, message: str, severity: str | None = None) -> LintIssue:
+        """
+        :return: LintIssue of this check, with the default severity of the check if severity is None.
+        """
+        return LintIssue(self.name, severity or self.severity, datapack, mc_path, message)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}()"
+
+
+class MissingRewardFiles(LintCheck):
+    """
+    Reports advancements whose ``rewards.function`` does not exist, and advancements without an exp function
+    when the datapack has a reward namespace.
+    """
+    name = "missing_reward_files"
+    severity = "error"
+
+    def check_advancement(self, advancement: BaseAdvancement) -> Iterable[LintIssue]:
+        if not isinstance(advancement, Advancement):
+            return
+
+        datapack = advancement.datapack
+        namespace, path = normalize_id(advancement.reward_mcpath).split(":", 1)
+        if f"{namespace}/function/{path}.mcfunction" not in datapack.data_index:
+            yield self.issue(datapack.name, advancement.mc_path, f"Reward function \"{advancement.reward_mcpath}\" does not exist")
+
+        if datapack.reward_namespace is not None and advancement.exp is None:
+            yield self.issue(datapack.name, advancement.mc_path, "Advancement does not have an exp reward function", "warning")
+
+
+class DanglingParents(LintCheck):
+    """
+    Reports advancements whose parent is in a namespace of the datapack, but does not exist.
+    Parents in other namespaces (e.g. addons that extend BACAP) are not checked.
+    """
+    name = "dangling_parents"
+    severity = "error"
+
+    def check_manager(self, manager: AdvancementManager) -> Iterable[LintIssue]:
+        datapack = manager.datapack
+        namespaces = {namespace.name for namespace in datapack.namespaces}
+        mc_paths = {advancement.mc_path for advancement in manager.adv_list}
+        for advancement in manager.adv_list:
+            parent = advancement.parent
+            if parent is not None and parent not in mc_paths and parent.split(":", 1)[0] in namespaces:
+                yield self.issue(datapack.name, advancement.mc_path, f"Parent \"{parent}\" does not exist")
+
+
+class DuplicateTitles(LintCheck):
+    """
+    Reports advancements with the same title (case-insensitive) in the datapack.
+    """
+    name = "duplicate_titles"
+
+    def check_manager(self, manager: AdvancementManager) -> Iterable[LintIssue]:
+        titles: dict[str, list[Advancement]] = {}
+        for advancement in manager.adv_list:
+            if isinstance(advancement, Advancement):
+                titles.setdefault(advancement.title.casefold(), []).append(advancement)
+
+        for advancements in titles.values():
+            if len(advancements) < 2:
+                continue
+            for advancement in advancements:
+                others = ", ".join(other.mc_path for other in advancements if other is not advancement)
+                yield self.issue(manager.datapack.name, advancement.mc_path, f"Title \"{advancement.title}\" is also used by {others}")
+
+
+class ColorTypeMismatch(LintCheck):
+    """
+    Reports advancements whose frame and color do not match exactly one AdvType (only in non-strict mode,
+    in strict mode loading fails), and description parts with another color than the advancement,
+    which are not included in the description.
+    """
+    name = "color_type_mismatch"
+    severity = "error"
+
+    def check_advancement(self, advancement: BaseAdvancement) -> Iterable[LintIssue]:
+        datapack = advancement.datapack.name
+        if isinstance(advancement, InvalidAdvancement) and isinstance(advancement.reason, UnrecognizedType):
+            yield self.issue(datapack, advancement.mc_path, str(advancement.reason))
+
+        elif isinstance(advancement, Advancement):
+            for part in advancement.json["display"]["description"].get("extra", []):
+                if not isinstance(part, dict) or "color" not in part:
+                    continue
+                text = part.get_with_multiple_values("text", "translate", default="")
+                if not text.strip():
+                    continue
+                try:
+                    color = Color(part["color"])
+                except ValueError:
+                    yield self.issue(datapack, advancement.mc_path, f"Description part \"{text}\" has invalid color \"{part['color']}\"")
+                    continue
+                if color != advancement.color:
+                    yield self.issue(datapack, advancement.mc_path, f"Description part \"{text}\" has color \"{color.value}\", "
+                                                                    f"but the advancement color is \"{advancement.color.value}\"", "warning")
+
+
+class UnreachableTrophies(LintCheck):
+    """
+    Reports trophy functions in the reward namespace that are not granted by any advancement.
+    """
+    name = "unreachable_trophies"
+
+    def check_manager(self, manager: AdvancementManager) -> Iterable[LintIssue]:
+        datapack = manager.datapack
+        if datapack.reward_namespace is None:
+            return
+
+        granted = {advancement.trophy.path for advancement in manager.adv_list if isinstance(advancement, Advancement) and advancement.trophy}
+        prefix = f"{datapack.reward_namespace}/function/"
+        for resource, path in datapack.data_index.iter_prefix(f"{prefix}trophy/"):
+            if resource.endswith(".mcfunction") and path not in granted:
+                mcpath = f"{datapack.reward_namespace}:{resource[len(prefix):].rsplit('.', 1)[0]}"
+                yield self.issue(datapack.name, None, f"Trophy function \"{mcpath}\" is not granted by any advancement")
+
+
+# Checks used by ``Datapack(lint=True)``
+DEFAULT_LINT_CHECKS: tuple[LintCheck, ...] = (MissingRewardFiles(), DanglingParents(), DuplicateTitles(), ColorTypeMismatch(), UnreachableTrophies())
+
+
+class LintReport:
+    """
+    Issues found by the lint checks during the load of one or several datapacks.
+    """
+
+    def __init__(self, issues: Iterable[LintIssue] = ()):
+        """
+        :param issues: Found issues.
+        """
+        self._issues = list(issues)
+
+    @property
+    def issues(self) -> list[LintIssue]:
+        """
+        :return: A list of all issues.
+        """
+        return self._issues
+
+    @property
+    def errors(self) -> list[LintIssue]:
+        """
+        :return: A list of issues with the "error" severity.
+        """
+        return self.by_severity("error")
+
+    @property
+    def warnings(self) -> list[LintIssue]:
+        """
+        :return: A list of issues with the "warning" severity.
+        """
+        return self.by_severity("warning")
+
+    def by_severity(self, severity: str) -> list[LintIssue]:
+        """
+        :param severity: One of ``constants.LINT_SEVERITIES``.
+        :return: A list of issues with this severity.
+        :raises ValueError: If the severity is unknown.
+        """
+        if severity not in LINT_SEVERITIES:
+            raise ValueError(f"Unknown severity \"{severity}\", possible severities: {LINT_SEVERITIES}")
+        return [issue for issue in self._issues if issue.severity == severity]
+
+    def by_check(self, check: str) -> list[LintIssue]:
+        """
+        :param check: Name of the check.
+        :return: A list of issues found by this check.
+        """
+        return [issue for issue in self._issues if issue.check == check]
+
+    def summary(self) -> dict[str, int]:
+        """
+        :return: Dict with the number of issues found by every check.
+        """
+        counts: dict[str, int] = {}
+        for issue in self._issues:
+            counts[issue.check] = counts.get(issue.check, 0) + 1
+        return counts
+
+    def as_dict(self) -> dict[str, Any]:
+        """
+        :return: JSON-serializable representation of the report.
+        """
+        return {"summary": self.summary(), "issues": [issue.as_dict() for issue in self._issues]}
+
+    def __iter__(self) -> Iterator[LintIssue]:
+        return iter(self._issues)
+
+    def __len__(self) -> int:
+        return len(self._issues)
+
+    def __bool__(self) -> bool:
+        return bool(self._issues)
+
+    def __repr__(self):
+        return f"LintReport(errors: {len(self.errors)}, warnings: {len(self.warnings)})"
@@ -0,0 +1,230 @@
+import sys
+import tracemalloc
+from collections.abc import Callable, Iterable
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+from typing import Any
+
+# Objects that are not part of the parsed model: code, classes and modules
+_SKIPPED_TYPES = (type, ModuleType, FunctionType, BuiltinFunctionType, MethodType)
+_LEAF_TYPES = (str, bytes, bytearray, int, float, complex, bool, type(None), memoryview)
+
+_slot_names: dict[type, tuple[str, ...]] = {}
+
+
+def _slots(cls: type) -> tuple[str, ...]:
+    names = _slot_names.get(cls)
+    if names is None:
+        names = []
+        for base in cls.__mro__:
+            slots = base.__dict__.get("__slots__", ())
+            names.extend((slots,) if isinstance(slots, str) else slots)
+        names = _slot_names[cls] = tuple(name for name in names if name not in ("__dict__", "__weakref__"))
+    return names
+
+
+def _referents(obj: Any) -> Iterable[Any]:
+    if isinstance(obj, dict):
+        return (*obj.keys(), *obj.values())
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return obj
+
+    referents = []
+    instance_dict = getattr(obj, "__dict__", None)
+    if isinstance(instance_dict, dict):
+        referents.append(instance_dict)
+    for name in _slots(type(obj)):
+        value = getattr(obj, name, None)
+        if value is not None:
+            referents.append(value)
+    return referents
+
+
+def _deep_size(root: Any, seen: set[int], by_class: dict[str, list[int]] | None = None, skip: set[int] | None = None) -> int:
+    """
+    :param root: Object to measure.
+    :param seen: Ids of already measured objects, they are not counted again. Updated in place.
+    :param by_class: Dict where key is a class name and value is [bytes, objects], updated in place.
+    :param skip: Ids of objects that are not measured and not traversed, e.g. back-references.
+    :return: Size in bytes of the root and all objects reachable from it that are not in ``seen``.
+    """
+    total = 0
+    stack = [root]
+    while stack:
+        obj = stack.pop()
+        obj_id = id(obj)
+        if obj_id in seen or (skip is not None and obj_id in skip) or isinstance(obj, _SKIPPED_TYPES):
+            continue
+        seen.add(obj_id)
+
+        size = sys.getsizeof(obj)
+        total += size
+        if by_class is not None:
+            counter = by_class.setdefault(type(obj).__name__, [0, 0])
+            counter[0] += size
+            counter[1] += 1
+
+        if not isinstance(obj, _LEAF_TYPES):
+            stack.extend(_referents(obj))
+    return total
+
+
+class MemoryReport:
+    """
+    Deep memory footprint of a Parser, measured by walking its object graph with ``sys.getsizeof``.
+
+    Every object is counted once: interned strings belong to the symbol table, shared objects to the first datapack
+    in name order that references them, and the indexes of the parser count only their own structures.
+    Fields of the advancements are measured separately, so the split of raw JSON and derived data does not depend on the order.
+    """
+
+    def __init__(self, parser, fields: bool = True, load_trace: dict[str, Any] | None = None):
+        """
+        :param parser: Parser instance.
+        :param fields: Whether to measure the fields of the advancements.
+        :param load_trace: Allocations of the load returned by ``trace_load``, kept in the report.
+        """
+        self._by_class: dict[str, list[int]] = {}
+        self._by_component: dict[str, int] = {}
+        self._by_datapack: dict[str, int] = {}
+        self._by_field: dict[str, int] = {}
+        self._load_trace = load_trace
+
+        # The symbol table is measured first and the indexes and the content cache last, so datapacks own their advancements
+        # and the indexes only their own structures
+        seen = {id(parser)}
+        state = vars(parser)
+        symbol_table = state.get("_symbol_table")
+        content = symbol_table.content if symbol_table is not None else None
+        self._by_component["symbol_table"] = _deep_size(symbol_table, seen, self._by_class, skip={id(content)})
+        for datapack in sorted(parser.datapacks, key=lambda datapack: datapack.name):
+            self._by_datapack[datapack.name] = _deep_size(datapack, seen, self._by_class)
+        self._by_component["content_cache"] = _deep_size(content, seen, self._by_class)
+        for name in sorted(state.keys() - {"_symbol_table", "_datapacks"}):
+            self._by_component[name.lstrip("_")] = _deep_size(state[name], seen, self._by_class)
+        self._by_component["datapacks"] = _deep_size(state["_datapacks"], seen, self._by_class)
+        self._total = sys.getsizeof(parser) + sum(self._by_component.values()) + sum(self._by_datapack.values())
+
+        if fields:
+            # Back-references to the advancements, datapacks and the symbol table are not part of any field
+            advancements = [adv for datapack in parser.datapacks for adv in datapack.advancement_manager.adv_list]
+            field_seen = {id(obj) for obj in (*advancements, *parser.datapacks, parser.symbol_table)}
+            for advancement in advancements:
+                for name, value in self.__fields(advancement):
+                    self._by_field[name] = self._by_field.get(name, 0) + _deep_size(value, field_seen)
+
+    @staticmethod
+    def __fields(advancement) -> Iterable[tuple[str, Any]]:
+        # The raw JSON is measured first, so the strings it shares with derived fields are counted as raw
+        fields = vars(advancement) if hasattr(advancement, "__dict__") else {name: getattr(advancement, name, None) for name in _slots(type(advancement))}
+        if "_json" in fields:
+            yield "json", fields["_json"]
+        for name, value in fields.items():
+            if name not in ("_json", "_datapack"):
+                yield name.lstrip("_"), value
+
+    @classmethod
+    def trace_load[T](cls, load: Callable[[], T], top: int = 10) -> tuple[T, dict[str, Any]]:
+        """
+        Runs the load function with ``tracemalloc`` enabled and compares snapshots taken before and after it.
+        If tracemalloc is already tracing, it is left running.
+
+        :param load: Function that loads datapacks, e.g. ``lambda: Parser(...)``.
+        :param top: Number of source files with the largest allocations to report.
+        :return: Tuple of the load result and a dict with the ``allocated`` and ``peak`` bytes
+        and the ``top`` source files with their allocated bytes.
+        """
+        was_tracing = tracemalloc.is_tracing()
+        if not was_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        try:
+            before = tracemalloc.take_snapshot()
+            result = load()
+            after = tracemalloc.take_snapshot()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            if not was_tracing:
+                tracemalloc.stop()
+
+        statistics = after.compare_to(before, "filename")
+        trace = {
+            "allocated": sum(stat.size_diff for stat in statistics),
+            "peak": peak,
+            "top": [{"file": stat.traceback[0].filename, "bytes": stat.size_diff} for stat in statistics[:top]],
+        }
+        return result, trace
+
+    @property
+    def total(self) -> int:
+        """
+        :return: Deep size of the parser in bytes.
+        """
+        return self._total
+
+    @property
+    def by_component(self) -> dict[str, int]:
+        """
+        :return: Dict with the deep size of every parser component (symbol table, indexes, caches) in bytes.
+        """
+        return self._by_component
+
+    @property
+    def by_datapack(self) -> dict[str, int]:
+        """
+        :return: Dict with the deep size of every datapack in bytes, without the objects counted in the components.
+        """
+        return self._by_datapack
+
+    @property
+    def by_class(self) -> dict[str, tuple[int, int]]:
+        """
+        :return: Dict where key is a class name and value is (bytes, number of objects), the largest first.
+        """
+        return {name: (size, count) for name, (size, count) in sorted(self._by_class.items(), key=lambda item: -item[1][0])}
+
+    @property
+    def by_field(self) -> dict[str, int]:
+        """
+        :return: Dict with the deep size of every advancement field in bytes, summed over all advancements.
+        Empty if the fields were not measured.
+        """
+        return dict(sorted(self._by_field.items(), key=lambda item: -item[1]))
+
+    @property
+    def raw_json(self) -> int:
+        """
+        :return: Deep size of the raw advancement JSON in bytes.
+        """
+        return self._by_field.get("json", 0)
+
+    @property
+    def derived(self) -> int:
+        """
+        :return: Deep size of the advancement fields derived from the JSON and reward files in bytes.
+        """
+        return sum(size for name, size in self._by_field.items() if name != "json")
+
+    @property
+    def load_trace(self) -> dict[str, Any] | None:
+        """
+        :return: Allocations of the load returned by ``trace_load``, or None.
+        """
+        return self._load_trace
+
+    def as_dict(self) -> dict[str, Any]:
+        """
+        :return: JSON-serializable representation of the report.
+        """
+        return {
+            "total": self._total,
+            "by_component": self._by_component,
+            "by_datapack": self._by_datapack,
+            "by_class": {name: {"bytes": size, "objects": count} for name, (size, count) in self.by_class.items()},
+            "by_field": self.by_field,
+            "raw_json": self.raw_json,
+            "derived": self.derived,
+            "load_trace": self._load_trace,
+        }
+
+    def __repr__(self):
+        return f"MemoryReport(total: {self._total / 1024 / 1024:.2f} MiB, datapacks: {len(self._by_datapack)})"
@@ -7,12 +7,14 @@ class PackMCMeta:
     """
     Object for managing and validating a Minecraft datapack's metadata.
     """
-    def __init__(self, datapack_path: Path):
+    def __init__(self, datapack_path: Path, pack_format: int | None = None):
         """
         :param datapack_path: A `Path` object representing the root directory of the Minecraft datapack.
                               This directory must contain a valid `pack.mcmeta` file.
+        :param pack_format: Pack format used to choose the applied overlays.
+        If None, the highest format of the pack and its overlays is used.
         :raises FileNotFoundError: If `pack.mcmeta` is not found in the provided datapack directory,
-        or if the `data` directory (or an overlay directory, if specified) is missing or not a directory.
+        or if neither the `data` directory nor the `data` directory of an applied overlay exists.
         :raises ValueError: If `pack.mcmeta` is not a valid JSON file or is empty.
         """
         if not (datapack_path / "pack.mcmeta").exists():
@@ -25,13 +27,23 @@ class PackMCMeta:
             raise ValueError("pack.mcmeta is not a valid json, or empty")
 
         self._pack_format = self._validate_pack_format()
-        if "overlays" in self._json:
-            self._data_path = datapack_path / f"{self._get_max_min_overlay_directory()}/data"
-        else:
-            self._data_path = datapack_path / "data"
 
-        if not (self._data_path.exists() or self._data_path.is_dir()):
-            raise FileNotFoundError(f"latest data directory: \"{self._data_path}\" not found in the datapack, or it is not a directory")
+        overlays = self._get_overlay_entries() if "overlays" in self._json else []
+        if pack_format is None:
+            pack_format = max([self._pack_format, *(min_inclusive for _, min_inclusive, _ in overlays)])
+        self._target_pack_format = pack_format
+
+        # Overlays are applied on top of the base data directory in the order they are listed
+        self._data_paths = [datapack_path / "data"] + [
+            datapack_path / directory / "data"
+            for directory, min_inclusive, max_inclusive in overlays
+            if min_inclusive <= pack_format <= max_inclusive
+        ]
+        self._data_paths = [data_path for data_path in self._data_paths if data_path.is_dir()]
+
+        if not self._data_paths:
+            raise FileNotFoundError(f"data directory not found in the datapack and its overlays for pack_format {pack_format}, or it is not a directory")
+        self._data_path = self._data_paths[-1]
 
         self._description = self._parse_description()
 
@@ -69,29 +81,29 @@ class PackMCMeta:
         return pack_format
 
     @staticmethod
-    def __get_min_inclusive(format_field: [int, list[int, int], dict[str, int]]) -> int | None:
+    def __get_format_range(format_field: [int, list[int, int], dict[str, int]]) -> tuple[int, int | float] | None:
         """
-        Extracts the minimum inclusive `pack_format` from a given format field.
+        Extracts the inclusive range of `pack_format` values from a given format field.
 
         :param format_field: The format field.
-        :return: An integer representing the minimum inclusive `pack_format`, or `None` if the format is invalid.
+        :return: A tuple of minimum and maximum inclusive `pack_format`, or `None` if the format is invalid.
         """
         if isinstance(format_field, int):
-            return format_field  # If it's just an int, return it
+            return format_field, format_field  # If it's just an int, it is the only format
 
-        elif isinstance(format_field, list):
-            return min(format_field)  # If it's a list, take the minimum value
+        elif isinstance(format_field, list) and format_field:
+            return min(format_field), max(format_field)  # If it's a list, take the minimum and maximum values
 
-        elif isinstance(format_field, dict):
-            return format_field.get("min_inclusive", None)  # If it's a dict, return min_inclusive
+        elif isinstance(format_field, dict) and "min_inclusive" in format_field:
+            return format_field["min_inclusive"], format_field.get("max_inclusive", float("inf"))
 
         return None  # If the format is invalid, return None
 
-    def _get_max_min_overlay_directory(self) -> Path:
+    def _get_overlay_entries(self) -> list[tuple[str, int, int | float]]:
         """
-        Determines the overlay directory with the highest minimum `pack_format` value.
+        Extracts the overlay entries in the order they are listed.
 
-        :return: A `Path` object representing the directory of the overlay with the highest minimum inclusive format.
+        :return: A list of tuples of the overlay directory, minimum and maximum inclusive `pack_format`.
         :raises ValueError: If the `overlays` dictionary does not contain `entries`, or if any entry has invalid formats.
         :raises KeyError: If an entry is missing the `formats` dictionary or `directory` field.
         """
@@ -101,25 +113,23 @@ class PackMCMeta:
         if not entries:
             raise ValueError("pack.mcmeta does not have entries, while having \"overlays\" dictionary")
 
-        max_min_inclusive = float("-inf")
-        max_min_inclusive_directory = None
-
+        overlay_entries = []
         for entry in entries:
             formats = entry.get("formats")
             if formats is None:
                 raise KeyError(f"entry \"{entry}\" does not have \"formats\" dictionary")
 
-            min_inclusive = self.__get_min_inclusive(formats)
-            if min_inclusive is None:
+            format_range = self.__get_format_range(formats)
+            if format_range is None:
                 raise ValueError(f"{formats} is not in a valid format")
 
-            if min_inclusive > max_min_inclusive:
-                max_min_inclusive_directory = entry.get("directory")
-                if max_min_inclusive_directory is None:
-                    raise KeyError(f"entry \"{entry}\" does not have \"directory\" field")
-                max_min_inclusive = min_inclusive
+            directory = entry.get("directory")
+            if directory is None:
+                raise KeyError(f"entry \"{entry}\" does not have \"directory\" field")
 
-        return max_min_inclusive_directory
+            overlay_entries.append((directory, *format_range))
+
+        return overlay_entries
 
     @property
     def path(self) -> Path:
@@ -138,10 +148,24 @@ class PackMCMeta:
     @property
     def data_path(self) -> Path:
         """
-        :return: The path to the `data` directory or the data directory in the latest overlay in the datapack.
+        :return: The path to the `data` directory of the applied layer with the highest precedence.
         """
         return self._data_path
 
+    @property
+    def data_paths(self) -> list[Path]:
+        """
+        :return: Paths to the existing `data` directories of the base pack and the applied overlays, from the lowest to the highest precedence.
+        """
+        return self._data_paths
+
+    @property
+    def target_pack_format(self) -> int:
+        """
+        :return: Pack format used to choose the applied overlays.
+        """
+        return self._target_pack_format
+
     @property
     def description(self) -> str | None:
         """
@@ -1,16 +1,34 @@
+import heapq
 from collections.abc import Iterable
+from itertools import chain, islice
+from pathlib import Path
 
-from .utils import to_collection
+from .utils import content_hash, to_collection
+from .Advancement import Advancement, InvalidAdvancement, TechnicalAdvancement
+from .AdvType import AdvType
+from .CriteriaIndex import CriteriaIndex
 from .Datapack import Datapack
+from .LangIndex import LangIndex
+from .SearchIndex import SearchIndex
+from .SymbolTable import SymbolTable
 
 
 class Parser:
-    def __init__(self, *datapacks: Datapack):
+    def __init__(self, *datapacks: Datapack, symbol_table: SymbolTable | None = None):
         """
         A class to manage a collection of Datapack instances.
         :param datapacks: One or more Datapack instances to initialize the parser with.
+        :param symbol_table: SymbolTable shared by all datapacks of the parser.
+        If not specified, the table of the first added datapack is used.
+        Datapacks that were loaded with another table are re-interned into the parser table when added.
         """
         self._datapacks: dict[str, Datapack] = {}
+        self._symbol_table = symbol_table
+        self._criteria_index = CriteriaIndex()
+        self._search_index = SearchIndex()
+        self._lang_index = None
+        self._stats: tuple[tuple, "AdvancementStats"] | None = None
+        self._fingerprint: tuple[tuple, str] | None = None
         self.add_datapacks(to_collection(datapacks, list))
 
     def add_datapack(self, datapack: Datapack):
@@ -21,7 +39,17 @@ class Parser:
         """
         if self._datapacks.get(datapack.name) is not None:
             raise ValueError(f"Datapack {datapack.name} already exists")
+
+        if self._symbol_table is None:
+            self._symbol_table = datapack.symbol_table
+        else:
+            datapack._adopt_symbol_table(self._symbol_table)
+
+        if self._lang_index is not None and datapack.lang_index is None:
+            datapack.lang_index = self._lang_index
+
         self._datapacks[datapack.name] = datapack
+        self._index_datapack(datapack)
 
     def add_datapacks(self, datapacks: Iterable[Datapack]):
         """
@@ -31,6 +59,74 @@ class Parser:
         for datapack in datapacks:
             self.add_datapack(datapack)
 
+    def discover(self, folder: Path, profiles: Iterable["DatapackProfile"], extract_to: Path | None = None, max_workers: int | None = None,
+                 **kwargs) -> list["DiscoveredDatapack"]:
+        """
+        Discovers packs in a ``datapacks`` folder of a world and adds the packs that match one of the profiles,
+        see ``discover_datapacks``. Packs are validated and loaded in threads, which overlap file reads but not parsing.
+        :param folder: Path to the ``datapacks`` folder.
+        :param profiles: Known DatapackProfile instances, e.g. for BACAP and its addons.
+        :param extract_to: Folder to unpack zipped packs to, if None, zipped packs are not loaded.
+        :param max_workers: Maximum number of threads, if None, the ``ThreadPoolExecutor`` default is used.
+        :param kwargs: Other arguments of the loaded Datapack instances, e.g. ``observer`` or ``pack_format``.
+        The packs are loaded with the symbol table of the parser unless ``symbol_table`` is given.
+        :return: A list of DiscoveredDatapack instances sorted by name, with errors of the packs that were not added.
+        :raises FileNotFoundError: If the folder does not exist.
+        """
+        from .Discovery import discover_datapacks
+        kwargs.setdefault("symbol_table", self.symbol_table)
+        candidates = discover_datapacks(folder, profiles, extract_to, True, max_workers, **kwargs)
+        for candidate in candidates:
+            if candidate.datapack is None:
+                continue
+            try:
+                self.add_datapack(candidate.datapack)
+            except ValueError as e:
+                candidate._datapack, candidate._error = None, e
+        return candidates
+
+    def remove_datapack(self, name: str) -> Datapack:
+        """
+        Removes a Datapack instance from the collection.
+        :param name: name of the datapack
+        :return: Removed Datapack instance
+        :raises KeyError: if the datapack does not exist
+        """
+        datapack = self.get_datapack(name)
+        self._unindex_datapack(datapack)
+        del self._datapacks[name]
+        return datapack
+
+    def reload(self, name: str | None = None):
+        """
+        Reloads datapacks from the disk and updates all indexes of the parser.
+        :param name: name of the datapack to reload, if None, all datapacks are reloaded.
+        :raises KeyError: if the datapack does not exist
+        """
+        datapacks = [self.get_datapack(name)] if name is not None else self.datapacks
+        for datapack in datapacks:
+            self._unindex_datapack(datapack)
+            try:
+                datapack.reload()
+            finally:
+                self._index_datapack(datapack)
+
+    def _index_datapack(self, datapack: Datapack):
+        """
+        Adds advancements of the datapack to all indexes of the parser.
+        :param datapack: Datapack instance
+        """
+        self._criteria_index.add(datapack.advancement_manager.adv_list)
+        self._search_index.add(datapack.advancement_manager.adv_list)
+
+    def _unindex_datapack(self, datapack: Datapack):
+        """
+        Removes advancements of the datapack from all indexes of the parser.
+        :param datapack: Datapack instance
+        """
+        self._criteria_index.remove(datapack.advancement_manager.adv_list)
+        self._search_index.remove(datapack.advancement_manager.adv_list)
+
     def get_datapack(self, name: str) -> Datapack:
         """
         :param name: name of the datapack
@@ -55,9 +151,157 @@ class Parser:
         """
         return list(self._datapacks.values())
 
+    @property
+    def fingerprint(self) -> str:
+        """
+        :return: Root hash of the names and fingerprints of all datapacks, equal root hashes mean equal content.
+        It is computed on the first call and again only after datapacks are added, removed or reloaded.
+        """
+        managers = tuple((name, datapack.advancement_manager) for name, datapack in self._datapacks.items())
+        if self._fingerprint is None or self._fingerprint[0] != managers:
+            fingerprint = content_hash(*chain.from_iterable((name, self._datapacks[name].fingerprint) for name in sorted(self._datapacks)))
+            self._fingerprint = (managers, fingerprint)
+        return self._fingerprint[1]
+
+    @property
+    def lint_report(self) -> "LintReport":
+        """
+        :return: LintReport with the issues of all linted datapacks, see ``Datapack(lint=...)``.
+        """
+        from .Lint import LintReport
+        return LintReport(chain.from_iterable(dp.lint_report for dp in self._datapacks.values() if dp.lint_report is not None))
+
+    def stats(self) -> "AdvancementStats":
+        """
+        :return: AdvancementStats column store of the advancements of all datapacks.
+        It is built on the first call and rebuilt only after datapacks are added, removed or reloaded.
+        """
+        managers = tuple(dp.advancement_manager for dp in self._datapacks.values())
+        if self._stats is None or self._stats[0] != managers or self._stats[1].symbol_table is not self.symbol_table:
+            from .Stats import AdvancementStats
+            advancements = chain.from_iterable(manager.adv_list for manager in managers)
+            self._stats = (managers, AdvancementStats(advancements, self.symbol_table))
+        return self._stats[1]
+
+    @property
+    def lang_index(self) -> LangIndex | None:
+        """
+        :return: LangIndex shared by the datapacks of the parser, or None.
+        """
+        return self._lang_index
+
+    @lang_index.setter
+    def lang_index(self, lang_index: LangIndex | None):
+        """
+        :param lang_index: LangIndex used by all current and later added datapacks to translate titles and descriptions.
+        """
+        self._lang_index = lang_index
+        for datapack in self._datapacks.values():
+            datapack.lang_index = lang_index
+
+    @property
+    def symbol_table(self) -> SymbolTable:
+        """
+        :return: SymbolTable instance with interned strings of all datapacks.
+        Pass it to new Datapack instances to intern their strings directly into the parser table.
+        """
+        if self._symbol_table is None:
+            self._symbol_table = SymbolTable()
+        return self._symbol_table
+
+    @property
+    def criteria_index(self) -> CriteriaIndex:
+        """
+        :return: CriteriaIndex with criteria triggers, names and condition ids of all advancements in all datapacks.
+        It is updated when datapacks are added, removed or reloaded.
+        """
+        return self._criteria_index
+
+    @property
+    def search_index(self) -> SearchIndex:
+        """
+        :return: SearchIndex with texts of all advancements in all datapacks.
+        It is updated when datapacks are added, removed or reloaded.
+        """
+        return self._search_index
+
+    def search(self, query: str, limit: int | None = 10, prefix: bool = True, require_all: bool = True,
+               datapack: str | None = None) -> list[tuple[Advancement, float]]:
+        """
+        Full-text search over titles, descriptions, tab names and trophy texts of all advancements, see ``SearchIndex.search``.
+        :param query: Text query.
+        :param limit: Maximum number of results, None if no limit.
+        :param prefix: Whether every query word also matches indexed words that start with it.
+        :param require_all: Whether an advancement must match every query word.
+        :param datapack: Name of the datapack to search in, if None, all datapacks are searched.
+        :return: A list of (advancement, score) tuples, best matches first.
+        """
+        return self._search_index.search(query, limit, prefix, require_all, datapack)
+
+    def complete(self, prefix: str, limit: int | None = 10, field: str = "mc_path", datapack: str | None = None, tab: str | None = None,
+                 adv_type: AdvType | str | None = None, skip_invalid: bool = True,
+                 skip_technical: bool = True) -> list[tuple[str, Advancement | InvalidAdvancement | TechnicalAdvancement]]:
+        """
+        Returns completions of the prefix from all datapacks, merged in alphabetical order, see ``AdvancementManager.complete``.
+        :param prefix: Start of the mc_path (case-sensitive) or title (case-insensitive).
+        :param limit: Maximum number of completions, None if no limit.
+        :param field: Attribute to complete, one of ``constants.COMPLETION_FIELDS``.
+        :param datapack: Name of the datapack to complete from, if None, all datapacks are used.
+        :param tab: Return only advancements of this tab.
+        :param adv_type: Return only advancements of this AdvType (instance or name).
+        :param skip_invalid: Skip invalid Advancement if True.
+        :param skip_technical: Skip technical Advancement if True.
+        :return: A list of (completed value, advancement) tuples in alphabetical order.
+        :raises KeyError: if the datapack does not exist
+        :raises ValueError: If the field does not support completions.
+        """
+        datapacks = [self.get_datapack(datapack)] if datapack is not None else self.datapacks
+        iterators = [dp.advancement_manager.iter_completions(prefix, field, tab, adv_type, skip_invalid, skip_technical) for dp in datapacks]
+        key = (lambda completion: completion[0]) if field == "mc_path" else (lambda completion: completion[0].casefold())
+        return list(islice(heapq.merge(*iterators, key=key), limit))
+
+    def diff(self, other: "Parser") -> "DiffReport":
+        """
+        Compares datapacks of this (old) and other (new) parser, datapacks are matched by name and advancements by mc_path.
+        All advancements of a datapack that exists only in one parser are reported as added or removed.
+        :param other: Parser with the new versions of the datapacks.
+        :return: DiffReport with added, removed and changed advancements.
+        """
+        from .Diff import DiffReport, diff_advancements
+        entries = []
+        for name in sorted(self._datapacks.keys() | other.datapacks_dict.keys()):
+            old, new = self._datapacks.get(name), other.datapacks_dict.get(name)
+            if old is not None and new is not None and old.fingerprint == new.fingerprint:
+                continue
+            entries.extend(diff_advancements(name, old.advancement_manager.adv_list if old is not None else (),
+                                             new.advancement_manager.adv_list if new is not None else ()))
+        return DiffReport(entries)
+
+    def memory_report(self, fields: bool = True, load_trace: dict | None = None) -> "MemoryReport":
+        """
+        Measures the deep size of the loaded model by class, datapack and advancement field (raw JSON and derived data).
+        To include the allocations of the load, load the parser with ``MemoryReport.trace_load``.
+        :param fields: Whether to measure the fields of the advancements.
+        :param load_trace: Allocations of the load returned by ``MemoryReport.trace_load``.
+        :return: MemoryReport instance.
+        """
+        from .MemoryReport import MemoryReport
+        return MemoryReport(self, fields, load_trace)
+
+    def to_shared_memory(self, name: str | None = None) -> "SharedModel":
+        """
+        Builds a read-only copy of all loaded datapacks in a shared memory block, that can be shared between
+        forked worker processes or attached by name with ``SharedModel.attach``.
+        :param name: Name of the shared memory block, if None, a unique name is generated.
+        :return: SharedModel instance that owns the block, call ``unlink`` (or use it as a context manager) to free it.
+        """
+        from .SharedModel import SharedModel
+        return SharedModel.create(self, name)
+
     @property
     def info(self) -> str:
         """
         Returns a summary string containing the number of datapacks and advancements.
         """
-        return f"Datapacks: {len(self._datapacks)}, Advancements: {sum([len(dp.advancement_manager.adv_list) for dp in self._datapacks.values()])}"
+        return (f"Datapacks: {len(self._datapacks)}, Advancements: {sum([len(dp.advancement_manager.adv_list) for dp in self._datapacks.values()])}, "
+                f"Symbols: {len(self.symbol_table)}")
@@ -0,0 +1,213 @@
+import json
+import os
+import pickle
+import tomllib
+from pathlib import Path
+from typing import Any
+
+from .AdvType import AdvType, AdvTypeManager
+from .Color import Color
+from .constants import SNAPSHOT_VERSION
+from .Datapack import Datapack
+from .LangIndex import LangIndex
+from .Parser import Parser
+from .Profiler import LoadObserver
+from .TabNameMapper import TabNameMapper
+from .utils import content_hash, to_collection
+
+
+class ParserConfig:
+    """
+    Description of the datapacks of a Parser in a TOML or JSON file, used by the ``bacap-parser`` command.
+    Relative paths are resolved against the folder of the config file.
+
+    .. code-block:: toml
+
+        snapshot = ".bacap-parser.snapshot"  # optional, false to disable snapshots
+        lang = ["resourcepacks/bacap"]        # optional, sources of the LangIndex
+
+        [[types]]
+        name = "task"
+        frames = "task"
+        colors = "green"
+
+        [[datapacks]]
+        name = "bacaped"
+        path = "datapacks/bacaped"
+        reward_namespace = "bacap_rewards"
+        technical_tabs = ["technical"]
+
+    Datapack tables can also contain ``tab_names``, ``pack_format``, ``strict``, ``include_namespaces``, ``include_tabs``,
+    ``exclude_tabs``, ``skip_technical`` and their own ``types``.
+    """
+
+    def __init__(self, data: dict[str, Any], root: Path, source: bytes = b""):
+        """
+        :param data: Parsed config.
+        :param root: Folder that relative paths are resolved against.
+        :param source: Raw content of the config file, part of the snapshot key.
+        :raises ValueError: If the config does not contain datapacks or advancement types.
+        """
+        self._data = data
+        self._root = root
+        self._source = source
+
+        if not data.get("datapacks"):
+            raise ValueError("Config does not contain any datapacks")
+        self._types = self.__parse_types(data.get("types", []))
+        for spec in data["datapacks"]:
+            if "name" not in spec or "path" not in spec:
+                raise ValueError(f"Datapack {spec} must have a name and a path")
+            if not self._types and "types" not in spec:
+                raise ValueError(f"Datapack \"{spec['name']}\" does not have advancement types")
+
+        snapshot = data.get("snapshot", ".bacap-parser.snapshot")
+        self._snapshot_path = self.resolve(snapshot) if snapshot else None
+
+    @classmethod
+    def from_file(cls, path: Path) -> "ParserConfig":
+        """
+        :param path: Path to a ``.toml`` or ``.json`` config file.
+        :return: ParserConfig instance.
+        :raises FileNotFoundError: If the file does not exist.
+        :raises ValueError: If the file is not a valid config.
+        """
+        if not path.is_file():
+            raise FileNotFoundError(f"Config file \"{path}\" not found")
+
+        source = path.read_bytes()
+        try:
+            data = json.loads(source) if path.suffix == ".json" else tomllib.loads(source.decode("utf-8"))
+        except (json.JSONDecodeError, tomllib.TOMLDecodeError, UnicodeDecodeError) as e:
+            raise ValueError(f"Invalid config file \"{path}\": {e}")
+        return cls(data, path.resolve().parent, source)
+
+    @staticmethod
+    def __parse_types(specs: list[dict[str, Any]]) -> list[AdvType]:
+        types = []
+        for spec in specs:
+            hidden_color = spec.get("hidden_color")
+            types.append(AdvType(name=spec["name"], frames=spec["frames"], colors=[Color(color) for color in to_collection(spec["colors"], list)],
+                                 tabs=spec.get("tabs"), hidden_color=Color(hidden_color) if hidden_color else None))
+        return types
+
+    def resolve(self, path: str) -> Path:
+        """
+        :param path: Path from the config.
+        :return: Absolute path, relative paths are resolved against the folder of the config file.
+        """
+        return self._root / Path(path).expanduser()
+
+    @property
+    def datapacks(self) -> list[dict[str, Any]]:
+        """
+        :return: Datapack tables of the config.
+        """
+        return self._data["datapacks"]
+
+    @property
+    def snapshot_path(self) -> Path | None:
+        """
+        :return: Path to the snapshot file, None if snapshots are disabled.
+        """
+        return self._snapshot_path
+
+    def build(self, observer: LoadObserver | None = None) -> Parser:
+        """
+        Parses all datapacks of the config.
+        :param observer: LoadObserver passed to every Datapack.
+        :return: Parser instance with the datapacks.
+        """
+        parser = Parser()
+        for spec in self.datapacks:
+            types = self.__parse_types(spec["types"]) if "types" in spec else self._types
+            parser.add_datapack(Datapack(
+                name=spec["name"], path=self.resolve(spec["path"]), adv_type_manager=AdvTypeManager(*types),
+                reward_namespace=spec.get("reward_namespace"), technical_tabs=spec.get("technical_tabs"),
+                tab_name_mapper=TabNameMapper(spec.get("tab_names")), symbol_table=parser.symbol_table, observer=observer,
+                pack_format=spec.get("pack_format"), strict=spec.get("strict", True), include_namespaces=spec.get("include_namespaces"),
+                include_tabs=spec.get("include_tabs"), exclude_tabs=spec.get("exclude_tabs"), skip_technical=spec.get("skip_technical", False)
+            ))
+
+        if self._data.get("lang"):
+            storage = self._data.get("lang_storage")
+            parser.lang_index = LangIndex(*(self.resolve(source) for source in to_collection(self._data["lang"], list)),
+                                          storage=self.resolve(storage) if storage else None)
+        return parser
+
+    def snapshot_key(self) -> str:
+        """
+        Computes the key of the parsed state: the config content, and the relative path, size and modification time
+        of every file of the datapacks. Only file metadata is read, not the files.
+        :return: Hex digest.
+        """
+        parts = [SNAPSHOT_VERSION, self._source.decode("utf-8", "replace")]
+        for spec in self.datapacks:
+            root = str(self.resolve(spec["path"]))
+            parts.append(root)
+            stack = [root]
+            while stack:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in sorted(entries, key=lambda e: e.name):
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        else:
+                            stat = entry.stat()
+                            parts.append(f"{entry.path[len(root):]}:{stat.st_size}:{stat.st_mtime_ns}")
+        return content_hash(*parts)
+
+    def load_snapshot(self, key: str | None = None) -> Parser | None:
+        """
+        :param key: Snapshot key, if None, it is computed with ``snapshot_key``.
+        :return: Parser stored in the snapshot, None if snapshots are disabled, the snapshot does not exist or is outdated.
+        """
+        if self._snapshot_path is None or not self._snapshot_path.is_file():
+            return None
+
+        key = key if key is not None else self.snapshot_key()
+        try:
+            with self._snapshot_path.open("rb") as file:
+                # The header is a separate pickle, so outdated snapshots are rejected without reading the parser
+                if pickle.load(file) != {"version": SNAPSHOT_VERSION, "key": key}:
+                    return None
+                return pickle.load(file)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            return None
+
+    def save_snapshot(self, parser: Parser, key: str | None = None):
+        """
+        Writes the parser to the snapshot file, the file is replaced atomically.
+        :param parser: Parser built from this config.
+        :param key: Snapshot key, if None, it is computed with ``snapshot_key``.
+        """
+        if self._snapshot_path is None:
+            return
+
+        key = key if key is not None else self.snapshot_key()
+        self._snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = self._snapshot_path.with_suffix(f".{os.getpid()}.tmp")
+        with temporary_path.open("wb") as file:
+            pickle.dump({"version": SNAPSHOT_VERSION, "key": key}, file, pickle.HIGHEST_PROTOCOL)
+            pickle.dump(parser, file, pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_path, self._snapshot_path)
+
+    def load(self, use_snapshot: bool = True) -> tuple[Parser, bool]:
+        """
+        Returns the parser from the snapshot if it is up to date, else parses the datapacks and writes a new snapshot.
+        :param use_snapshot: Whether to read and write the snapshot.
+        :return: Tuple of the Parser and True if it was read from the snapshot, else False.
+        """
+        if not use_snapshot or self._snapshot_path is None:
+            return self.build(), False
+
+        key = self.snapshot_key()
+        parser = self.load_snapshot(key)
+        if parser is not None:
+            return parser, True
+
+        parser = self.build()
+        self.save_snapshot(parser, key)
+        return parser, False
+
+    def __repr__(self):
+        return f"ParserConfig(datapacks: {[spec['name'] for spec in self.datapacks]})"
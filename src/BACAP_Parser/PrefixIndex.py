@@ -0,0 +1,73 @@
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator
+
+
+class PrefixIndex[T]:
+    """
+    Sorted array of (key, value) pairs with binary search prefix and range queries in O(log n + k).
+    Keys and values are stored in two parallel lists, without per-entry objects.
+    """
+
+    def __init__(self, items: Iterable[tuple[str, T]] = (), casefold: bool = False):
+        """
+        :param items: (key, value) pairs to index, several values can have the same key.
+        :param casefold: Whether keys and queries are case-folded.
+        """
+        self._casefold = casefold
+        pairs = sorted(((self._normalize(key), value) for key, value in items), key=lambda pair: pair[0])
+        self._keys: list[str] = [key for key, _ in pairs]
+        self._values: list[T] = [value for _, value in pairs]
+
+    def _normalize(self, key: str) -> str:
+        return key.casefold() if self._casefold else key
+
+    def __bounds(self, lo: str | None, hi: str | None) -> tuple[int, int]:
+        start = bisect_left(self._keys, self._normalize(lo)) if lo is not None else 0
+        end = bisect_left(self._keys, self._normalize(hi)) if hi is not None else len(self._keys)
+        return start, end
+
+    def get(self, key: str) -> list[T]:
+        """
+        :param key: Key to find.
+        :return: Values with exactly this key, in insertion order.
+        """
+        key = self._normalize(key)
+        start = bisect_left(self._keys, key)
+        end = bisect_right(self._keys, key, start)
+        return self._values[start:end]
+
+    def prefix(self, prefix: str) -> Iterator[tuple[str, T]]:
+        """
+        :param prefix: Prefix of the keys.
+        :return: Iterator of (key, value) pairs whose key starts with the prefix, in key order.
+        """
+        prefix = self._normalize(prefix)
+        i = bisect_left(self._keys, prefix)
+        while i < len(self._keys) and self._keys[i].startswith(prefix):
+            yield self._keys[i], self._values[i]
+            i += 1
+
+    def range(self, lo: str | None = None, hi: str | None = None) -> Iterator[tuple[str, T]]:
+        """
+        :param lo: Inclusive lower bound of the keys, None if not bounded.
+        :param hi: Exclusive upper bound of the keys, None if not bounded.
+        :return: Iterator of (key, value) pairs with ``lo <= key < hi``, in key order.
+        """
+        start, end = self.__bounds(lo, hi)
+        for i in range(start, end):
+            yield self._keys[i], self._values[i]
+
+    def values(self) -> Iterator[T]:
+        """
+        :return: Iterator of all values in key order.
+        """
+        return iter(self._values)
+
+    def __iter__(self) -> Iterator[tuple[str, T]]:
+        return zip(self._keys, self._values)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(keys: {len(self._keys)})"
@@ -0,0 +1,133 @@
+import heapq
+import os
+import threading
+from collections.abc import Callable
+from contextvars import ContextVar
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+from .constants import SLOWEST_FILE_STAGE
+
+
+class LoadObserver:
+    """
+    Base class for observers of the datapack loading pipeline.
+
+    Subclasses override ``on_stage``, the base implementation ignores the stages.
+    Pass an instance to ``Datapack(observer=...)`` (or set ``datapack.observer`` before ``reload``) to receive
+    the duration of every loading stage, see ``constants.LOAD_STAGES`` for the stage names.
+    When a datapack has no observer, the loading pipeline does not measure anything.
+    """
+
+    def on_stage(self, stage: str, start: float, duration: float, path: Path | None = None):
+        """
+        Called when a loading stage is finished.
+
+        :param stage: Name of the stage.
+        :param start: ``time.perf_counter()`` value at the start of the stage.
+        :param duration: Duration of the stage in seconds.
+        :param path: Path to the file or folder processed by the stage, if any.
+        """
+
+
+# Observer of the datapack that is being loaded in the current context, None if loading is not profiled
+active_observer: ContextVar[LoadObserver | None] = ContextVar("active_observer", default=None)
+
+
+def timed[T](stage: str, path: Path | None, func: Callable[..., T], *args, **kwargs) -> T:
+    """
+    Calls the function and reports its duration as a stage to the active observer.
+    Must be called only when ``active_observer`` is set.
+
+    :param stage: Name of the stage.
+    :param path: Path to the processed file or folder.
+    :param func: Function to call.
+    :return: Result of the function.
+    """
+    observer = active_observer.get()
+    start = perf_counter()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        observer.on_stage(stage, start, perf_counter() - start, path)
+
+
+class ProfileCollector(LoadObserver):
+    """
+    Built-in LoadObserver that collects cumulative time and count of every stage, the slowest files,
+    and optionally every event for a Chrome trace (``chrome://tracing`` or Perfetto).
+    """
+
+    def __init__(self, slowest: int = 10, trace: bool = False):
+        """
+        :param slowest: How many slowest advancement files to keep.
+        :param trace: Whether to keep every event to export them with ``to_chrome_trace``.
+        """
+        self._slowest_count = slowest
+        self._trace = trace
+        self._origin = perf_counter()
+        self._lock = threading.Lock()
+        self._stages: dict[str, list[float | int]] = {}
+        self._slowest: list[tuple[float, str]] = []
+        self._events: list[dict[str, Any]] = []
+
+    def on_stage(self, stage: str, start: float, duration: float, path: Path | None = None):
+        with self._lock:
+            totals = self._stages.get(stage)
+            if totals is None:
+                totals = self._stages[stage] = [0.0, 0]
+            totals[0] += duration
+            totals[1] += 1
+
+            if stage == SLOWEST_FILE_STAGE and path is not None:
+                if len(self._slowest) < self._slowest_count:
+                    heapq.heappush(self._slowest, (duration, str(path)))
+                elif self._slowest and duration > self._slowest[0][0]:
+                    heapq.heapreplace(self._slowest, (duration, str(path)))
+
+            if self._trace:
+                self._events.append({
+                    "name": stage, "ph": "X", "pid": os.getpid(), "tid": threading.get_ident(),
+                    "ts": (start - self._origin) * 1_000_000, "dur": duration * 1_000_000,
+                    "args": {"path": str(path)} if path is not None else {}
+                })
+
+    @property
+    def slowest_files(self) -> list[tuple[str, float]]:
+        """
+        :return: A list of (path, duration in seconds) of the slowest advancement files, the slowest first.
+        """
+        return [(path, duration) for duration, path in sorted(self._slowest, reverse=True)]
+
+    def as_dict(self) -> dict[str, Any]:
+        """
+        :return: Dict with cumulative ``total`` time (seconds), ``count`` and ``mean`` time of every stage, and the slowest files.
+        """
+        return {
+            "stages": {stage: {"total": total, "count": count, "mean": total / count if count else 0.0}
+                       for stage, (total, count) in self._stages.items()},
+            "slowest_files": [{"path": path, "duration": duration} for path, duration in self.slowest_files]
+        }
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """
+        :return: Chrome trace event format dict, that can be saved with ``json.dump`` and opened in ``chrome://tracing``.
+        :raises ValueError: If the collector was created without ``trace=True``.
+        """
+        if not self._trace:
+            raise ValueError("ProfileCollector was created without trace=True")
+        return {"traceEvents": list(self._events), "displayTimeUnit": "ms"}
+
+    def reset(self):
+        """
+        Removes all collected data.
+        """
+        with self._lock:
+            self._origin = perf_counter()
+            self._stages.clear()
+            self._slowest.clear()
+            self._events.clear()
+
+    def __repr__(self):
+        return f"ProfileCollector(stages: {len(self._stages)})"
@@ -0,0 +1,381 @@
+import gzip
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import islice
+from typing import Any
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from .Advancement import Advancement, BaseAdvancement, InvalidAdvancement, TechnicalAdvancement
+from .constants import SERVER_CACHE_SIZE, SERVER_GZIP_MIN_SIZE, SERVER_MAX_LIMIT
+from .Diff import _criteria_snapshot, _snapshot
+from .Parser import Parser
+
+
+class _QueryError(Exception):
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def _summary(adv: BaseAdvancement) -> dict[str, Any]:
+    summary = {"datapack": adv.datapack.name, "mc_path": adv.mc_path, "class": type(adv).__name__}
+    if isinstance(adv, Advancement):
+        summary.update({"title": adv.title, "tab": adv.tab, "type": adv.type.name, "hidden": adv.hidden})
+    return summary
+
+
+def _details(adv: BaseAdvancement) -> dict[str, Any]:
+    return {"datapack": adv.datapack.name, "mc_path": adv.mc_path, **_snapshot(adv), "criteria": _criteria_snapshot(adv)}
+
+
+class _Model:
+    """
+    Parser with its ETag and lazily built views. A new model replaces the old one on reload,
+    so requests that already hold the old model finish with consistent data.
+    The ETag follows the parser fingerprint, views are rebuilt when the parser is reloaded in place.
+    """
+
+    def __init__(self, parser: Parser):
+        self.parser = parser
+        self.etag = parser.fingerprint
+        # path -> (etag, body, gzipped body or None), the least recently used responses are evicted first
+        self._responses: OrderedDict[str, tuple[str, bytes, bytes | None]] = OrderedDict()
+        self._children: dict[str, dict[str | None, list[BaseAdvancement]]] = {}
+        self._lock = threading.Lock()
+
+    def refresh(self) -> str:
+        """
+        Drops the views built before the parser was changed in place, e.g. by ``Parser.reload``.
+        :return: Current ETag of the parser, without quotes.
+        """
+        etag = self.parser.fingerprint
+        if etag != self.etag:
+            with self._lock:
+                if etag != self.etag:
+                    self._responses = OrderedDict()
+                    self._children = {}
+                    self.etag = etag
+        return etag
+
+    def response(self, path: str, etag: str) -> tuple[str, bytes, bytes | None] | None:
+        """
+        :return: Cached (etag, body, gzipped body or None) of the path rendered for the ETag, or None.
+        """
+        with self._lock:
+            cached = self._responses.get(path)
+            if cached is None or cached[0] != etag:
+                return None
+            self._responses.move_to_end(path)
+            return cached
+
+    def store(self, path: str, response: tuple[str, bytes, bytes | None]):
+        """
+        Caches a rendered response, the least recently used one is evicted if the cache is full.
+        """
+        with self._lock:
+            self._responses[path] = response
+            self._responses.move_to_end(path)
+            if len(self._responses) > SERVER_CACHE_SIZE:
+                self._responses.popitem(last=False)
+
+    def children(self, datapack: str) -> dict[str | None, list[BaseAdvancement]]:
+        """
+        :return: Dict where key is a parent mc_path (None for roots) and value is a list of its children sorted by mc_path.
+        """
+        children = self._children.get(datapack)
+        if children is None:
+            with self._lock:
+                children = self._children.get(datapack)
+                if children is None:
+                    adv_list = self.parser.get_datapack(datapack).advancement_manager.adv_list
+                    mc_paths = {adv.mc_path for adv in adv_list}
+                    children = {}
+                    for adv in sorted(adv_list, key=lambda adv: adv.mc_path):
+                        parent = adv.parent if adv.parent in mc_paths else None
+                        children.setdefault(parent, []).append(adv)
+                    self._children[datapack] = children
+        return children
+
+
+class QueryServer:
+    """
+    Read-only HTTP service with JSON endpoints over a loaded Parser, based on ``http.server``.
+
+    Requests are handled in threads and only read the parser, ``reload`` builds a new parser in the background
+    of the running server and replaces it atomically. Responses have an ETag of the parser fingerprint (with a ``-gzip`` suffix
+    for compressed bodies), requests with a matching ``If-None-Match`` get ``304 Not Modified``, and rendered responses are cached
+    until the fingerprint changes, also when the served parser is reloaded in place.
+
+    Endpoints:
+        - ``/datapacks`` — datapacks with their fingerprints and advancement counts
+        - ``/advancements?datapack=&tab=&type=&kind=&hidden=&offset=&limit=`` — filtered list of advancements
+        - ``/advancement/<mc_path>?datapack=`` — parsed fields and criteria of the advancement in every (or one) datapack
+        - ``/search?q=&datapack=&limit=`` — full-text search
+        - ``/tree?datapack=&root=&depth=`` — advancement tree by parents
+        - ``/stats`` — ``AdvancementStats.summary``
+    """
+
+    def __init__(self, parser: Parser | None = None, loader: Callable[[], Parser] | None = None, host: str = "127.0.0.1", port: int = 8080,
+                 verbose: bool = False):
+        """
+        :param parser: Loaded Parser, if None, it is created with the loader.
+        :param loader: Function that creates a new Parser, used by ``reload``, e.g. ``lambda: config.load()[0]``.
+        :param host: Host to listen on.
+        :param port: Port to listen on, 0 to choose a free port.
+        :param verbose: Whether to log every request to stderr.
+        :raises ValueError: If neither parser nor loader is given.
+        """
+        if parser is None:
+            if loader is None:
+                raise ValueError("Either parser or loader must be given")
+            parser = loader()
+        self._loader = loader
+        self._model = _Model(parser)
+        self._reload_lock = threading.Lock()
+        self._verbose = verbose
+        self._thread: threading.Thread | None = None
+        self._server = ThreadingHTTPServer((host, port), self.__handler_class())
+        self._server.daemon_threads = True
+
+    def __handler_class(self) -> type[BaseHTTPRequestHandler]:
+        service = self
+
+        class Handler(BaseHTTPRequestHandler):
+            server_version = "BACAP_Parser"
+
+            def do_GET(self):
+                service._handle(self, send_body=True)
+
+            def do_HEAD(self):
+                service._handle(self, send_body=False)
+
+            def log_message(self, format, *args):
+                if service._verbose:
+                    super().log_message(format, *args)
+
+        return Handler
+
+    @property
+    def parser(self) -> Parser:
+        """
+        :return: Parser that is currently served.
+        """
+        return self._model.parser
+
+    @property
+    def url(self) -> str:
+        """
+        :return: Base URL of the server.
+        """
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def reload(self, parser: Parser | None = None):
+        """
+        Replaces the served parser, requests that are being handled finish with the old one.
+        :param parser: New Parser, if None, it is created with the loader.
+        :raises ValueError: If the parser is not given and the server does not have a loader.
+        """
+        with self._reload_lock:
+            if parser is None:
+                if self._loader is None:
+                    raise ValueError("Server does not have a loader")
+                parser = self._loader()
+            self._model = _Model(parser)
+
+    def serve_forever(self):
+        """
+        Handles requests until ``shutdown`` is called.
+        """
+        self._server.serve_forever()
+
+    def start(self) -> "QueryServer":
+        """
+        Starts handling requests in a daemon thread.
+        :return: The server itself.
+        """
+        self._thread = threading.Thread(target=self._server.serve_forever, name="QueryServer", daemon=True)
+        self._thread.start()
+        return self
+
+    def shutdown(self):
+        """
+        Stops the server and closes its socket.
+        """
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
+
+    @staticmethod
+    def __not_modified(request: BaseHTTPRequestHandler, etag: str) -> bool:
+        if_none_match = request.headers.get("If-None-Match")
+        if if_none_match is None:
+            return False
+        # Weak comparison, as for GET and HEAD in RFC 9110
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in tags or etag in tags
+
+    def _handle(self, request: BaseHTTPRequestHandler, send_body: bool):
+        model = self._model
+        etag = model.refresh()
+
+        # Requests are routed before the If-None-Match check, so unknown endpoints and missing resources are never 304
+        status = HTTPStatus.OK
+        cached = model.response(request.path, etag)
+        if cached is None:
+            try:
+                body = json.dumps(self.__route(model, request.path), ensure_ascii=False).encode("utf-8")
+            except _QueryError as e:
+                status, body = e.status, json.dumps({"error": str(e)}).encode("utf-8")
+            compressed = gzip.compress(body, compresslevel=5) if len(body) >= SERVER_GZIP_MIN_SIZE else None
+            cached = (etag, body, compressed)
+            if status == HTTPStatus.OK:
+                model.store(request.path, cached)
+
+        _, body, compressed = cached
+        use_gzip = compressed is not None and "gzip" in request.headers.get("Accept-Encoding", "")
+        payload = compressed if use_gzip else body
+        # Gzipped and identity bodies are different representations with their own ETags
+        response_etag = f"\"{etag}-gzip\"" if use_gzip else f"\"{etag}\""
+
+        if status == HTTPStatus.OK and self.__not_modified(request, response_etag):
+            request.send_response(HTTPStatus.NOT_MODIFIED)
+            request.send_header("ETag", response_etag)
+            request.send_header("Vary", "Accept-Encoding")
+            request.end_headers()
+            return
+
+        request.send_response(status)
+        request.send_header("Content-Type", "application/json; charset=utf-8")
+        request.send_header("Content-Length", str(len(payload)))
+        request.send_header("Vary", "Accept-Encoding")
+        if use_gzip:
+            request.send_header("Content-Encoding", "gzip")
+        if status == HTTPStatus.OK:
+            request.send_header("ETag", response_etag)
+        request.end_headers()
+        if send_body:
+            request.wfile.write(payload)
+
+    def __route(self, model: _Model, path: str) -> Any:
+        url = urlsplit(path)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        route = url.path.rstrip("/") or "/datapacks"
+
+        if route == "/datapacks":
+            return self.__datapacks(model)
+        if route == "/advancements":
+            return self.__advancements(model, query)
+        if route.startswith("/advancement/"):
+            return self.__advancement(model, unquote(route[len("/advancement/"):]), query)
+        if route == "/search":
+            return self.__search(model, query)
+        if route == "/tree":
+            return self.__tree(model, query)
+        if route == "/stats":
+            return model.parser.stats().summary()
+        raise _QueryError(HTTPStatus.NOT_FOUND, f"Unknown endpoint \"{url.path}\"")
+
+    @staticmethod
+    def __int(query: dict[str, str], name: str, default: int | None, maximum: int | None = None) -> int | None:
+        if name not in query:
+            return default
+        try:
+            value = int(query[name])
+        except ValueError:
+            raise _QueryError(HTTPStatus.BAD_REQUEST, f"Parameter \"{name}\" must be an integer")
+        if value < 0:
+            raise _QueryError(HTTPStatus.BAD_REQUEST, f"Parameter \"{name}\" must not be negative")
+        return min(value, maximum) if maximum is not None else value
+
+    @staticmethod
+    def __datapack_names(model: _Model, query: dict[str, str]) -> list[str]:
+        name = query.get("datapack")
+        if name is None:
+            return list(model.parser.datapacks_dict)
+        if name not in model.parser.datapacks_dict:
+            raise _QueryError(HTTPStatus.NOT_FOUND, f"Datapack \"{name}\" not found")
+        return [name]
+
+    @staticmethod
+    def __datapacks(model: _Model) -> list[dict[str, Any]]:
+        return [{"name": datapack.name, "fingerprint": datapack.fingerprint, "pack_format": datapack.pack_format,
+                 "advancements": len(datapack.advancement_manager.adv_list)} for datapack in model.parser.datapacks]
+
+    def __advancements(self, model: _Model, query: dict[str, str]) -> dict[str, Any]:
+        kinds = {"normal": Advancement, "technical": TechnicalAdvancement, "invalid": InvalidAdvancement}
+        kind = kinds.get(query.get("kind", "normal"))
+        if kind is None:
+            raise _QueryError(HTTPStatus.BAD_REQUEST, f"Parameter \"kind\" must be one of {list(kinds)}")
+        hidden = query.get("hidden")
+        if hidden not in (None, "true", "false"):
+            raise _QueryError(HTTPStatus.BAD_REQUEST, "Parameter \"hidden\" must be true or false")
+        tab, adv_type = query.get("tab"), query.get("type")
+
+        def matches(adv: BaseAdvancement) -> bool:
+            if not isinstance(adv, kind):
+                return False
+            if kind is not Advancement:
+                return True
+            return ((tab is None or adv.tab == tab) and (adv_type is None or adv.type.name == adv_type)
+                    and (hidden is None or adv.hidden == (hidden == "true")))
+
+        offset = self.__int(query, "offset", 0)
+        limit = self.__int(query, "limit", SERVER_MAX_LIMIT, SERVER_MAX_LIMIT)
+        advancements = (adv for name in self.__datapack_names(model, query)
+                        for adv in model.parser.get_datapack(name).advancement_manager.adv_list if matches(adv))
+        items = [_summary(adv) for adv in islice(advancements, offset, offset + limit)]
+        return {"offset": offset, "limit": limit, "items": items}
+
+    def __advancement(self, model: _Model, mc_path: str, query: dict[str, str]) -> list[dict[str, Any]]:
+        found = [_details(adv) for name in self.__datapack_names(model, query)
+                 for adv in model.parser.get_datapack(name).advancement_manager.mc_path_index.get(mc_path)]
+        if not found:
+            raise _QueryError(HTTPStatus.NOT_FOUND, f"Advancement \"{mc_path}\" not found")
+        return found
+
+    def __search(self, model: _Model, query: dict[str, str]) -> list[dict[str, Any]]:
+        text = query.get("q")
+        if not text:
+            raise _QueryError(HTTPStatus.BAD_REQUEST, "Parameter \"q\" is required")
+        datapack = self.__datapack_names(model, query)[0] if "datapack" in query else None
+        limit = self.__int(query, "limit", 10, SERVER_MAX_LIMIT)
+        return [{**_summary(adv), "score": score} for adv, score in model.parser.search(text, limit=limit, datapack=datapack)]
+
+    def __tree(self, model: _Model, query: dict[str, str]) -> list[dict[str, Any]]:
+        if "datapack" not in query:
+            raise _QueryError(HTTPStatus.BAD_REQUEST, "Parameter \"datapack\" is required")
+        datapack = self.__datapack_names(model, query)[0]
+        depth = self.__int(query, "depth", None)
+        children = model.children(datapack)
+
+        root = query.get("root")
+        if root is None:
+            roots = children.get(None, [])
+        else:
+            roots = [adv for advs in children.values() for adv in advs if adv.mc_path == root]
+            if not roots:
+                raise _QueryError(HTTPStatus.NOT_FOUND, f"Advancement \"{root}\" not found")
+
+        def node(adv: BaseAdvancement, level: int) -> dict[str, Any]:
+            result = _summary(adv)
+            if depth is None or level < depth:
+                result["children"] = [node(child, level + 1) for child in children.get(adv.mc_path, ())]
+            return result
+
+        return [node(adv, 0) for adv in roots]
+
+    def __repr__(self):
+        return f"QueryServer({self.url})"
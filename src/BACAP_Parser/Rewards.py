@@ -1,5 +1,5 @@
 import re
-from collections.abc import MutableSequence
+from collections.abc import Callable, MutableSequence
 from pathlib import Path
 
 from .ExtendedDict import ExtendedDict
@@ -9,6 +9,17 @@ from .patterns import reward_give_pattern, reward_summon_pattern, trophy_give_pa
 from .components_decoder import components_decoder
 from .Item import RewardItem, TrophyItem
 from .Color import Color
+from .Profiler import active_observer, timed
+from .TextComponent import TextComponent
+
+
+def _decode[T](decoder: Callable[[str], T], value: str, path: Path) -> T:
+    """
+    Decodes components or NBT, reporting the duration to the active LoadObserver if there is one.
+    """
+    if active_observer.get() is None:
+        return decoder(value)
+    return timed("nbt_decoding", path, decoder, value)
 
 
 class DefaultReward:
@@ -114,15 +125,15 @@ class Reward(DefaultReward):
             command_data = match.groupdict()
             self._command_type = "give"
 
-            components = components_decoder(command_data["components"]) if command_data.get("components") else None
+            components = _decode(components_decoder, command_data["components"], self._path) if command_data.get("components") else None
             return self.__item_class(command_data["item_id"], components, item_type, command_data["amount"])
 
         match = re.search(reward_summon_pattern, self._raw_text)
         if match:
-            nbt_data = nbt_decoder(match.groupdict()["nbt"])
+            nbt_data = _decode(nbt_decoder, match.groupdict()["nbt"], self._path)
             self._command_type = "summon"
 
-            return self.__item_class(nbt_data["Item"]["id"], nbt_data["Item"]["count"], item_type, nbt_data["Item"].get("components"))
+            return self.__item_class(nbt_data["Item"]["id"], nbt_data["Item"].get("components"), item_type, nbt_data["Item"]["count"])
 
         return None
 
@@ -166,10 +177,8 @@ class Trophy(DefaultReward):
         desc_list = []
 
         for line in lore[:-3]:
-            if isinstance(line, ExtendedDict):
-                desc_list.append(line.get_with_multiple_values("text", "translate"))
-            elif isinstance(line, list):
-                desc_list.append("".join([element.get_with_multiple_values("text", "translate") for element in line]))
+            if isinstance(line, (ExtendedDict, list)):
+                desc_list.append(TextComponent.of(line).plain)
         return desc_list
 
     def __parse_trophy(self) -> TrophyItem | None:
@@ -180,7 +189,7 @@ class Trophy(DefaultReward):
         if give_search:
             self._command_type = "give"
             item_id = give_search["item_id"]
-            components = components_decoder(give_search.groupdict()["components"])
+            components = _decode(components_decoder, give_search.groupdict()["components"], self._path)
 
         else:
             summon_search = re.search(trophy_summon_pattern, self._raw_text)
@@ -188,13 +197,13 @@ class Trophy(DefaultReward):
                 return None
 
             self._command_type = "summon"
-            nbt = nbt_decoder(summon_search.groupdict()["nbt"])
+            nbt = _decode(nbt_decoder, summon_search.groupdict()["nbt"], self._path)
             item_id = nbt["Item"]["id"]
             components = nbt["Item"]["components"]
 
         custom_name = components.get_with_multiple_values("custom_name", "item_name")
-        name = custom_name.get_with_multiple_values("text", "translate")
-        color = custom_name.get("color", None)
+        name = TextComponent.of(custom_name).plain
+        color = custom_name.get("color", None) if isinstance(custom_name, dict) else None
 
         if color:
             color = Color(color)
@@ -0,0 +1,286 @@
+from collections.abc import Callable, Hashable, Iterable, Iterator, Sequence
+from typing import Any
+
+_MISSING = object()
+
+
+class SchemaError(ValueError):
+    """
+    Exception returned by ``AdvancementSchema.extract`` when a field is missing or has a wrong type,
+    and the field does not declare its own error.
+    """
+
+    def __init__(self, field: str, keypath: str, message: str):
+        """
+        :param field: Name of the field.
+        :param keypath: Dotted key-path of the value, e.g. ``display.title.translate``.
+        :param message: Description of the problem.
+        """
+        super().__init__(f"Field \"{field}\" ({keypath}): {message}")
+        self.field = field
+        self.keypath = keypath
+        self.message = message
+
+    def __reduce__(self):
+        return SchemaError, (self.field, self.keypath, self.message)
+
+
+class SchemaField:
+    """
+    A value extracted from the advancement JSON by an AdvancementSchema.
+    """
+    __slots__ = ("_name", "_keypaths", "_types", "_required", "_default", "_error")
+
+    def __init__(self, name: str, *keypaths: Sequence[Hashable], types: type | tuple[type, ...] | None = None, required: bool = False,
+                 default: Any = None, error: Callable[[], Exception] | None = None):
+        """
+        :param name: Name of the field in the AdvancementRecord.
+        :param keypaths: Key-paths of the value, e.g. ``("display", "title", "translate")``.
+        If several key-paths are given, the first existing one is used.
+        :param types: Allowed types of the value, if None, any type is allowed.
+        :param required: Whether the advancement is invalid without the value.
+        :param default: Value of the field if no key-path exists.
+        :param error: Factory of the exception returned if the required value is missing, if None, a SchemaError is returned.
+        :raises ValueError: If no key-path is given or a key-path is empty.
+        """
+        if not keypaths or not all(keypaths):
+            raise ValueError(f"Field \"{name}\" must have at least one non-empty key-path")
+        self._name = name
+        self._keypaths = tuple(tuple(keypath) for keypath in keypaths)
+        self._types = types
+        self._required = required
+        self._default = default
+        self._error = error
+
+    @property
+    def name(self) -> str:
+        """
+        :return: Name of the field.
+        """
+        return self._name
+
+    @property
+    def keypaths(self) -> tuple[tuple[Hashable, ...], ...]:
+        """
+        :return: Key-paths of the value, the first existing one is used.
+        """
+        return self._keypaths
+
+    @property
+    def types(self) -> type | tuple[type, ...] | None:
+        """
+        :return: Allowed types of the value, None if any type is allowed.
+        """
+        return self._types
+
+    @property
+    def required(self) -> bool:
+        """
+        :return: Whether the advancement is invalid without the value.
+        """
+        return self._required
+
+    @property
+    def default(self) -> Any:
+        """
+        :return: Value of the field if no key-path exists.
+        """
+        return self._default
+
+    @property
+    def error(self) -> Callable[[], Exception] | None:
+        """
+        :return: Factory of the exception returned if the required value is missing.
+        """
+        return self._error
+
+    def __repr__(self):
+        keypaths = " | ".join(".".join(map(str, keypath)) for keypath in self._keypaths)
+        return f"SchemaField('{self._name}', {keypaths})"
+
+
+class AdvancementRecord:
+    """
+    Compact record of the values extracted by an AdvancementSchema.
+    """
+    __slots__ = ("_schema", "_values")
+
+    def __init__(self, schema: "AdvancementSchema", values: tuple):
+        """
+        :param schema: AdvancementSchema that extracted the values.
+        :param values: Values in the order of the schema fields.
+        """
+        self._schema = schema
+        self._values = values
+
+    @property
+    def schema(self) -> "AdvancementSchema":
+        """
+        :return: AdvancementSchema that extracted the values.
+        """
+        return self._schema
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """
+        :param name: Name of the field.
+        :param default: Value returned if the schema does not have the field.
+        :return: Value of the field.
+        """
+        index = self._schema.index(name)
+        return self._values[index] if index is not None else default
+
+    def as_dict(self) -> dict[str, Any]:
+        """
+        :return: Dict where key is a field name and value is its value.
+        """
+        return dict(zip(self._schema.field_names, self._values))
+
+    def __getitem__(self, name: str) -> Any:
+        index = self._schema.index(name)
+        if index is None:
+            raise KeyError(name)
+        return self._values[index]
+
+    def __contains__(self, name: str) -> bool:
+        return self._schema.index(name) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._schema.field_names)
+
+    def __eq__(self, other):
+        if not isinstance(other, AdvancementRecord):
+            return NotImplemented
+        return self._schema.field_names == other._schema.field_names and self._values == other._values
+
+    # Records contain dicts and lists of the JSON (e.g. the icon), so they are not hashable
+    __hash__ = None
+
+    def __repr__(self):
+        return f"AdvancementRecord({self.as_dict()})"
+
+
+class AdvancementSchema:
+    """
+    Declarative schema of the advancement JSON. The key-paths of all fields are compiled once into a tree,
+    so ``extract`` validates and extracts every field in a single traversal of the JSON.
+    """
+
+    def __init__(self, fields: Iterable[SchemaField]):
+        """
+        :param fields: Fields of the schema, required fields are checked in this order.
+        :raises ValueError: If two fields have the same name.
+        """
+        self._fields = tuple(fields)
+        self._index: dict[str, int] = {}
+        for i, field in enumerate(self._fields):
+            if field.name in self._index:
+                raise ValueError(f"Duplicate schema field \"{field.name}\"")
+            self._index[field.name] = i
+
+        # Every key-path gets a slot, slots of a field are stored in the order of its key-paths
+        self._field_slots: list[tuple[int, ...]] = []
+        self._tree: dict[Hashable, tuple[dict, tuple[int, ...]]] = {}
+        slot = 0
+        for field in self._fields:
+            slots = []
+            for keypath in field.keypaths:
+                self.__add_keypath(keypath, slot)
+                slots.append(slot)
+                slot += 1
+            self._field_slots.append(tuple(slots))
+        self._slot_count = slot
+        self._plan = [(field, slots, field.types, field.required, field.default) for field, slots in zip(self._fields, self._field_slots)]
+
+    def __add_keypath(self, keypath: tuple[Hashable, ...], slot: int):
+        node = self._tree
+        for depth, key in enumerate(keypath):
+            children, leaf_slots = node.get(key, ({}, ()))
+            if depth == len(keypath) - 1:
+                leaf_slots += (slot,)
+            node[key] = (children, leaf_slots)
+            node = children
+
+    def __walk(self, node: dict, data: dict, slots: list):
+        for key, (children, leaf_slots) in node.items():
+            value = data.get(key, _MISSING)
+            if value is _MISSING:
+                continue
+            for slot in leaf_slots:
+                slots[slot] = value
+            if children and isinstance(value, dict):
+                self.__walk(children, value, slots)
+
+    @property
+    def fields(self) -> tuple[SchemaField, ...]:
+        """
+        :return: Fields of the schema.
+        """
+        return self._fields
+
+    @property
+    def field_names(self) -> tuple[str, ...]:
+        """
+        :return: Names of the fields in the schema order.
+        """
+        return tuple(self._index)
+
+    def index(self, name: str) -> int | None:
+        """
+        :param name: Name of the field.
+        :return: Position of the field in the records, None if the schema does not have the field.
+        """
+        return self._index.get(name)
+
+    def extend(self, *fields: SchemaField) -> "AdvancementSchema":
+        """
+        :param fields: Additional fields, e.g. values of a custom addon format.
+        :return: A new schema with the fields of this schema and the additional fields.
+        """
+        return AdvancementSchema(self._fields + fields)
+
+    def extract(self, data: dict | None) -> AdvancementRecord | Exception:
+        """
+        :param data: Parsed advancement JSON.
+        :return: AdvancementRecord with the values of all fields, or the exception that describes the first invalid field.
+        """
+        slots = [_MISSING] * self._slot_count
+        if isinstance(data, dict):
+            self.__walk(self._tree, data, slots)
+
+        values = []
+        for field, field_slots, types, required, default in self._plan:
+            value = _MISSING
+            for slot in field_slots:
+                value = slots[slot]
+                if value is not _MISSING:
+                    break
+
+            if value is _MISSING:
+                if required:
+                    if field.error is not None:
+                        return field.error()
+                    return SchemaError(field.name, self.__keypath_string(field), "required value is missing")
+                value = default
+
+            elif types is not None and not isinstance(value, types):
+                return SchemaError(field.name, self.__keypath_string(field), f"expected {self.__types_string(types)}, got {type(value).__name__}")
+            values.append(value)
+
+        return AdvancementRecord(self, tuple(values))
+
+    @staticmethod
+    def __keypath_string(field: SchemaField) -> str:
+        return " | ".join(".".join(map(str, keypath)) for keypath in field.keypaths)
+
+    @staticmethod
+    def __types_string(types: type | tuple[type, ...]) -> str:
+        return " | ".join(t.__name__ for t in (types if isinstance(types, tuple) else (types,)))
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._index
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def __repr__(self):
+        return f"AdvancementSchema({list(self._index)})"
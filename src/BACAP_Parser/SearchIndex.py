@@ -0,0 +1,175 @@
+import math
+from bisect import bisect_left
+from collections.abc import Iterable
+from functools import reduce
+
+from .Advancement import Advancement, BaseAdvancement
+from .constants import SEARCH_FIELD_WEIGHTS, SEARCH_MAX_PREFIX_EXPANSIONS
+from .patterns import search_token_pattern
+
+
+def tokenize(text: str | None) -> list[str]:
+    """
+    :param text: Text to split into search terms.
+    :return: A list of case-folded words of the text.
+    """
+    if not text:
+        return []
+    return search_token_pattern.findall(text.casefold())
+
+
+class SearchIndex:
+    """
+    Full-text inverted index over titles, descriptions, tab names and trophy names/descriptions of the advancements,
+    with prefix matching and BM25 ranking. Fields are weighted according to ``constants.SEARCH_FIELD_WEIGHTS``.
+    Only normal advancements are indexed, technical and invalid advancements do not have these fields.
+    """
+
+    def __init__(self, advancements: Iterable[BaseAdvancement] = (), k1: float = 1.2, b: float = 0.75):
+        """
+        :param advancements: Advancements to index.
+        :param k1: BM25 term frequency saturation parameter.
+        :param b: BM25 document length normalization parameter.
+        """
+        self._k1 = k1
+        self._b = b
+        self._postings: dict[str, dict[int, float]] = {}
+        self._docs: list[Advancement | None] = []
+        self._doc_ids: dict[Advancement, int] = {}
+        self._doc_lengths: list[float] = []
+        self._doc_terms: list[tuple[str, ...]] = []
+        # Ids of removed documents, reused by ``add`` so reloads do not grow the document arrays
+        self._free_ids: list[int] = []
+        self._total_length = 0.0
+        self._sorted_terms: list[str] | None = None
+        self.add(advancements)
+
+    @staticmethod
+    def __field_value(advancement: Advancement, field: str) -> str | None:
+        return reduce(lambda obj, attr: getattr(obj, attr, None) if obj is not None else None, field.split("."), advancement)
+
+    def add(self, advancements: Iterable[BaseAdvancement]):
+        """
+        Adds advancements to the index, advancements that are not instances of ``Advancement`` are skipped.
+        :param advancements: Iterable object with advancements.
+        """
+        for advancement in advancements:
+            if not isinstance(advancement, Advancement) or advancement in self._doc_ids:
+                continue
+
+            frequencies: dict[str, float] = {}
+            length = 0.0
+            for field, weight in SEARCH_FIELD_WEIGHTS.items():
+                for term in tokenize(self.__field_value(advancement, field)):
+                    frequencies[term] = frequencies.get(term, 0.0) + weight
+                    length += weight
+
+            if self._free_ids:
+                doc_id = self._free_ids.pop()
+                self._docs[doc_id] = advancement
+                self._doc_lengths[doc_id] = length
+                self._doc_terms[doc_id] = tuple(frequencies)
+            else:
+                doc_id = len(self._docs)
+                self._docs.append(advancement)
+                self._doc_lengths.append(length)
+                self._doc_terms.append(tuple(frequencies))
+            self._doc_ids[advancement] = doc_id
+            self._total_length += length
+
+            for term, frequency in frequencies.items():
+                postings = self._postings.get(term)
+                if postings is None:
+                    postings = self._postings[term] = {}
+                    self._sorted_terms = None
+                postings[doc_id] = frequency
+
+    def remove(self, advancements: Iterable[BaseAdvancement]):
+        """
+        Removes advancements from the index.
+        :param advancements: Iterable object with advancements.
+        """
+        for advancement in advancements:
+            doc_id = self._doc_ids.pop(advancement, None)
+            if doc_id is None:
+                continue
+
+            for term in self._doc_terms[doc_id]:
+                postings = self._postings[term]
+                del postings[doc_id]
+                if not postings:
+                    del self._postings[term]
+                    self._sorted_terms = None
+
+            self._total_length -= self._doc_lengths[doc_id]
+            self._docs[doc_id] = None
+            self._doc_terms[doc_id] = ()
+            self._doc_lengths[doc_id] = 0.0
+            self._free_ids.append(doc_id)
+
+    def __expand(self, token: str, prefix: bool) -> list[str]:
+        if not prefix:
+            return [token] if token in self._postings else []
+
+        if self._sorted_terms is None:
+            self._sorted_terms = sorted(self._postings)
+
+        terms = []
+        i = bisect_left(self._sorted_terms, token)
+        while i < len(self._sorted_terms) and self._sorted_terms[i].startswith(token) and len(terms) < SEARCH_MAX_PREFIX_EXPANSIONS:
+            terms.append(self._sorted_terms[i])
+            i += 1
+        return terms
+
+    def search(self, query: str, limit: int | None = 10, prefix: bool = True, require_all: bool = True,
+               datapack: str | None = None) -> list[tuple[Advancement, float]]:
+        """
+        Searches advancements by the text query.
+
+        :param query: Text query, it is tokenized and case-folded like the indexed fields.
+        :param limit: Maximum number of results, None if no limit.
+        :param prefix: Whether every query word also matches indexed words that start with it.
+        :param require_all: Whether an advancement must match every query word.
+        :param datapack: Name of the datapack to search in, if None, all indexed advancements are searched.
+        :return: A list of (advancement, score) tuples, best matches first.
+        """
+        tokens = tokenize(query)
+        documents = len(self._doc_ids)
+        if not tokens or not documents:
+            return []
+
+        average_length = self._total_length / documents
+        scores: dict[int, float] = {}
+        matched_tokens: dict[int, int] = {}
+
+        for token in dict.fromkeys(tokens):
+            token_scores: dict[int, float] = {}
+            for term in self.__expand(token, prefix):
+                postings = self._postings[term]
+                idf = math.log(1 + (documents - len(postings) + 0.5) / (len(postings) + 0.5))
+                for doc_id, frequency in postings.items():
+                    norm = self._k1 * (1 - self._b + self._b * self._doc_lengths[doc_id] / average_length)
+                    score = idf * frequency * (self._k1 + 1) / (frequency + norm)
+                    if score > token_scores.get(doc_id, 0.0):
+                        token_scores[doc_id] = score
+
+            if require_all and not token_scores:
+                return []
+
+            for doc_id, score in token_scores.items():
+                scores[doc_id] = scores.get(doc_id, 0.0) + score
+                matched_tokens[doc_id] = matched_tokens.get(doc_id, 0) + 1
+
+        required = len(dict.fromkeys(tokens)) if require_all else 1
+        results = [
+            (self._docs[doc_id], score) for doc_id, score in scores.items()
+            if matched_tokens[doc_id] >= required and (datapack is None or self._docs[doc_id].datapack.name == datapack)
+        ]
+        results.sort(key=lambda result: (-result[1], result[0].mc_path))
+        return results[:limit] if limit is not None else results
+
+    def __len__(self) -> int:
+        return len(self._doc_ids)
+
+    def __repr__(self):
+        return f"SearchIndex(advancements: {len(self._doc_ids)}, terms: {len(self._postings)})"
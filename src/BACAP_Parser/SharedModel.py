@@ -0,0 +1,637 @@
+import json
+import os
+import struct
+import sys
+from bisect import bisect_left
+from collections.abc import Iterator
+from multiprocessing import resource_tracker, shared_memory
+from pathlib import Path
+
+from .Color import Color
+from .Criteria import Criteria
+from .CriteriaList import CriteriaList
+from .ExtendedDict import ExtendedDict
+from .Item import Item, RewardItem, TrophyItem
+
+_MAGIC = b"BACAPSHM"
+_VERSION = 1
+
+_NORMAL = 0
+_TECHNICAL = 1
+_INVALID = 2
+
+# magic, version, datapacks, advancements, criteria, strings, blob size
+_HEADER = struct.Struct("<8sIIIIII")
+# name, first advancement, advancement count
+_DATAPACK = struct.Struct("<iii")
+# offset, length of the utf-8 encoded string inside the blob
+_STRING = struct.Struct("<II")
+# name, trigger, conditions (json)
+_CRITERIA = struct.Struct("<iii")
+
+# Every advancement field is an int32: either a plain number or an index into the string table (-1 is None)
+_ADVANCEMENT_FIELDS = (
+    "kind", "datapack", "path", "json", "mc_path", "namespace", "filename", "parent", "first_criteria", "criteria_count",
+    "reason", "title", "description", "tab", "tab_display", "color", "frame", "type", "hidden", "background",
+    "icon_id", "icon_components", "reward_mcpath",
+    "exp_mcpath", "exp_value",
+    "reward_item_mcpath", "reward_item_id", "reward_item_amount", "reward_item_type", "reward_item_components",
+    "trophy_mcpath", "trophy_id", "trophy_name", "trophy_color", "trophy_description", "trophy_components",
+)
+_ADVANCEMENT = struct.Struct("<" + "i" * len(_ADVANCEMENT_FIELDS))
+_FIELD = {name: i for i, name in enumerate(_ADVANCEMENT_FIELDS)}
+
+
+class _ModelBuilder:
+    """
+    Flattens the parsed model of a Parser into the binary layout of the SharedModel.
+    """
+
+    def __init__(self):
+        self._strings: dict[str, int] = {}
+        self._datapacks: list[tuple] = []
+        self._advancements: list[tuple] = []
+        self._criteria: list[tuple] = []
+
+    def _sid(self, value) -> int:
+        if value is None:
+            return -1
+        value = str(value)
+        sid = self._strings.get(value)
+        if sid is None:
+            sid = self._strings[value] = len(self._strings)
+        return sid
+
+    def _json_sid(self, value) -> int:
+        if value is None:
+            return -1
+        return self._sid(json.dumps(value, ensure_ascii=False, separators=(",", ":")))
+
+    def add_datapack(self, datapack):
+        from .Advancement import Advancement, InvalidAdvancement
+
+        advancements = sorted(datapack.advancement_manager.adv_list, key=lambda adv: adv.mc_path)
+        self._datapacks.append((self._sid(datapack.name), len(self._advancements), len(advancements)))
+        datapack_index = len(self._datapacks) - 1
+
+        for adv in advancements:
+            record = dict.fromkeys(_ADVANCEMENT_FIELDS, -1)
+            record["datapack"] = datapack_index
+            record["path"] = self._sid(adv.path)
+            record["json"] = self._json_sid(adv.json)
+            record["mc_path"] = self._sid(adv.mc_path)
+            record["namespace"] = self._sid(adv.namespace)
+            record["filename"] = self._sid(adv.filename)
+            record["parent"] = self._sid(adv.parent)
+            record["first_criteria"] = len(self._criteria)
+            record["criteria_count"] = len(adv.criteria_list)
+            for criteria in adv.criteria_list:
+                self._criteria.append((self._sid(criteria.name), self._sid(criteria.trigger), self._json_sid(criteria.conditions)))
+
+            if isinstance(adv, Advancement):
+                record["kind"] = _NORMAL
+                self._add_normal_fields(record, adv)
+            elif isinstance(adv, InvalidAdvancement):
+                record["kind"] = _INVALID
+                record["reason"] = self._sid(adv.reason)
+            else:
+                record["kind"] = _TECHNICAL
+
+            self._advancements.append(tuple(record.values()))
+
+    def _add_normal_fields(self, record: dict, adv):
+        record["title"] = self._sid(adv.title)
+        record["description"] = self._sid(adv.description)
+        record["tab"] = self._sid(adv.tab)
+        record["tab_display"] = self._sid(adv.tab_display)
+        record["color"] = self._sid(adv.color.value if adv.color else None)
+        record["frame"] = self._sid(adv.frame)
+        record["type"] = self._sid(adv.type.name)
+        record["hidden"] = int(bool(adv.hidden))
+        record["background"] = self._sid(adv.background)
+        record["icon_id"] = self._sid(adv.icon.id)
+        record["icon_components"] = self._json_sid(adv.icon.components or None)
+        record["reward_mcpath"] = self._sid(adv.reward_mcpath)
+
+        if adv.exp is not None:
+            record["exp_mcpath"] = self._sid(adv.exp.mcpath)
+            record["exp_value"] = adv.exp.value
+
+        if adv.reward is not None:
+            item = adv.reward.item
+            record["reward_item_mcpath"] = self._sid(adv.reward.mcpath)
+            record["reward_item_id"] = self._sid(item.id)
+            record["reward_item_amount"] = item.amount
+            record["reward_item_type"] = self._sid(item.type)
+            record["reward_item_components"] = self._json_sid(item.components or None)
+
+        if adv.trophy is not None:
+            item = adv.trophy.item
+            record["trophy_mcpath"] = self._sid(adv.trophy.mcpath)
+            record["trophy_id"] = self._sid(item.id)
+            record["trophy_name"] = self._sid(item.name)
+            record["trophy_color"] = self._sid(item.color.value if item.color else None)
+            record["trophy_description"] = self._sid(item.description)
+            record["trophy_components"] = self._json_sid(item.components or None)
+
+    def build(self) -> bytes:
+        blob = bytearray()
+        string_index = bytearray()
+        for string in self._strings:
+            encoded = string.encode("utf-8")
+            string_index += _STRING.pack(len(blob), len(encoded))
+            blob += encoded
+
+        parts = [_HEADER.pack(_MAGIC, _VERSION, len(self._datapacks), len(self._advancements), len(self._criteria),
+                              len(self._strings), len(blob))]
+        parts.extend(_DATAPACK.pack(*datapack) for datapack in self._datapacks)
+        parts.extend(_ADVANCEMENT.pack(*adv) for adv in self._advancements)
+        parts.extend(_CRITERIA.pack(*criteria) for criteria in self._criteria)
+        parts.append(bytes(string_index))
+        parts.append(bytes(blob))
+        return b"".join(parts)
+
+
+class SharedExp:
+    """
+    Read-only view of an Exp reward stored in a SharedModel.
+    """
+    __slots__ = ("_mcpath", "_value")
+
+    def __init__(self, mcpath: str, value: int):
+        self._mcpath = mcpath
+        self._value = value
+
+    @property
+    def mcpath(self) -> str:
+        """
+        :return: Minecraft internal path to the file.
+        """
+        return self._mcpath
+
+    @property
+    def value(self) -> int:
+        """
+        :return: Experience amount value.
+        """
+        return self._value
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._mcpath}, exp:{self._value})"
+
+
+class SharedItemReward:
+    """
+    Read-only view of an item reward (Reward or Trophy) stored in a SharedModel.
+    """
+    __slots__ = ("_mcpath", "_item")
+
+    def __init__(self, mcpath: str, item: RewardItem | TrophyItem):
+        self._mcpath = mcpath
+        self._item = item
+
+    @property
+    def mcpath(self) -> str:
+        """
+        :return: Minecraft internal path to the file.
+        """
+        return self._mcpath
+
+    @property
+    def item(self) -> RewardItem | TrophyItem:
+        """
+        :return: Item of the reward.
+        """
+        return self._item
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._mcpath}, {self._item})"
+
+
+class SharedAdvancement:
+    """
+    Read-only proxy of an advancement stored in a SharedModel.
+
+    Exposes the same property names as ``Advancement``, every value is decoded from the shared memory on access,
+    so the proxy itself only holds a reference to the model and the record index.
+    ``type`` is returned as the name of the AdvType, rewards are returned as ``SharedExp``/``SharedItemReward`` views.
+    """
+    __slots__ = ("_model", "_index")
+
+    def __init__(self, model: "SharedModel", index: int):
+        self._model = model
+        self._index = index
+
+    def _get(self, field: str) -> int:
+        return self._model._advancement_record(self._index)[_FIELD[field]]
+
+    def _str(self, field: str) -> str | None:
+        return self._model._string(self._get(field))
+
+    def _json(self, field: str) -> ExtendedDict | None:
+        return self._model._json(self._get(field))
+
+    @property
+    def is_technical(self) -> bool:
+        """
+        :return: True if the advancement is a TechnicalAdvancement.
+        """
+        return self._get("kind") == _TECHNICAL
+
+    @property
+    def is_invalid(self) -> bool:
+        """
+        :return: True if the advancement is an InvalidAdvancement.
+        """
+        return self._get("kind") == _INVALID
+
+    @property
+    def reason(self) -> str | None:
+        """
+        :return: The reason why the advancement is considered invalid, or None for valid advancements.
+        """
+        return self._str("reason")
+
+    @property
+    def datapack(self) -> str:
+        """
+        :return: Name of the datapack of the advancement.
+        """
+        return self._model.datapack_names[self._get("datapack")]
+
+    @property
+    def path(self) -> Path:
+        """
+        :return: The file path.
+        """
+        return Path(self._str("path"))
+
+    @property
+    def json(self) -> ExtendedDict | None:
+        """
+        :return: The JSON content of the advancement, decoded on every access.
+        """
+        return self._json("json")
+
+    @property
+    def parent(self) -> str | None:
+        """
+        :return: The Minecraft Path of the parent advancement, if any.
+        """
+        return self._str("parent")
+
+    @property
+    def mc_path(self) -> str:
+        """
+        :return: The path of the advancement in Minecraft format.
+        """
+        return self._str("mc_path")
+
+    @property
+    def namespace(self) -> str:
+        """
+        :return: The namespace of the advancement.
+        """
+        return self._str("namespace")
+
+    @property
+    def filename(self) -> str:
+        """
+        :return: The file name of the advancement without extension.
+        """
+        return self._str("filename")
+
+    @property
+    def criteria_list(self) -> CriteriaList:
+        """
+        :return: A new 'CriteriaList' of criteria for the advancement.
+        """
+        record = self._model._advancement_record(self._index)
+        first = record[_FIELD["first_criteria"]]
+        return CriteriaList([self._model._criteria(i) for i in range(first, first + record[_FIELD["criteria_count"]])])
+
+    @property
+    def title(self) -> str | None:
+        """
+        :return: the title of the advancement.
+        """
+        return self._str("title")
+
+    @property
+    def description(self) -> str | None:
+        """
+        :return: the description of the advancement.
+        """
+        return self._str("description")
+
+    @property
+    def type(self) -> str | None:
+        """
+        :return: The name of the AdvType of the advancement.
+        """
+        return self._str("type")
+
+    @property
+    def tab_display(self) -> str | None:
+        """
+        :return: The tab of the advancement that is displayed in minecraft advancement interface.
+        """
+        return self._str("tab_display")
+
+    @property
+    def tab(self) -> str | None:
+        """
+        :return: The tab (folder) of the advancement.
+        """
+        return self._str("tab")
+
+    @property
+    def color(self) -> Color | None:
+        """
+        :return: The color class of the advancement description.
+        """
+        color = self._str("color")
+        return Color(color) if color else None
+
+    @property
+    def frame(self) -> str | None:
+        """
+        :return: The frame of the advancement.
+        """
+        return self._str("frame")
+
+    @property
+    def hidden(self) -> bool:
+        """
+        :return: Is advancement hidden or not.
+        """
+        return self._get("hidden") == 1
+
+    @property
+    def background(self) -> str | None:
+        """
+        :return: Background path if it is root advancement.
+        """
+        return self._str("background")
+
+    @property
+    def is_root(self) -> bool:
+        """
+        :return: Is this advancement a root of the tab, by checking the background Minecraft Path.
+        """
+        return self._get("background") != -1
+
+    @property
+    def icon(self) -> Item | None:
+        """
+        :return: The Item class of the advancement icon.
+        """
+        item_id = self._str("icon_id")
+        if item_id is None:
+            return None
+        return Item(item_id=item_id, components=self._json("icon_components"))
+
+    @property
+    def reward_mcpath(self) -> str | None:
+        """
+        :return: The Minecraft path of the reward function.
+        """
+        return self._str("reward_mcpath")
+
+    @property
+    def exp(self) -> SharedExp | None:
+        """
+        :return: SharedExp view if exp reward exists, else None.
+        """
+        mcpath = self._str("exp_mcpath")
+        if mcpath is None:
+            return None
+        return SharedExp(mcpath, self._get("exp_value"))
+
+    @property
+    def reward(self) -> SharedItemReward | None:
+        """
+        :return: SharedItemReward view with RewardItem if item reward exists, else None.
+        """
+        mcpath = self._str("reward_item_mcpath")
+        if mcpath is None:
+            return None
+        item = RewardItem(self._str("reward_item_id"), self._json("reward_item_components"),
+                          self._str("reward_item_type"), self._get("reward_item_amount"))
+        return SharedItemReward(mcpath, item)
+
+    @property
+    def trophy(self) -> SharedItemReward | None:
+        """
+        :return: SharedItemReward view with TrophyItem if Trophy reward exists, else None.
+        """
+        mcpath = self._str("trophy_mcpath")
+        if mcpath is None:
+            return None
+        color = self._str("trophy_color")
+        item = TrophyItem(self._str("trophy_id"), self._json("trophy_components"), self._str("trophy_name"),
+                          Color(color) if color else None, self._str("trophy_description"))
+        return SharedItemReward(mcpath, item)
+
+    def __eq__(self, other):
+        if not isinstance(other, SharedAdvancement):
+            return NotImplemented
+        return self._model is other._model and self._index == other._index
+
+    def __hash__(self):
+        return hash((id(self._model), self._index))
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}([{self.datapack}] {self.mc_path})"
+
+
+class SharedModel:
+    """
+    Read-only copy of the parsed model of a Parser, stored in a ``multiprocessing.shared_memory`` block.
+
+    Advancements, criteria and rewards are stored as fixed size records in a flat offset-based layout
+    with a single deduplicated string table, so forked or attached worker processes do not copy
+    (or touch the refcounts of) the model, and memory stays roughly constant with the number of workers.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool):
+        """
+        Use ``SharedModel.create`` or ``SharedModel.attach`` instead of direct initialization.
+        :param shm: SharedMemory block that contains the model.
+        :param owner: Whether this instance created the block and is responsible for unlinking it.
+        :raises ValueError: If the block does not contain a SharedModel.
+        """
+        self._shm = shm
+        self._owner = owner
+        self._buf = shm.buf
+
+        magic, version, datapacks, advancements, criteria, strings, _ = _HEADER.unpack_from(self._buf, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"Shared memory block \"{shm.name}\" does not contain a compatible SharedModel")
+
+        self._advancements_count = advancements
+        self._datapacks_offset = _HEADER.size
+        self._advancements_offset = self._datapacks_offset + datapacks * _DATAPACK.size
+        self._criteria_offset = self._advancements_offset + advancements * _ADVANCEMENT.size
+        self._strings_offset = self._criteria_offset + criteria * _CRITERIA.size
+        self._blob_offset = self._strings_offset + strings * _STRING.size
+
+        self._datapacks: dict[str, tuple[int, int]] = {}
+        for i in range(datapacks):
+            name, first, count = _DATAPACK.unpack_from(self._buf, self._datapacks_offset + i * _DATAPACK.size)
+            self._datapacks[self._string(name)] = (first, count)
+        self._datapack_names = list(self._datapacks)
+
+    @classmethod
+    def create(cls, parser, name: str | None = None) -> "SharedModel":
+        """
+        Builds the shared memory block from the parsed model of the parser.
+        :param parser: Parser instance with loaded datapacks.
+        :param name: Name of the shared memory block, if None, a unique name is generated.
+        :return: SharedModel instance that owns the block.
+        """
+        builder = _ModelBuilder()
+        for datapack in parser.datapacks:
+            builder.add_datapack(datapack)
+        data = builder.build()
+
+        shm = shared_memory.SharedMemory(name=name, create=True, size=len(data))
+        shm.buf[:len(data)] = data
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedModel":
+        """
+        Attaches to an existing shared memory block created by ``SharedModel.create`` in another process.
+        :param name: Name of the shared memory block.
+        :return: SharedModel instance that does not own the block.
+        """
+        if sys.version_info >= (3, 13):
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            shm = shared_memory.SharedMemory(name=name)
+            # Before 3.13 attaching registers the block in the resource tracker, which would unlink it
+            # when this process exits, while the owner and other workers still use it
+            if os.name == "posix":
+                resource_tracker.unregister(shm._name, "shared_memory")
+        return cls(shm, owner=False)
+
+    def _string(self, sid: int) -> str | None:
+        if sid < 0:
+            return None
+        offset, length = _STRING.unpack_from(self._buf, self._strings_offset + sid * _STRING.size)
+        start = self._blob_offset + offset
+        return str(self._buf[start:start + length], "utf-8")
+
+    def _json(self, sid: int) -> ExtendedDict | None:
+        if sid < 0:
+            return None
+        return json.loads(self._string(sid), object_hook=ExtendedDict)
+
+    def _advancement_record(self, index: int) -> tuple:
+        return _ADVANCEMENT.unpack_from(self._buf, self._advancements_offset + index * _ADVANCEMENT.size)
+
+    def _criteria(self, index: int) -> Criteria:
+        name, trigger, conditions = _CRITERIA.unpack_from(self._buf, self._criteria_offset + index * _CRITERIA.size)
+        return Criteria(self._string(name), self._string(trigger), conditions=self._json(conditions))
+
+    @property
+    def name(self) -> str:
+        """
+        :return: Name of the shared memory block, used to attach from other processes.
+        """
+        return self._shm.name
+
+    @property
+    def size(self) -> int:
+        """
+        :return: Size of the shared memory block in bytes.
+        """
+        return self._shm.size
+
+    @property
+    def datapack_names(self) -> list[str]:
+        """
+        :return: A list of names of all stored datapacks.
+        """
+        return self._datapack_names
+
+    def adv_list(self, datapack: str | None = None) -> list[SharedAdvancement]:
+        """
+        :param datapack: Name of the datapack, if None, advancements of all datapacks are returned.
+        :return: A list of advancement views sorted by mc_path inside each datapack.
+        :raises KeyError: if the datapack does not exist
+        """
+        return list(self.iterator(datapack))
+
+    def iterator(self, datapack: str | None = None) -> Iterator[SharedAdvancement]:
+        """
+        :param datapack: Name of the datapack, if None, advancements of all datapacks are returned.
+        :return: Iterator of advancement views sorted by mc_path inside each datapack.
+        :raises KeyError: if the datapack does not exist
+        """
+        if datapack is None:
+            first, count = 0, self._advancements_count
+        else:
+            first, count = self.__datapack_range(datapack)
+        return (SharedAdvancement(self, i) for i in range(first, first + count))
+
+    def filtered_list(self, datapack: str | None = None, skip_invalid: bool = True, skip_technical: bool = True,
+                      skip_normal: bool = False) -> list[SharedAdvancement]:
+        """
+        Returns list of advancement views by parameters, like ``AdvancementManager.filtered_list``.
+        """
+        skipped_kinds = {kind for kind, skip in ((_INVALID, skip_invalid), (_TECHNICAL, skip_technical), (_NORMAL, skip_normal)) if skip}
+        return [adv for adv in self.iterator(datapack) if adv._get("kind") not in skipped_kinds]
+
+    def get(self, datapack: str, mc_path: str) -> SharedAdvancement | None:
+        """
+        Finds an advancement by its mc_path with binary search.
+        :param datapack: Name of the datapack.
+        :param mc_path: Minecraft path of the advancement.
+        :return: Advancement view or None if the advancement does not exist.
+        :raises KeyError: if the datapack does not exist
+        """
+        first, count = self.__datapack_range(datapack)
+        mc_path_field = _FIELD["mc_path"]
+        index = bisect_left(range(first, first + count), mc_path,
+                            key=lambda i: self._string(self._advancement_record(i)[mc_path_field]))
+        if index < count and self._string(self._advancement_record(first + index)[mc_path_field]) == mc_path:
+            return SharedAdvancement(self, first + index)
+        return None
+
+    def __datapack_range(self, datapack: str) -> tuple[int, int]:
+        if datapack not in self._datapacks:
+            raise KeyError(f"Datapack named '{datapack}' not found.")
+        return self._datapacks[datapack]
+
+    def __len__(self) -> int:
+        return self._advancements_count
+
+    def __iter__(self) -> Iterator[SharedAdvancement]:
+        return self.iterator()
+
+    def close(self):
+        """
+        Closes access to the shared memory block from this instance.
+        Advancement views of this model can not be used after closing.
+        """
+        self._buf = None
+        self._shm.close()
+
+    def unlink(self):
+        """
+        Requests the shared memory block to be destroyed, should be called once by the owner process.
+        """
+        self._shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        if self._owner:
+            self.unlink()
+
+    def __repr__(self):
+        return f"SharedModel('{self.name}', advancements: {self._advancements_count})"
@@ -0,0 +1,180 @@
+from array import array
+from collections import Counter
+from collections.abc import Iterable
+from typing import Any
+
+from .constants import STATS_GROUP_COLUMNS, STATS_VALUE_COLUMNS
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class AdvancementStats:
+    """
+    Column store of the loaded advancements for aggregations.
+
+    Every advancement is visited once when the store is built: group columns (tab, type, datapack, ...) are stored
+    as integer codes of their labels and value columns (exp, hidden, ...) as integers, in NumPy arrays if NumPy
+    is installed, else in ``array`` arrays. Group-by aggregations work on the columns only, so their cost does not
+    depend on the advancement objects.
+    """
+
+    def __init__(self, advancements: Iterable, symbol_table=None):
+        """
+        :param advancements: Advancements of one or several datapacks.
+        :param symbol_table: SymbolTable of the advancements, its size is included in the summary.
+        """
+        from .Advancement import Advancement, TechnicalAdvancement
+
+        self._symbol_table = symbol_table
+        # Code 0 of every group column is reserved for advancements without a value, e.g. the tab of a technical advancement
+        self._labels: dict[str, list[str | None]] = {column: [None] for column in STATS_GROUP_COLUMNS}
+        codes: dict[str, dict[str | None, int]] = {column: {None: 0} for column in STATS_GROUP_COLUMNS}
+        group_columns = {column: array("i") for column in STATS_GROUP_COLUMNS}
+        value_columns = {column: array("q") for column in STATS_VALUE_COLUMNS}
+
+        def encode(column: str, label: str | None):
+            column_codes = codes[column]
+            code = column_codes.get(label)
+            if code is None:
+                code = column_codes[label] = len(column_codes)
+                self._labels[column].append(label)
+            group_columns[column].append(code)
+
+        for advancement in advancements:
+            is_normal = isinstance(advancement, Advancement)
+            reward_item = advancement.reward.item if is_normal and advancement.reward else None
+            encode("kind", "normal" if is_normal else "technical" if isinstance(advancement, TechnicalAdvancement) else "invalid")
+            encode("datapack", advancement.datapack.name)
+            encode("namespace", advancement.namespace)
+            encode("tab", advancement.tab if is_normal else None)
+            encode("type", advancement.type.name if is_normal else None)
+            encode("frame", advancement.frame if is_normal else None)
+            encode("reward_item", reward_item.id if reward_item is not None else None)
+            value_columns["exp"].append(advancement.exp.value if is_normal and advancement.exp else 0)
+            value_columns["hidden"].append(int(is_normal and advancement.hidden))
+            value_columns["reward_amount"].append(reward_item.amount if reward_item is not None else 0)
+            value_columns["trophy"].append(int(is_normal and advancement.trophy is not None))
+
+        self._size = len(group_columns["kind"])
+        self._columns: dict[str, Any] = group_columns | value_columns
+        if numpy is not None:
+            self._columns = {column: numpy.asarray(values, dtype=numpy.int64) for column, values in self._columns.items()}
+
+    @property
+    def backend(self) -> str:
+        """
+        :return: "numpy" if the columns are NumPy arrays, else "array".
+        """
+        return "numpy" if numpy is not None else "array"
+
+    @property
+    def symbol_table(self):
+        """
+        :return: SymbolTable of the advancements, or None.
+        """
+        return self._symbol_table
+
+    @property
+    def columns(self) -> dict[str, Any]:
+        """
+        :return: Dict where key is a column name and value is its NumPy or ``array`` array.
+        """
+        return self._columns
+
+    def labels(self, column: str) -> list[str | None]:
+        """
+        :param column: Name of a group column, one of ``constants.STATS_GROUP_COLUMNS``.
+        :return: Labels of the column codes, code 0 is None.
+        :raises ValueError: If the column is not a group column.
+        """
+        self.__check_column(column, STATS_GROUP_COLUMNS)
+        return self._labels[column]
+
+    @staticmethod
+    def __check_column(column: str, columns: tuple[str, ...]):
+        if column not in columns:
+            raise ValueError(f"Unknown column \"{column}\", possible columns: {columns}")
+
+    def __group_sums(self, group: str, value: str | None) -> list[int]:
+        """
+        :return: Sum of the value column (or the number of rows if value is None) for every code of the group column.
+        """
+        codes = self._columns[group]
+        size = len(self._labels[group])
+        if numpy is not None:
+            weights = self._columns[value] if value is not None else None
+            return numpy.bincount(codes, weights=weights, minlength=size).astype(numpy.int64).tolist()
+
+        if value is None:
+            counts = Counter(codes)
+            return [counts.get(code, 0) for code in range(size)]
+        sums = [0] * size
+        for code, number in zip(codes, self._columns[value]):
+            sums[code] += number
+        return sums
+
+    def __labeled(self, group: str, sums: list) -> dict[str, Any]:
+        return {label: total for label, total in zip(self._labels[group], sums) if label is not None}
+
+    def count_by(self, group: str) -> dict[str, int]:
+        """
+        :param group: Name of a group column, one of ``constants.STATS_GROUP_COLUMNS``.
+        :return: Dict with the number of advancements of every label, advancements without a value are not counted.
+        :raises ValueError: If the column is unknown.
+        """
+        self.__check_column(group, STATS_GROUP_COLUMNS)
+        return self.__labeled(group, self.__group_sums(group, None))
+
+    def sum_by(self, value: str, group: str) -> dict[str, int]:
+        """
+        :param value: Name of a value column, one of ``constants.STATS_VALUE_COLUMNS``.
+        :param group: Name of a group column, one of ``constants.STATS_GROUP_COLUMNS``.
+        :return: Dict with the sum of the value column for every label of the group column.
+        :raises ValueError: If a column is unknown.
+        """
+        self.__check_column(value, STATS_VALUE_COLUMNS)
+        self.__check_column(group, STATS_GROUP_COLUMNS)
+        return self.__labeled(group, self.__group_sums(group, value))
+
+    def mean_by(self, value: str, group: str) -> dict[str, float]:
+        """
+        :param value: Name of a value column, one of ``constants.STATS_VALUE_COLUMNS``.
+        :param group: Name of a group column, one of ``constants.STATS_GROUP_COLUMNS``.
+        :return: Dict with the mean of the value column for every label of the group column, e.g. the hidden ratio per tab.
+        :raises ValueError: If a column is unknown.
+        """
+        self.__check_column(value, STATS_VALUE_COLUMNS)
+        self.__check_column(group, STATS_GROUP_COLUMNS)
+        counts = self.__group_sums(group, None)
+        sums = self.__group_sums(group, value)
+        return self.__labeled(group, [total / count if count else 0.0 for total, count in zip(sums, counts)])
+
+    def summary(self) -> dict[str, Any]:
+        """
+        :return: JSON-serializable dict with the common aggregations: advancements per kind, datapack, tab and type,
+        exp per tab, reward item distribution and hidden ratio per tab.
+        """
+        summary = {
+            "advancements": self._size,
+            "by_kind": self.count_by("kind"),
+            "by_datapack": self.count_by("datapack"),
+            "by_tab": self.count_by("tab"),
+            "by_type": self.count_by("type"),
+            "exp_by_tab": self.sum_by("exp", "tab"),
+            "reward_items": self.count_by("reward_item"),
+            "reward_item_amounts": self.sum_by("reward_amount", "reward_item"),
+            "hidden_ratio_by_tab": self.mean_by("hidden", "tab"),
+        }
+        if self._symbol_table is not None:
+            summary["symbols"] = len(self._symbol_table)
+            summary["items"] = len(self._symbol_table.items)
+        return summary
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __repr__(self):
+        return f"AdvancementStats(advancements: {self._size}, backend: {self.backend})"
@@ -0,0 +1,85 @@
+from typing import Any
+
+from .ContentCache import ContentCache
+from .Item import ItemRegistry
+
+
+class SymbolTable:
+    """
+    Table of interned strings.
+
+    Identifiers like mc_paths, namespaces, tabs, criteria triggers and item ids are repeated across
+    thousands of advancements, the table stores a single instance of every string, so equal identifiers
+    share memory and their equality checks become identity checks.
+    Icons and reward items are shared the same way through the ItemRegistry of the table,
+    and identical advancement and reward files of datapacks loaded with the table through its ContentCache.
+    """
+
+    def __init__(self):
+        self._symbols: dict[str, str] = {}
+        self._lookups = 0
+        self._items = ItemRegistry()
+        self._content = ContentCache(self)
+
+    def intern[T: str | None](self, value: T) -> T:
+        """
+        :param value: String to intern or None.
+        :return: The single stored instance of the string, or None.
+        """
+        if value is None:
+            return None
+        self._lookups += 1
+        return self._symbols.setdefault(value, value)
+
+    def intern_values[T: Any](self, data: T) -> T:
+        """
+        Interns all dict keys and string values of the nested dicts and lists in place.
+
+        :param data: Parsed JSON/NBT data.
+        :return: The same data object, or the interned string if data is a string.
+        """
+        if isinstance(data, str):
+            return self.intern(data)
+
+        # Methods of the base classes, so read-only JSON shared through the ContentCache is interned as well
+        if isinstance(data, dict):
+            items = list(data.items())
+            dict.clear(data)
+            for key, value in items:
+                dict.__setitem__(data, self.intern(key) if isinstance(key, str) else key, self.intern_values(value))
+
+        elif isinstance(data, list):
+            for i, value in enumerate(data):
+                list.__setitem__(data, i, self.intern_values(value))
+
+        return data
+
+    def __len__(self) -> int:
+        return len(self._symbols)
+
+    def __contains__(self, value: str) -> bool:
+        return value in self._symbols
+
+    @property
+    def items(self) -> ItemRegistry:
+        """
+        :return: ItemRegistry with the shared Item instances.
+        """
+        return self._items
+
+    @property
+    def content(self) -> ContentCache:
+        """
+        :return: ContentCache with the parsed files shared between the datapacks of the table.
+        """
+        return self._content
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """
+        :return: Dict with the number of stored symbols, total lookups and lookups that returned an existing symbol.
+        """
+        return {"symbols": len(self._symbols), "lookups": self._lookups, "hits": self._lookups - len(self._symbols)}
+
+    def __repr__(self):
+        return f"SymbolTable(symbols: {len(self._symbols)})"
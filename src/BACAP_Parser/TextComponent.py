@@ -0,0 +1,257 @@
+import html
+import re
+import threading
+from collections import OrderedDict
+from typing import Any
+
+from .Color import Color, MINECRAFT_TEXT_COLORS_MAP
+from .constants import DEFAULT_LOCALE, TEXT_COMPONENT_CACHE_SIZE, TEXT_FORMATTING_ANSI_CODES
+from .LangIndex import LangIndex
+
+_FORMATTING = ("bold", "italic", "underlined", "strikethrough", "obfuscated")
+_DEFAULT_STYLE = (None, False, False, False, False, False)
+
+# %s, %1$s and %% placeholders of the translate components
+_placeholder_pattern = re.compile(r"%(?:(\d+)\$)?([s%])")
+
+
+class TextSpan:
+    """
+    A piece of text with a single style.
+    """
+    __slots__ = ("_text", "_style")
+
+    def __init__(self, text: str, style: tuple = _DEFAULT_STYLE):
+        """
+        :param text: Text of the span.
+        :param style: Tuple of (color hex or None, bold, italic, underlined, strikethrough, obfuscated).
+        """
+        self._text = text
+        self._style = style
+
+    @property
+    def text(self) -> str:
+        """
+        :return: Text of the span.
+        """
+        return self._text
+
+    @property
+    def color(self) -> str | None:
+        """
+        :return: HEX color of the span, None if the component does not set a color.
+        """
+        return self._style[0]
+
+    @property
+    def style(self) -> tuple:
+        """
+        :return: Tuple of (color hex or None, bold, italic, underlined, strikethrough, obfuscated).
+        """
+        return self._style
+
+    def __repr__(self):
+        return f"TextSpan({self._text!r}, {self._style})"
+
+
+class TextComponent:
+    """
+    Minecraft JSON text component (string, list or dict with ``text``/``translate``/``keybind`` content,
+    ``with`` arguments, nested ``extra``, color and formatting), flattened into styled spans in a single traversal.
+    Plain text, ANSI and HTML are rendered from the spans on first access.
+
+    Use ``TextComponent.of`` to reuse the rendered output of the same component object.
+    """
+    __slots__ = ("_component", "_lang_index", "_locale", "_spans", "_plain", "_ansi", "_html")
+
+    # Least recently used entries are evicted first
+    _cache: OrderedDict[tuple[int, int, str], tuple[Any, LangIndex | None, "TextComponent"]] = OrderedDict()
+    _cache_lock = threading.Lock()
+
+    def __init__(self, component: Any, lang_index: LangIndex | None = None, locale: str = DEFAULT_LOCALE):
+        """
+        :param component: Parsed JSON text component.
+        :param lang_index: LangIndex used to translate ``translate`` components, if None, the ``fallback`` or the key is used.
+        :param locale: Locale of the translations.
+        """
+        self._component = component
+        self._lang_index = lang_index
+        self._locale = locale
+        self._spans: list[TextSpan] = []
+        self._plain: str | None = None
+        self._ansi: str | None = None
+        self._html: str | None = None
+        self.__flatten(component, _DEFAULT_STYLE)
+
+    @classmethod
+    def of(cls, component: Any, lang_index: LangIndex | None = None, locale: str = DEFAULT_LOCALE) -> "TextComponent":
+        """
+        Returns a memoized TextComponent of the component object, so every component is flattened and rendered only once.
+        The component must not be modified after it is rendered.
+
+        :param component: Parsed JSON text component.
+        :param lang_index: LangIndex used to translate ``translate`` components.
+        :param locale: Locale of the translations.
+        :return: TextComponent instance.
+        """
+        key = (id(component), id(lang_index), locale)
+        with cls._cache_lock:
+            cached = cls._cache.get(key)
+            if cached is not None and cached[0] is component and cached[1] is lang_index:
+                cls._cache.move_to_end(key)
+                return cached[2]
+
+        text_component = cls(component, lang_index, locale)
+        with cls._cache_lock:
+            # The component and the LangIndex are kept in the cache, so their ids cannot be reused by other objects
+            cls._cache[key] = (component, lang_index, text_component)
+            cls._cache.move_to_end(key)
+            if len(cls._cache) > TEXT_COMPONENT_CACHE_SIZE:
+                cls._cache.popitem(last=False)
+        return text_component
+
+    @staticmethod
+    def __style(component: dict, parent: tuple) -> tuple:
+        color = component.get("color")
+        if color is not None:
+            try:
+                color = Color(color).value if color in MINECRAFT_TEXT_COLORS_MAP or color.startswith("#") else parent[0]
+            except ValueError:
+                color = parent[0]
+        else:
+            color = parent[0]
+        return color, *(bool(component.get(name, inherited)) for name, inherited in zip(_FORMATTING, parent[1:]))
+
+    def __append(self, text: str, style: tuple):
+        if not text:
+            return
+        if self._spans and self._spans[-1].style == style:
+            self._spans[-1] = TextSpan(self._spans[-1].text + text, style)
+        else:
+            self._spans.append(TextSpan(text, style))
+
+    def __flatten(self, component: Any, parent: tuple):
+        if isinstance(component, str):
+            self.__append(component, parent)
+
+        elif isinstance(component, list):
+            if component:
+                # The first element is the parent of the others
+                style = self.__style(component[0], parent) if isinstance(component[0], dict) else parent
+                self.__flatten(component[0], parent)
+                for child in component[1:]:
+                    self.__flatten(child, style)
+
+        elif isinstance(component, dict):
+            style = self.__style(component, parent)
+            if "text" in component:
+                self.__append(str(component["text"]), style)
+            elif "translate" in component:
+                self.__translate(component, style)
+            elif "keybind" in component:
+                self.__append(str(component["keybind"]), style)
+            elif "selector" in component:
+                self.__append(str(component["selector"]), style)
+
+            for child in component.get("extra", ()):
+                self.__flatten(child, style)
+
+        elif component is not None:
+            self.__append(str(component).lower() if isinstance(component, bool) else str(component), parent)
+
+    def __translate(self, component: dict, style: tuple):
+        key = component["translate"]
+        template = None
+        if self._lang_index is not None:
+            template = self._lang_index.get(key, self._locale)
+        if template is None:
+            template = component.get("fallback", key)
+
+        arguments = component.get("with", [])
+        position = 0
+        next_argument = 0
+        for match in _placeholder_pattern.finditer(template):
+            self.__append(template[position:match.start()], style)
+            position = match.end()
+            if match.group(2) == "%":
+                self.__append("%", style)
+                continue
+
+            if match.group(1) is not None:
+                index = int(match.group(1)) - 1
+            else:
+                index = next_argument
+                next_argument += 1
+            if 0 <= index < len(arguments):
+                self.__flatten(arguments[index], style)
+        self.__append(template[position:], style)
+
+    @property
+    def component(self) -> Any:
+        """
+        :return: Parsed JSON text component.
+        """
+        return self._component
+
+    @property
+    def spans(self) -> list[TextSpan]:
+        """
+        :return: A list of styled text spans, adjacent spans with the same style are merged.
+        """
+        return self._spans
+
+    @property
+    def plain(self) -> str:
+        """
+        :return: Text without formatting.
+        """
+        if self._plain is None:
+            self._plain = "".join(span.text for span in self._spans)
+        return self._plain
+
+    @property
+    def ansi(self) -> str:
+        """
+        :return: Text with 24-bit ANSI escape codes for colors and formatting, for terminals.
+        """
+        if self._ansi is None:
+            parts = []
+            for span in self._spans:
+                codes = [code for flag, code in zip(span.style[1:], TEXT_FORMATTING_ANSI_CODES) if flag]
+                if span.color is not None:
+                    codes.append("38;2;{};{};{}".format(*Color(span.color).as_rgb))
+                parts.append(f"\x1b[{';'.join(codes)}m{span.text}\x1b[0m" if codes else span.text)
+            self._ansi = "".join(parts)
+        return self._ansi
+
+    @property
+    def html(self) -> str:
+        """
+        :return: Escaped HTML with a ``<span style="...">`` for every styled span and ``<br>`` for line breaks.
+        """
+        if self._html is None:
+            parts = []
+            for span in self._spans:
+                text = html.escape(span.text).replace("\n", "<br>")
+                color, bold, italic, underlined, strikethrough, obfuscated = span.style
+                styles = []
+                if color is not None:
+                    styles.append(f"color:{color}")
+                if bold:
+                    styles.append("font-weight:bold")
+                if italic:
+                    styles.append("font-style:italic")
+                decorations = " ".join(name for name, flag in (("underline", underlined), ("line-through", strikethrough)) if flag)
+                if decorations:
+                    styles.append(f"text-decoration:{decorations}")
+                if obfuscated:
+                    text = f'<span class="obfuscated">{text}</span>'
+                parts.append(f'<span style="{";".join(styles)}">{text}</span>' if styles else text)
+            self._html = "".join(parts)
+        return self._html
+
+    def __str__(self):
+        return self.plain
+
+    def __repr__(self):
+        return f"TextComponent({self.plain!r})"
@@ -1,16 +1,140 @@
-from .AdvType import AdvTypeManager, AdvType
-from .Advancement import Advancement, AdvancementManager, InvalidAdvancement, TechnicalAdvancement
-from .Parser import Parser
-from .Color import Color
-from .components_decoder import components_decoder
-from .constants import *
-from .Criteria import Criteria
-from .CriteriaList import CriteriaList
-from .Datapack import Datapack
-from .ExtendedDict import ExtendedDict
-from .Item import Item, RewardItem, TrophyItem
-from .nbt_decoder import nbt_decoder
-from .Rewards import Exp, Reward, Trophy
-from .Parser import Parser
-from .TabNameMapper import TabNameMapper
-from .utils import *
+"""
+Library to parse BlazeAndCavesAdvancementsPack and Addons for it.
+
+Public names are imported lazily (PEP 562): a submodule is imported on the first access to one of its names,
+so scripts that only need e.g. ``Color`` or ``nbt_decoder`` do not import the whole library.
+"""
+import sys
+from importlib import import_module
+from types import ModuleType
+
+# Avoids importing `typing` at startup, type checkers treat this name as True
+TYPE_CHECKING = False
+
+# Public name -> submodule that defines it
+_LAZY_NAMES: dict[str, str] = {
+    "AdvType": "AdvType", "AdvTypeManager": "AdvType",
+    "Advancement": "Advancement", "AdvancementManager": "Advancement", "InvalidAdvancement": "Advancement",
+    "TechnicalAdvancement": "Advancement", "DEFAULT_ADVANCEMENT_SCHEMA": "Advancement",
+    "Color": "Color",
+    "ContentCache": "ContentCache",
+    "components_decoder": "components_decoder",
+    "Criteria": "Criteria",
+    "CriteriaIndex": "CriteriaIndex",
+    "CriteriaList": "CriteriaList", "FrozenCriteriaList": "CriteriaList",
+    "DataIndex": "DataIndex",
+    "Datapack": "Datapack",
+    "DatapackProfile": "Discovery", "DiscoveredDatapack": "Discovery", "discover_datapacks": "Discovery",
+    "AdvancementDiff": "Diff", "DiffReport": "Diff", "compare_advancements": "Diff",
+    "ExtendedDict": "ExtendedDict", "FrozenDict": "ExtendedDict", "FrozenList": "ExtendedDict",
+    "Item": "Item", "ItemRegistry": "Item", "RewardItem": "Item", "TrophyItem": "Item",
+    "LangIndex": "LangIndex",
+    "ColorTypeMismatch": "Lint", "DanglingParents": "Lint", "DEFAULT_LINT_CHECKS": "Lint", "DuplicateTitles": "Lint", "LintCheck": "Lint",
+    "LintIssue": "Lint", "LintReport": "Lint", "MissingRewardFiles": "Lint", "UnreachableTrophies": "Lint",
+    "MemoryReport": "MemoryReport",
+    "nbt_decoder": "nbt_decoder",
+    "Parser": "Parser",
+    "ParserConfig": "ParserConfig",
+    "PrefixIndex": "PrefixIndex",
+    "QueryServer": "QueryServer",
+    "LoadObserver": "Profiler", "ProfileCollector": "Profiler",
+    "Exp": "Rewards", "Reward": "Rewards", "Trophy": "Rewards",
+    "AdvancementRecord": "Schema", "AdvancementSchema": "Schema", "SchemaError": "Schema", "SchemaField": "Schema",
+    "SearchIndex": "SearchIndex",
+    "AdvancementStats": "Stats",
+    "SharedAdvancement": "SharedModel", "SharedModel": "SharedModel",
+    "SymbolTable": "SymbolTable",
+    "TabNameMapper": "TabNameMapper",
+    "TextComponent": "TextComponent", "TextSpan": "TextComponent",
+    # constants
+    "ADV_FRAMES": "constants", "ARABIC_TO_ROMAN_MAP": "constants", "COMPLETION_FIELDS": "constants", "CRITERIA_ID_KEYS": "constants",
+    "DEFAULT_BACAP_HIDDEN_COLOR": "constants", "DEFAULT_CONFIG_FILE": "constants", "DEFAULT_LOCALE": "constants", "DEFAULT_BACAP_TAB_NAMES_MAP": "constants",
+    "DEFAULT_MINECRAFT_DESCRIPTION_COLOR": "constants", "DEFAULT_MINECRAFT_FRAME": "constants",
+    "DEFAULT_MINECRAFT_FRAME_COLOR_MAP": "constants", "DIFF_FIELD_KINDS": "constants", "DIFF_KINDS": "constants",
+    "LINT_SEVERITIES": "constants", "LOAD_STAGES": "constants", "MINIMAL_PACK_FORMAT": "constants",
+    "SEARCH_FIELD_WEIGHTS": "constants", "SEARCH_MAX_PREFIX_EXPANSIONS": "constants", "SERVER_CACHE_SIZE": "constants",
+    "SERVER_GZIP_MIN_SIZE": "constants", "SERVER_MAX_LIMIT": "constants", "SLOWEST_FILE_STAGE": "constants",
+    "SNAPSHOT_VERSION": "constants", "STATS_GROUP_COLUMNS": "constants", "STATS_VALUE_COLUMNS": "constants",
+    "TEXT_COMPONENT_CACHE_SIZE": "constants", "TEXT_FORMATTING_ANSI_CODES": "constants",
+    "MINECRAFT_TEXT_COLORS_MAP": "Color", "MINECRAFT_TEXT_COLORS_MAP_REVERSED": "Color",
+    # utils
+    "arabic_to_rims": "utils", "content_hash": "utils", "cut_namespace": "utils", "get_file_text": "utils", "normalize_id": "utils",
+    "normalized_json": "utils",
+    "path_to_mc_path": "utils", "safe_load_json_file": "utils", "safe_load_json_string": "utils",
+    "to_collection": "utils", "to_title_style": "utils", "trim_path_to_namespace": "utils",
+}
+
+__all__ = sorted(_LAZY_NAMES)
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_NAMES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+class _Package(ModuleType):
+    """
+    The import system binds every imported submodule as an attribute of the package, and several submodules
+    have the same name as the class or function they define (e.g. ``Color``). The package binds the defined name instead,
+    so ``from BACAP_Parser import Color`` returns the class whichever submodules were imported before.
+    """
+
+    def __setattr__(self, name: str, value):
+        if isinstance(value, ModuleType) and _LAZY_NAMES.get(name) == name and value.__name__ == f"{__name__}.{name}":
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _Package
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:
+    from .AdvType import AdvType, AdvTypeManager
+    from .Advancement import Advancement, AdvancementManager, DEFAULT_ADVANCEMENT_SCHEMA, InvalidAdvancement, TechnicalAdvancement
+    from .Color import Color, MINECRAFT_TEXT_COLORS_MAP, MINECRAFT_TEXT_COLORS_MAP_REVERSED
+    from .ContentCache import ContentCache
+    from .components_decoder import components_decoder
+    from .constants import (ADV_FRAMES, ARABIC_TO_ROMAN_MAP, COMPLETION_FIELDS, CRITERIA_ID_KEYS, DEFAULT_BACAP_HIDDEN_COLOR, DEFAULT_CONFIG_FILE,
+                            DEFAULT_BACAP_TAB_NAMES_MAP, DEFAULT_LOCALE, DEFAULT_MINECRAFT_DESCRIPTION_COLOR, DEFAULT_MINECRAFT_FRAME,
+                            DEFAULT_MINECRAFT_FRAME_COLOR_MAP, DIFF_FIELD_KINDS, DIFF_KINDS, LINT_SEVERITIES, LOAD_STAGES, MINIMAL_PACK_FORMAT,
+                            SEARCH_FIELD_WEIGHTS, SEARCH_MAX_PREFIX_EXPANSIONS, SERVER_CACHE_SIZE, SERVER_GZIP_MIN_SIZE,
+                            SERVER_MAX_LIMIT, SLOWEST_FILE_STAGE, SNAPSHOT_VERSION, STATS_GROUP_COLUMNS,
+                            STATS_VALUE_COLUMNS, TEXT_COMPONENT_CACHE_SIZE, TEXT_FORMATTING_ANSI_CODES)
+    from .Criteria import Criteria
+    from .CriteriaIndex import CriteriaIndex
+    from .CriteriaList import CriteriaList, FrozenCriteriaList
+    from .DataIndex import DataIndex
+    from .Datapack import Datapack
+    from .Discovery import DatapackProfile, DiscoveredDatapack, discover_datapacks
+    from .Diff import AdvancementDiff, DiffReport, compare_advancements
+    from .ExtendedDict import ExtendedDict, FrozenDict, FrozenList
+    from .Item import Item, ItemRegistry, RewardItem, TrophyItem
+    from .LangIndex import LangIndex
+    from .Lint import (ColorTypeMismatch, DanglingParents, DEFAULT_LINT_CHECKS, DuplicateTitles, LintCheck, LintIssue, LintReport,
+                       MissingRewardFiles, UnreachableTrophies)
+    from .MemoryReport import MemoryReport
+    from .nbt_decoder import nbt_decoder
+    from .Parser import Parser
+    from .ParserConfig import ParserConfig
+    from .PrefixIndex import PrefixIndex
+    from .QueryServer import QueryServer
+    from .Profiler import LoadObserver, ProfileCollector
+    from .Rewards import Exp, Reward, Trophy
+    from .Schema import AdvancementRecord, AdvancementSchema, SchemaError, SchemaField
+    from .SearchIndex import SearchIndex
+    from .SharedModel import SharedAdvancement, SharedModel
+    from .Stats import AdvancementStats
+    from .SymbolTable import SymbolTable
+    from .TabNameMapper import TabNameMapper
+    from .TextComponent import TextComponent, TextSpan
+    from .utils import (arabic_to_rims, content_hash, cut_namespace, get_file_text, normalize_id, normalized_json, path_to_mc_path,
+                        safe_load_json_file, safe_load_json_string, to_collection, to_title_style, trim_path_to_namespace)
@@ -0,0 +1,257 @@
+import argparse
+import json
+import os
+import sys
+import time
+from collections.abc import Iterator, Sequence
+from itertools import islice
+from pathlib import Path
+from typing import Any
+
+from .Advancement import Advancement, BaseAdvancement
+from .constants import DEFAULT_CONFIG_FILE
+from .Diff import _snapshot
+from .Parser import Parser
+from .ParserConfig import ParserConfig
+from .Profiler import ProfileCollector
+
+
+def _advancement_dict(adv: BaseAdvancement) -> dict[str, Any]:
+    return {"datapack": adv.datapack.name, "mc_path": adv.mc_path, **_snapshot(adv)}
+
+
+def _print_json(data: Any):
+    json.dump(data, sys.stdout, ensure_ascii=False, indent=2)
+    sys.stdout.write("\n")
+
+
+def _load(args: argparse.Namespace) -> Parser:
+    config = ParserConfig.from_file(args.config)
+    start = time.perf_counter()
+    parser, from_snapshot = config.load(use_snapshot=not args.no_snapshot)
+    if args.verbose:
+        source = "snapshot" if from_snapshot else "datapacks"
+        print(f"Loaded from {source} in {(time.perf_counter() - start) * 1000:.1f} ms", file=sys.stderr)
+    return parser
+
+
+def _iter_matches(parser: Parser, args: argparse.Namespace) -> Iterator[BaseAdvancement]:
+    if args.text:
+        candidates = (adv for adv, _ in parser.search(args.text, limit=None, datapack=args.datapack))
+    else:
+        datapacks = [parser.get_datapack(args.datapack)] if args.datapack else parser.datapacks
+        candidates = (adv for datapack in datapacks for adv in datapack.advancement_manager.adv_list)
+
+    for adv in candidates:
+        if not isinstance(adv, Advancement):
+            if args.all and not (args.tab or args.type or args.trophy_item or args.reward_item or args.hidden is not None):
+                yield adv
+            continue
+        if args.tab and adv.tab != args.tab:
+            continue
+        if args.type and adv.type.name != args.type:
+            continue
+        if args.hidden is not None and adv.hidden != args.hidden:
+            continue
+        if args.trophy_item and not (adv.trophy and args.trophy_item in adv.trophy.item.id):
+            continue
+        if args.reward_item and not (adv.reward and args.reward_item in adv.reward.item.id):
+            continue
+        yield adv
+
+
+def _command_load(args: argparse.Namespace) -> int:
+    config = ParserConfig.from_file(args.config)
+    start = time.perf_counter()
+    parser = config.build()
+    parsed = time.perf_counter()
+    if not args.no_snapshot:
+        config.save_snapshot(parser)
+    print(parser.info)
+    print(f"Parsed in {(parsed - start) * 1000:.1f} ms" +
+          (f", snapshot written to {config.snapshot_path} in {(time.perf_counter() - parsed) * 1000:.1f} ms" if config.snapshot_path and not args.no_snapshot else ""))
+    return 0
+
+
+def _command_query(args: argparse.Namespace) -> int:
+    parser = _load(args)
+    matches = list(islice(_iter_matches(parser, args), args.limit))
+
+    if args.json:
+        _print_json([_advancement_dict(adv) for adv in matches])
+        return 0
+
+    for adv in matches:
+        if isinstance(adv, Advancement):
+            extra = f"  [trophy: {adv.trophy.item.id}]" if adv.trophy else ""
+            print(f"[{adv.datapack.name}] {adv.mc_path}  {adv.title}{extra}")
+        else:
+            print(f"[{adv.datapack.name}] {adv.mc_path}  ({type(adv).__name__})")
+    return 0
+
+
+def _command_export(args: argparse.Namespace) -> int:
+    parser = _load(args)
+    datapacks = [parser.get_datapack(args.datapack)] if args.datapack else parser.datapacks
+    advancements = [_advancement_dict(adv) for datapack in datapacks for adv in datapack.advancement_manager.adv_list]
+
+    output = args.output.open("w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        if args.jsonl:
+            for adv in advancements:
+                output.write(json.dumps(adv, ensure_ascii=False) + "\n")
+        else:
+            json.dump(advancements, output, ensure_ascii=False, indent=2)
+            output.write("\n")
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    return 0
+
+
+def _command_diff(args: argparse.Namespace) -> int:
+    old = _load(args)
+    new, _ = ParserConfig.from_file(args.other).load(use_snapshot=not args.no_snapshot)
+    report = old.diff(new)
+    if args.json:
+        _print_json(report.as_dict())
+    else:
+        for entry in report:
+            print(f"{','.join(sorted(entry.kinds)):<20} [{entry.datapack}] {entry.mc_path}")
+        print(", ".join(f"{kind}: {count}" for kind, count in report.summary().items() if count) or "No differences")
+    return 1 if report and args.exit_code else 0
+
+
+def _command_bench(args: argparse.Namespace) -> int:
+    config = ParserConfig.from_file(args.config)
+    parse_times, collector = [], ProfileCollector()
+    parser = None
+    for i in range(args.repeat):
+        start = time.perf_counter()
+        parser = config.build(observer=collector if i == 0 else None)
+        parse_times.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    key = config.snapshot_key()
+    key_time = time.perf_counter() - start
+
+    results = {"parse_ms": min(parse_times) * 1000, "snapshot_key_ms": key_time * 1000,
+               "stages": {stage: values["total"] * 1000 for stage, values in collector.as_dict()["stages"].items()}}
+    if config.snapshot_path is not None:
+        start = time.perf_counter()
+        config.save_snapshot(parser, key)
+        results["snapshot_write_ms"] = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        config.load_snapshot(key)
+        results["snapshot_read_ms"] = (time.perf_counter() - start) * 1000
+        results["snapshot_bytes"] = config.snapshot_path.stat().st_size
+
+    if args.json:
+        _print_json(results)
+    else:
+        for name, value in results.items():
+            if name == "stages":
+                for stage, total in value.items():
+                    print(f"  {stage:<18} {total:10.2f} ms")
+            else:
+                print(f"{name:<20} {value:10.2f}" if isinstance(value, float) else f"{name:<20} {value:10}")
+    return 0
+
+
+def _command_stats(args: argparse.Namespace) -> int:
+    summary = _load(args).stats().summary()
+    if args.json:
+        _print_json(summary)
+        return 0
+
+    for name, value in summary.items():
+        if isinstance(value, dict):
+            print(f"{name}:")
+            for label, number in sorted(value.items()):
+                print(f"  {label:<30} {number:.3f}" if isinstance(number, float) else f"  {label:<30} {number}")
+        else:
+            print(f"{name}: {value}")
+    return 0
+
+
+def _command_serve(args: argparse.Namespace) -> int:
+    from .QueryServer import QueryServer
+
+    config = ParserConfig.from_file(args.config)
+    server = QueryServer(loader=lambda: config.load(use_snapshot=not args.no_snapshot)[0], host=args.host, port=args.port, verbose=args.verbose)
+    print(f"Serving {server.parser.info} on {server.url}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+    return 0
+
+
+def _build_argument_parser() -> argparse.ArgumentParser:
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("-c", "--config", type=Path, default=Path(os.environ.get("BACAP_PARSER_CONFIG", DEFAULT_CONFIG_FILE)),
+                        help=f"config file with the datapacks (default: $BACAP_PARSER_CONFIG or {DEFAULT_CONFIG_FILE})")
+    common.add_argument("--no-snapshot", action="store_true", help="do not read or write the parsed snapshot")
+    common.add_argument("-v", "--verbose", action="store_true", help="print load times to stderr")
+
+    parser = argparse.ArgumentParser(prog="bacap-parser", description="Parse BACAP datapacks and query the parsed advancements.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    load = commands.add_parser("load", parents=[common], help="parse the datapacks and write the snapshot")
+    load.set_defaults(handler=_command_load)
+
+    query = commands.add_parser("query", parents=[common], help="find advancements")
+    query.add_argument("text", nargs="?", help="full-text search query")
+    query.add_argument("--datapack", help="only this datapack")
+    query.add_argument("--tab", help="only this tab")
+    query.add_argument("--type", help="only this advancement type")
+    query.add_argument("--trophy-item", help="trophy item id contains this text, e.g. netherite")
+    query.add_argument("--reward-item", help="reward item id contains this text")
+    query.add_argument("--hidden", action=argparse.BooleanOptionalAction, default=None, help="only hidden (or with --no-hidden, visible) advancements")
+    query.add_argument("--all", action="store_true", help="include technical and invalid advancements")
+    query.add_argument("--limit", type=int, default=None, help="maximum number of results")
+    query.add_argument("--json", action="store_true", help="print JSON")
+    query.set_defaults(handler=_command_query)
+
+    export = commands.add_parser("export", parents=[common], help="export all advancements as JSON")
+    export.add_argument("-o", "--output", type=Path, help="output file (default: stdout)")
+    export.add_argument("--datapack", help="only this datapack")
+    export.add_argument("--jsonl", action="store_true", help="one JSON object per line")
+    export.set_defaults(handler=_command_export)
+
+    diff = commands.add_parser("diff", parents=[common], help="compare with the datapacks of another config")
+    diff.add_argument("other", type=Path, help="config file with the new versions of the datapacks")
+    diff.add_argument("--json", action="store_true", help="print JSON")
+    diff.add_argument("--exit-code", action="store_true", help="exit with 1 if there are differences")
+    diff.set_defaults(handler=_command_diff)
+
+    bench = commands.add_parser("bench", parents=[common], help="measure parsing and snapshot times")
+    bench.add_argument("--repeat", type=int, default=3, help="number of parses, the fastest is reported")
+    bench.add_argument("--json", action="store_true", help="print JSON")
+    bench.set_defaults(handler=_command_bench)
+
+    stats = commands.add_parser("stats", parents=[common], help="print advancement statistics")
+    stats.add_argument("--json", action="store_true", help="print JSON")
+    stats.set_defaults(handler=_command_stats)
+
+    serve = commands.add_parser("serve", parents=[common], help="serve the parsed advancements over HTTP")
+    serve.add_argument("--host", default="127.0.0.1", help="host to listen on (default: 127.0.0.1)")
+    serve.add_argument("--port", type=int, default=8080, help="port to listen on (default: 8080)")
+    serve.set_defaults(handler=_command_serve)
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """
+    Entry point of the ``bacap-parser`` command.
+    :param argv: Command-line arguments, if None, ``sys.argv`` is used.
+    :return: Exit code.
+    """
+    args = _build_argument_parser().parse_args(argv)
+    try:
+        return args.handler(args)
+    except (FileNotFoundError, ValueError, KeyError) as e:
+        print(f"bacap-parser: error: {e}", file=sys.stderr)
+        return 2
@@ -14,4 +14,54 @@ DEFAULT_BACAP_TAB_NAMES_MAP = {"adventure": "Adventure", "animal": "Animals", "b
 
 ARABIC_TO_ROMAN_MAP = {1000: "M", 900: "CM", 500: "D", 400: "CD", 100: "C", 90: "XC", 50: "L", 40: "XL", 10: "X", 9: "IX", 5: "V", 4: "IV", 1: "I"}
 
-MINIMAL_PACK_FORMAT = 48
\ No newline at end of file
+MINIMAL_PACK_FORMAT = 48
+
+# Keys of the criteria conditions whose string values are ids even without a namespace
+CRITERIA_ID_KEYS = frozenset(("id", "item", "items", "block", "blocks", "entity_type", "type", "fluid", "fluids", "dimension", "biome", "biomes",
+                              "structure", "structures", "effects", "enchantments", "potion", "recipe_id", "loot_table"))
+
+# Stages of the datapack loading pipeline reported to the LoadObserver
+LOAD_STAGES = ("index", "walk", "advancement", "json_decode", "validation", "type_recognition", "rewards", "nbt_decoding")
+# Stage that covers loading of a whole advancement file, used to find the slowest files
+SLOWEST_FILE_STAGE = "advancement"
+
+# Advancement attributes indexed by the SearchIndex and their weights
+SEARCH_FIELD_WEIGHTS = {"title": 3.0, "trophy.item.name": 2.0, "description": 1.0, "trophy.item.description": 1.0, "tab_display": 0.5}
+# Maximum number of indexed words a query word can match as a prefix
+SEARCH_MAX_PREFIX_EXPANSIONS = 64
+
+# Advancement attributes that support prefix completions
+COMPLETION_FIELDS = ("mc_path", "title")
+
+# Kinds of changes reported by the structural diff
+DIFF_KINDS = ("added", "removed", "moved_tab", "retitled", "reward_changed", "criteria_changed", "modified")
+# Changed fields (or the part of the field name before a dot) and their diff kinds, other fields are reported as "modified"
+DIFF_FIELD_KINDS = {"tab": "moved_tab", "title": "retitled", "exp": "reward_changed", "reward": "reward_changed",
+                    "trophy": "reward_changed", "reward_mcpath": "reward_changed", "criteria": "criteria_changed"}
+
+# Severities of the issues reported by the lint checks
+LINT_SEVERITIES = ("error", "warning")
+
+# Locale used by the LangIndex when a locale is not specified or does not contain a key
+DEFAULT_LOCALE = "en_us"
+
+# Maximum number of rendered components kept by ``TextComponent.of``, the least recently used ones are evicted first
+TEXT_COMPONENT_CACHE_SIZE = 4096
+# ANSI SGR codes of bold, italic, underlined, strikethrough and obfuscated (rendered as blinking) text
+TEXT_FORMATTING_ANSI_CODES = ("1", "3", "4", "9", "5")
+
+# Columns of the AdvancementStats column store: categorical columns to group by and integer value columns
+STATS_GROUP_COLUMNS = ("kind", "datapack", "namespace", "tab", "type", "frame", "reward_item")
+STATS_VALUE_COLUMNS = ("exp", "hidden", "reward_amount", "trophy")
+
+# Config file used by the ``bacap-parser`` command if ``--config`` is not given
+DEFAULT_CONFIG_FILE = "bacap-parser.toml"
+# Version of the snapshot format, snapshots of another version are parsed again
+SNAPSHOT_VERSION = "4"
+
+# Number of rendered responses kept by the QueryServer until the next reload, the least recently used ones are evicted first
+SERVER_CACHE_SIZE = 1024
+# Responses of at least this size (bytes) are gzip-compressed for clients that accept it
+SERVER_GZIP_MIN_SIZE = 1024
+# Maximum number of items returned by a single QueryServer request
+SERVER_MAX_LIMIT = 1000
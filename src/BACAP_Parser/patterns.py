@@ -5,3 +5,6 @@ reward_give_pattern = re.compile(r"give @\w (?P<item_id>.*?)(?P<components>\[.*?
 reward_summon_pattern = re.compile(r"summon minecraft:item.*?(?P<nbt>{.*})")
 trophy_give_pattern = re.compile(r"give @\w (?P<item_id>.*?)(?P<components>\[.*])\s*(?P<amount>\d*)")
 trophy_summon_pattern = re.compile(r"summon minecraft:item.*?(?P<nbt>{.*})")
+resource_location_pattern = re.compile(r"^#?[a-z0-9_.-]+:[a-z0-9_./-]+$")
+plain_id_pattern = re.compile(r"^#?[a-z0-9_./-]+$")
+search_token_pattern = re.compile(r"\w+")
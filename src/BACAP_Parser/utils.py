@@ -1,3 +1,4 @@
+import hashlib
 import json
 from collections.abc import Iterable, Sequence
 from pathlib import Path
@@ -43,6 +44,18 @@ def cut_namespace(string_with_namespace: str) -> str:
     return string_with_namespace
 
 
+def normalize_id(value: str) -> str:
+    """
+    :param value: Minecraft id or tag, with or without namespace.
+    :return: id with the ``minecraft`` namespace if it does not have one.
+    """
+    if ":" in value:
+        return value
+    if value.startswith("#"):
+        return f"#minecraft:{value[1:]}"
+    return f"minecraft:{value}"
+
+
 def to_collection[T, C: set | list | tuple | frozenset](item: Iterable[T] | T, constructor: Type[C]) -> C:
     """
     Converts an element or a collection of elements into a specified collection type.
@@ -98,6 +111,26 @@ def safe_load_json_string(string: str, object_hook_class: Type[dict | ExtendedDi
             return None
 
 
+def normalized_json(data) -> str:
+    """
+    :param data: JSON-serializable data.
+    :return: Compact JSON string with sorted keys, equal for equal data regardless of the key order.
+    """
+    return json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def content_hash(*parts: str) -> str:
+    """
+    :param parts: Strings to hash.
+    :return: Stable hex digest of the strings, separated by a zero byte.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
 def arabic_to_rims(value: int | str) -> str:
     """
     Converts an integer to its Roman numeral representation.
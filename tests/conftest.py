@@ -0,0 +1,120 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from BACAP_Parser import AdvType, AdvTypeManager, Color, Datapack, DEFAULT_BACAP_HIDDEN_COLOR, Parser, SymbolTable
+
+TABS = ("mining", "building", "adventure")
+FRAMES = ("task", "goal", "challenge")
+COLORS = ("green", "#75E1FF", "dark_purple")
+
+REWARD_FUNCTION = 'give @s minecraft:diamond 3\ntellraw @s {"translate":"item.minecraft.diamond"}\n'
+TROPHY_FUNCTION = ("give @s minecraft:netherite_sword[custom_name='{\"text\":\"Trophy %d\",\"color\":\"gold\"}',"
+                   "lore=['{\"text\":\"Line one\"}','{\"text\":\"Line two\"}','\"\"','{\"text\":\"x\"}','{\"text\":\"y\"}'],"
+                   "enchantment_glint_override=true] 1\n")
+
+
+def advancement_json(tab: str, i: int) -> dict:
+    """
+    :return: JSON of the i-th BACAP-like advancement of the tab, its frame and color follow the position.
+    """
+    description = {"translate": f"Do thing number {i} in {tab}", "color": COLORS[i % 3]}
+    if i % 4 == 0:
+        description["extra"] = [{"text": "\n"}, {"text": "extra words", "color": COLORS[i % 3]}]
+    adv_json = {
+        "display": {
+            "icon": {"id": "minecraft:stone" if i % 2 else "minecraft:diamond_pickaxe"},
+            "title": {"translate": f"Adv {tab} {i}"},
+            "description": description,
+            "frame": FRAMES[i % 3],
+            "hidden": i % 7 == 0,
+        },
+        "criteria": {f"crit_{j}": {"trigger": "minecraft:inventory_changed", "conditions": {"items": [{"items": "minecraft:diamond"}]}}
+                     if j % 2 else {"trigger": "minecraft:impossible"} for j in range(3)},
+        "rewards": {"function": f"bacap_rewards:{tab}/adv_{i}"},
+    }
+    if i >= 3:
+        adv_json["parent"] = f"blazeandcave:{tab}/adv_{i - 3}"
+    return adv_json
+
+
+def run_python(code: str, *args: str) -> subprocess.CompletedProcess:
+    """
+    Runs the code in a new interpreter that imports the package from the same path as the tests.
+    :raises subprocess.CalledProcessError: If the code fails.
+    """
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    return subprocess.run([sys.executable, "-c", code, *args], capture_output=True, text=True, check=True, env=env)
+
+
+def write_json(path: Path, data) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    return path
+
+
+def write_pack(root: Path, name: str, count: int = 9) -> Path:
+    """
+    Writes a small BACAP-like datapack with advancements, exp, reward and trophy functions and a technical advancement.
+    :param root: Folder of the datapack folders.
+    :param name: Name of the datapack folder.
+    :param count: Number of normal advancements.
+    :return: Path to the datapack.
+    """
+    pack = root / name
+    write_json(pack / "pack.mcmeta", {"pack": {"pack_format": 61, "description": f"test {name}"}})
+    advancements = pack / "data" / "blazeandcave" / "advancement"
+    rewards = pack / "data" / "bacap_rewards" / "function"
+    for i in range(count):
+        tab = TABS[i % 3]
+        write_json(advancements / tab / f"adv_{i}.json", advancement_json(tab, i))
+        for kind in ("exp", "reward", "trophy"):
+            (rewards / kind / tab).mkdir(parents=True, exist_ok=True)
+        (rewards / "exp" / tab / f"adv_{i}.mcfunction").write_text(f"xp add @s {i * 10}\n")
+        if i % 2:
+            (rewards / "reward" / tab / f"adv_{i}.mcfunction").write_text(REWARD_FUNCTION)
+        if i % 3 == 2:
+            (rewards / "trophy" / tab / f"adv_{i}.mcfunction").write_text(TROPHY_FUNCTION % i)
+    write_json(advancements / "technical" / "tick.json", {"criteria": {"tick": {"trigger": "minecraft:tick"}}})
+    return pack
+
+
+@pytest.fixture
+def adv_type_manager() -> AdvTypeManager:
+    return AdvTypeManager(
+        AdvType(name="task", frames="task", colors=Color("green")),
+        AdvType(name="goal", frames="goal", colors=Color("#75E1FF")),
+        AdvType(name="challenge", frames="challenge", colors=Color("dark_purple"), hidden_color=DEFAULT_BACAP_HIDDEN_COLOR),
+    )
+
+
+@pytest.fixture
+def packs(tmp_path: Path) -> Path:
+    """
+    :return: Folder with two identical sibling datapacks, ``bacaped`` and ``bacaped_hardcore``.
+    """
+    root = tmp_path / "datapacks"
+    write_pack(root, "bacaped")
+    write_pack(root, "bacaped_hardcore")
+    return root
+
+
+@pytest.fixture
+def make_datapack(packs: Path, adv_type_manager: AdvTypeManager):
+    def make(name: str = "bacaped", path: Path | None = None, **kwargs) -> Datapack:
+        return Datapack(name=name, path=path if path is not None else packs / name, adv_type_manager=adv_type_manager,
+                        reward_namespace="bacap_rewards", technical_tabs="technical", **kwargs)
+    return make
+
+
+@pytest.fixture
+def parser(make_datapack) -> Parser:
+    """
+    :return: Parser with both sibling datapacks, loaded with one symbol table so they share their content.
+    """
+    symbol_table = SymbolTable()
+    return Parser(make_datapack("bacaped", symbol_table=symbol_table), make_datapack("bacaped_hardcore", symbol_table=symbol_table))
@@ -0,0 +1,85 @@
+import sys
+
+import pytest
+
+from BACAP_Parser import Advancement, InvalidAdvancement, TechnicalAdvancement
+from BACAP_Parser.Advancement import JSONParsingError, MalformedAdvancement, MissingTitleField, UnrecognizedType
+from BACAP_Parser.AdvType import NoTypesMatch
+
+from conftest import advancement_json, write_json
+
+advancement_module = sys.modules["BACAP_Parser.Advancement"]
+
+
+def write_advancement(packs, tab: str, i: int, adv_json: dict | str):
+    path = packs / "bacaped" / "data" / "blazeandcave" / "advancement" / tab / f"adv_{i}.json"
+    if isinstance(adv_json, str):
+        path.write_text(adv_json, encoding="utf-8")
+    else:
+        write_json(path, adv_json)
+
+
+def test_advancements_of_a_datapack(make_datapack):
+    manager = make_datapack().advancement_manager
+    assert len(manager.adv_list) == 10
+    assert isinstance(manager.get("blazeandcave:technical/tick"), TechnicalAdvancement)
+
+    adv = manager.get("blazeandcave:adventure/adv_5")
+    assert isinstance(adv, Advancement)
+    assert (adv.title, adv.tab, adv.frame, adv.type.name, adv.hidden) == ("Adv adventure 5", "adventure", "challenge", "challenge", False)
+    assert adv.parent == "blazeandcave:adventure/adv_2"
+    assert adv.reward_mcpath == "bacap_rewards:adventure/adv_5"
+    assert (adv.exp.value, adv.reward.item.id, adv.trophy.item.id) == (50, "minecraft:diamond", "minecraft:netherite_sword")
+    assert [criteria.name for criteria in adv.criteria_list] == ["crit_0", "crit_1", "crit_2"]
+
+
+def test_namespace_less_reward_function(packs, make_datapack):
+    adv_json = advancement_json("mining", 0)
+    adv_json["rewards"]["function"] = "mining_reward"
+    write_advancement(packs, "mining", 0, adv_json)
+
+    adv = make_datapack().advancement_manager.get("blazeandcave:mining/adv_0")
+    assert isinstance(adv, Advancement)
+    assert adv.reward_mcpath == "minecraft:mining_reward"
+    assert adv.exp is None and adv.reward is None and adv.trophy is None
+
+
+def test_non_strict_mode_keeps_invalid_files(packs, make_datapack):
+    adv_json = advancement_json("mining", 0)
+    adv_json["display"]["frame"] = "unknown"
+    write_advancement(packs, "mining", 0, adv_json)
+    write_advancement(packs, "mining", 3, "{not json")
+    adv_json = advancement_json("mining", 6)
+    adv_json["display"]["icon"] = "minecraft:stone"
+    write_advancement(packs, "mining", 6, adv_json)
+    adv_json = advancement_json("building", 1)
+    adv_json["display"]["title"] = ["not", "a", "component"]
+    write_advancement(packs, "building", 1, adv_json)
+
+    with pytest.raises(NoTypesMatch):
+        make_datapack()
+
+    manager = make_datapack(strict=False).advancement_manager
+    assert len(manager.adv_list) == 10
+    reasons = {adv.mc_path: type(adv.reason) for adv in manager.adv_list if isinstance(adv, InvalidAdvancement)}
+    assert reasons == {"blazeandcave:mining/adv_0": UnrecognizedType, "blazeandcave:mining/adv_3": JSONParsingError,
+                       "blazeandcave:mining/adv_6": MalformedAdvancement, "blazeandcave:building/adv_1": MissingTitleField}
+
+
+def test_non_strict_mode_catches_unexpected_errors(make_datapack, monkeypatch):
+    item = advancement_module.Item
+
+    def broken_item(item_data):
+        if item_data["id"] == "minecraft:stone":
+            raise RuntimeError("broken icon")
+        return item(item_data)
+
+    monkeypatch.setattr(advancement_module, "Item", broken_item)
+    with pytest.raises(RuntimeError):
+        make_datapack()
+
+    manager = make_datapack(strict=False).advancement_manager
+    invalid = [adv for adv in manager.adv_list if isinstance(adv, InvalidAdvancement)]
+    # Odd advancements have the stone icon
+    assert sorted(adv.mc_path for adv in invalid) == sorted(f"blazeandcave:{('mining', 'building', 'adventure')[i % 3]}/adv_{i}" for i in (1, 3, 5, 7))
+    assert all(isinstance(adv.reason, MalformedAdvancement) and "broken icon" in str(adv.reason) for adv in invalid)
@@ -0,0 +1,69 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from BACAP_Parser import ParserConfig
+from BACAP_Parser.cli import main
+
+CONFIG = """
+snapshot = "cache/parsed.snapshot"
+
+[[types]]
+name = "task"
+frames = "task"
+colors = "green"
+
+[[types]]
+name = "goal"
+frames = "goal"
+colors = "#75E1FF"
+
+[[types]]
+name = "challenge"
+frames = "challenge"
+colors = "dark_purple"
+hidden_color = "#FF2A2A"
+"""
+
+DATAPACK = """
+[[datapacks]]
+name = "{name}"
+path = "datapacks/{name}"
+reward_namespace = "bacap_rewards"
+technical_tabs = ["technical"]
+"""
+
+
+@pytest.fixture
+def config(packs: Path) -> Path:
+    path = packs.parent / "bacap-parser.toml"
+    path.write_text(CONFIG + "".join(DATAPACK.format(name=name) for name in ("bacaped", "bacaped_hardcore")), encoding="utf-8")
+    return path
+
+
+def test_bench_with_snapshot_and_one_repeat(config, capsys):
+    assert main(["bench", "-c", str(config), "--repeat", "1", "--json"]) == 0
+    results = json.loads(capsys.readouterr().out)
+    assert {"parse_ms", "snapshot_key_ms", "stages", "snapshot_write_ms", "snapshot_read_ms", "snapshot_bytes"} <= set(results)
+    assert results["stages"]
+    assert (config.parent / "cache" / "parsed.snapshot").stat().st_size == results["snapshot_bytes"]
+
+    # The snapshot written by the bench is read back, it does not keep the profile collector of the first parse
+    parser, from_snapshot = ParserConfig.from_file(config).load()
+    assert from_snapshot
+    assert all(datapack.observer is None for datapack in parser.datapacks)
+
+
+def test_load_then_query_from_the_snapshot(config, capsys):
+    assert main(["load", "-c", str(config)]) == 0
+    assert "snapshot written" in capsys.readouterr().out
+
+    assert main(["query", "adv mining 3", "-c", str(config), "--datapack", "bacaped", "--limit", "1", "--json"]) == 0
+    results = json.loads(capsys.readouterr().out)
+    assert [(result["datapack"], result["mc_path"]) for result in results] == [("bacaped", "blazeandcave:mining/adv_3")]
+
+
+def test_errors_exit_with_code_2(tmp_path, capsys):
+    assert main(["load", "-c", str(tmp_path / "missing.toml")]) == 2
+    assert capsys.readouterr().err.startswith("bacap-parser: error:")
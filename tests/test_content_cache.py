@@ -0,0 +1,177 @@
+import copy
+import gc
+import pickle
+
+import pytest
+
+from BACAP_Parser import ContentCache, CriteriaList, ExtendedDict, FrozenCriteriaList, FrozenDict, FrozenList, SymbolTable
+
+from test_criteria_list import _assert_indexed, criteria_list  # noqa: F401
+
+
+def _siblings(parser, mc_path: str):
+    return tuple(datapack.advancement_manager.get(mc_path) for datapack in parser.datapacks)
+
+
+def test_siblings_share_parsed_content(parser):
+    for adv in parser.datapacks[0].advancement_manager.filtered_list():
+        first, second = _siblings(parser, adv.mc_path)
+        assert first is not second
+        assert first.json is second.json
+        assert first.criteria_list is second.criteria_list
+        assert first.icon is second.icon
+        assert first.exp is not second.exp and first.exp.value == second.exp.value
+
+    assert parser.symbol_table.content.stats["json"] == len(parser.datapacks[0].advancement_manager.adv_list)
+
+
+def test_shared_content_is_read_only(parser):
+    adv = parser.datapacks[0].advancement_manager.get("blazeandcave:adventure/adv_2")
+    assert isinstance(adv.json, FrozenDict)
+    assert isinstance(adv.json["display"], FrozenDict)
+    assert isinstance(adv.criteria_list, FrozenCriteriaList)
+    items = adv.json["criteria"]["crit_1"]["conditions"]["items"]
+    assert isinstance(items, FrozenList)
+
+    with pytest.raises(TypeError):
+        adv.json["parent"] = "blazeandcave:adventure/adv_0"
+    with pytest.raises(TypeError):
+        adv.json["display"].update(hidden=True)
+    with pytest.raises(TypeError):
+        del adv.json["rewards"]
+    with pytest.raises(TypeError):
+        items.append({"items": "minecraft:stone"})
+    with pytest.raises(TypeError):
+        adv.criteria_list.pop()
+
+    # Copies are mutable and do not change the shared JSON
+    adv_json = copy.deepcopy(adv.json)
+    assert type(adv_json) is ExtendedDict and type(adv_json["display"]) is ExtendedDict
+    assert type(adv_json["criteria"]["crit_1"]["conditions"]["items"]) is list
+    assert adv_json == adv.json
+    adv_json["display"]["hidden"] = True
+    adv_json["criteria"]["crit_1"]["conditions"]["items"].append({"items": "minecraft:stone"})
+    assert adv.json["display"]["hidden"] is False
+    assert len(items) == 1
+
+
+def test_frozen_json_survives_pickle(parser):
+    adv_json = parser.datapacks[0].advancement_manager.get("blazeandcave:adventure/adv_2").json
+    restored = pickle.loads(pickle.dumps(adv_json))
+    assert type(restored) is FrozenDict and restored == adv_json
+    assert type(restored["criteria"]["crit_1"]["conditions"]["items"]) is FrozenList
+    with pytest.raises(TypeError):
+        restored["parent"] = None
+
+
+def test_rewards_have_own_paths_and_share_items(parser):
+    first, second = _siblings(parser, "blazeandcave:building/adv_1")
+    for first_reward, second_reward, kind in ((first.exp, second.exp, "exp"), (first.reward, second.reward, "reward")):
+        assert first_reward is not second_reward
+        assert first_reward.path != second_reward.path
+        assert first_reward.path.is_relative_to(parser.datapacks[0].path)
+        assert second_reward.path.is_relative_to(parser.datapacks[1].path)
+        assert first_reward.mcpath == second_reward.mcpath == f"bacap_rewards:{kind}/building/adv_1"
+    assert first.reward.item is second.reward.item
+
+    # Reward files with equal content in one datapack share the item as well
+    other = parser.datapacks[0].advancement_manager.get("blazeandcave:mining/adv_3")
+    assert other.reward.mcpath == "bacap_rewards:reward/mining/adv_3"
+    assert other.reward.item is first.reward.item
+
+    first, second = _siblings(parser, "blazeandcave:adventure/adv_2")
+    assert first.trophy.path != second.trophy.path
+    assert first.trophy.item is second.trophy.item
+
+
+def test_cache_does_not_grow_over_reloads(parser):
+    content = parser.symbol_table.content
+    gc.collect()
+    stats = content.stats
+    assert stats["json"] and stats["rewards"]
+
+    for _ in range(3):
+        parser.reload()
+        gc.collect()
+        assert (content.stats["json"], content.stats["rewards"]) == (stats["json"], stats["rewards"])
+    # Reloaded datapacks still share their content
+    first, second = _siblings(parser, "blazeandcave:building/adv_1")
+    assert first.json is second.json and first.reward.item is second.reward.item
+
+    # Entries disappear with the last advancement that uses them
+    for name in list(parser.datapacks_dict):
+        parser.remove_datapack(name)
+    del first, second
+    gc.collect()
+    assert (content.stats["json"], content.stats["rewards"]) == (0, 0)
+    assert content._derived == {}
+
+
+def test_clear_keeps_loaded_values(parser):
+    content = parser.symbol_table.content
+    adv = parser.datapacks[0].advancement_manager.get("blazeandcave:building/adv_1")
+    content.clear()
+    assert len(content) == 0
+    assert not content.owns(adv.json)
+    assert adv.criteria_list and adv.icon.id == "minecraft:stone"
+
+
+def test_load_json_without_symbol_table(tmp_path):
+    content = ContentCache()
+    (tmp_path / "a.json").write_text('{"criteria": {"a": {"trigger": "minecraft:tick"}}}')
+    (tmp_path / "b.json").write_text('{"criteria": {"a": {"trigger": "minecraft:tick"}}}')
+    (tmp_path / "list.json").write_text("[1, 2]")
+
+    adv_json = content.load_json(tmp_path / "a.json")
+    assert content.load_json(tmp_path / "b.json") is adv_json
+    assert content.owns(adv_json)
+    assert content.stats == {"json": 1, "rewards": 0, "lookups": 2, "hits": 1}
+    assert content.derived(adv_json, "criteria", lambda: FrozenCriteriaList(adv_json["criteria"])) is \
+           content.derived(adv_json, "criteria", lambda: FrozenCriteriaList(adv_json["criteria"]))
+
+    # JSON that is not an object is not shared, neither are values derived from it
+    not_shared = content.load_json(tmp_path / "list.json")
+    assert not_shared == [1, 2] and not content.owns(not_shared)
+    assert content.derived(not_shared, "key", list) is not content.derived(not_shared, "key", list)
+
+
+def test_pickle_drops_the_shared_content(parser):
+    symbol_table = pickle.loads(pickle.dumps(parser.symbol_table))
+    assert isinstance(symbol_table, SymbolTable)
+    assert symbol_table.content._symbol_table is symbol_table
+    assert len(symbol_table.content) == 0
+
+
+def test_frozen_criteria_list_is_read_only(criteria_list):  # noqa: F811
+    frozen = FrozenCriteriaList(criteria_list)
+    assert frozen == criteria_list
+    _assert_indexed(frozen)
+
+    criteria = criteria_list[0]
+    for mutate in (lambda: frozen.append(criteria), lambda: frozen.insert(0, criteria), lambda: frozen.extend([criteria]),
+                   lambda: frozen.remove("a"), frozen.pop, frozen.clear, frozen.sort, frozen.reverse):
+        with pytest.raises(TypeError):
+            mutate()
+    with pytest.raises(TypeError):
+        frozen[0] = criteria
+    with pytest.raises(TypeError):
+        del frozen[0]
+    with pytest.raises(TypeError):
+        frozen += [criteria]
+    with pytest.raises(TypeError):
+        frozen *= 2
+    assert frozen == criteria_list
+
+
+def test_frozen_criteria_list_copies_are_mutable(criteria_list):  # noqa: F811
+    frozen = FrozenCriteriaList(criteria_list)
+    other = CriteriaList(criteria_list[:1])
+    for result in (frozen | other, other | frozen, frozen & other, frozen ^ other, frozen + other, copy.deepcopy(frozen)):
+        assert type(result) is CriteriaList
+        _assert_indexed(result)
+        result.clear()
+    assert len(frozen) == 3
+
+    restored = pickle.loads(pickle.dumps(frozen))
+    assert type(restored) is FrozenCriteriaList and restored == frozen
+    _assert_indexed(restored)
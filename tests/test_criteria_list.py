@@ -0,0 +1,154 @@
+import copy
+import pickle
+
+import pytest
+
+from BACAP_Parser import Criteria, CriteriaList
+
+
+def _index(criteria_list: CriteriaList) -> tuple[dict, dict]:
+    """
+    :return: Index the list would have if it was built from scratch.
+    """
+    rebuilt = CriteriaList(list(criteria_list))
+    return rebuilt._keys, rebuilt._names
+
+
+def _assert_indexed(criteria_list: CriteriaList):
+    assert (criteria_list._keys, criteria_list._names) == _index(criteria_list)
+
+
+@pytest.fixture
+def criteria_list() -> CriteriaList:
+    return CriteriaList({
+        "a": {"trigger": "minecraft:tick"},
+        "b": {"trigger": "minecraft:inventory_changed", "conditions": {"items": [{"items": "minecraft:stone"}]}},
+        "c": {"trigger": "impossible"},
+    })
+
+
+def test_build_from_dict(criteria_list):
+    assert [criteria.name for criteria in criteria_list] == ["a", "b", "c"]
+    assert criteria_list[1].conditions == {"items": [{"items": "minecraft:stone"}]}
+    assert criteria_list._keys == {("a", "minecraft:tick"): 1, ("b", "minecraft:inventory_changed"): 1, ("c", "impossible"): 1}
+    assert criteria_list._names == {"a": 1, "b": 1, "c": 1}
+    assert not criteria_list.is_all_impossible()
+
+
+def test_build_rejects_other_types():
+    with pytest.raises(TypeError):
+        CriteriaList([Criteria("a", "minecraft:tick"), "b"])
+    with pytest.raises(TypeError):
+        CriteriaList("a")
+
+
+def test_contains_and_count(criteria_list):
+    assert Criteria("a", "minecraft:tick") in criteria_list
+    assert Criteria("a", "minecraft:location") not in criteria_list
+    with pytest.raises(TypeError):
+        _ = "a" in criteria_list
+
+    criteria_list.append(Criteria("a", "minecraft:location"))
+    assert criteria_list.count("a") == 2
+    assert criteria_list.count("missing") == 0
+    assert criteria_list.count(Criteria("a", "minecraft:tick")) == 1
+
+
+def test_append_and_insert_raise_on_other_types(criteria_list):
+    with pytest.raises(TypeError):
+        criteria_list.append("d")
+    with pytest.raises(TypeError):
+        criteria_list.insert(0, {"trigger": "minecraft:tick"})
+    assert len(criteria_list) == 3
+    _assert_indexed(criteria_list)
+
+
+def test_mutators_keep_the_index(criteria_list):
+    criteria_list.insert(0, Criteria("d", "minecraft:tick"))
+    _assert_indexed(criteria_list)
+
+    criteria_list.extend([Criteria("e", "minecraft:tick"), Criteria("a", "minecraft:tick")])
+    _assert_indexed(criteria_list)
+    assert criteria_list._keys[("a", "minecraft:tick")] == 2
+
+    criteria_list += [Criteria("f", "minecraft:tick")]
+    _assert_indexed(criteria_list)
+
+    criteria_list[0] = Criteria("g", "minecraft:tick")
+    _assert_indexed(criteria_list)
+    assert "d" not in criteria_list._names
+
+    criteria_list[1:3] = [Criteria("h", "minecraft:tick")]
+    _assert_indexed(criteria_list)
+
+    del criteria_list[0]
+    _assert_indexed(criteria_list)
+
+    del criteria_list[::2]
+    _assert_indexed(criteria_list)
+
+    criteria_list.pop()
+    _assert_indexed(criteria_list)
+
+    criteria_list *= 3
+    _assert_indexed(criteria_list)
+
+    criteria_list.clear()
+    assert criteria_list._keys == {} and criteria_list._names == {}
+
+
+def test_setitem_rejects_other_types(criteria_list):
+    with pytest.raises(TypeError):
+        criteria_list[0] = "d"
+    with pytest.raises(TypeError):
+        criteria_list[0:1] = ["d"]
+    assert [criteria.name for criteria in criteria_list] == ["a", "b", "c"]
+    _assert_indexed(criteria_list)
+
+
+def test_remove_by_name_and_by_criteria(criteria_list):
+    criteria_list.extend([Criteria("a", "minecraft:location"), Criteria("a", "minecraft:tick")])
+
+    criteria_list.remove(Criteria("a", "minecraft:tick"))
+    assert [(criteria.name, criteria.trigger) for criteria in criteria_list] == \
+           [("b", "minecraft:inventory_changed"), ("c", "impossible"), ("a", "minecraft:location")]
+    _assert_indexed(criteria_list)
+
+    criteria_list.remove("a")
+    assert [criteria.name for criteria in criteria_list] == ["b", "c"]
+    _assert_indexed(criteria_list)
+
+    # Missing criteria are ignored
+    criteria_list.remove("missing")
+    criteria_list.remove(Criteria("b", "minecraft:tick"))
+    assert len(criteria_list) == 2
+
+
+def test_set_operations(criteria_list):
+    other = CriteriaList([Criteria("b", "minecraft:inventory_changed"), Criteria("d", "minecraft:tick")])
+
+    assert [criteria.name for criteria in criteria_list & other] == ["b"]
+    assert [criteria.name for criteria in criteria_list ^ other] == ["a", "c", "d"]
+    assert [criteria.name for criteria in criteria_list | other] == ["a", "b", "c", "d"]
+    assert [criteria.name for criteria in criteria_list + other] == ["a", "b", "c", "b", "d"]
+    for result in (criteria_list & other, criteria_list ^ other, criteria_list | other, criteria_list + other):
+        assert type(result) is CriteriaList
+        _assert_indexed(result)
+
+    with pytest.raises(TypeError):
+        _ = criteria_list | [Criteria("d", "minecraft:tick")]
+
+
+def test_by_trigger_keeps_the_list_order(criteria_list):
+    criteria_list.append(Criteria("d", "minecraft:tick"))
+    groups = criteria_list.by_trigger()
+    assert list(groups) == ["minecraft:tick", "minecraft:inventory_changed", "impossible"]
+    assert [criteria.name for criteria in groups["minecraft:tick"]] == ["a", "d"]
+
+
+def test_pickle_and_deepcopy_keep_the_index(criteria_list):
+    for restored in (pickle.loads(pickle.dumps(criteria_list)), copy.deepcopy(criteria_list)):
+        assert type(restored) is CriteriaList
+        assert restored == criteria_list
+        _assert_indexed(restored)
+
@@ -0,0 +1,53 @@
+import json
+
+import pytest
+
+from BACAP_Parser import LangIndex
+
+from conftest import advancement_json, write_json
+
+MC_PATH = "blazeandcave:mining/adv_0"
+
+
+@pytest.fixture
+def load_description(packs, make_datapack):
+    """
+    :return: Function that writes the description component of an advancement with the green (#55FF55) color and loads it.
+    """
+    def load(description: dict, lang_index: LangIndex | None = None):
+        adv_json = advancement_json("mining", 0)
+        adv_json["display"]["description"] = {"translate": "Do X", "color": "#55FF55", **description}
+        write_json(packs / "bacaped" / "data" / "blazeandcave" / "advancement" / "mining" / "adv_0.json", adv_json)
+        return make_datapack(lang_index=lang_index).advancement_manager.get(MC_PATH)
+    return load
+
+
+@pytest.mark.parametrize(("extra", "expected"), [
+    ([], "Do X"),
+    ([{"text": "\n"}, {"text": " more", "color": "#55FF55"}], "Do X\n more"),
+    ([{"text": "\n"}, {"text": " (addon note)"}, {"text": " other", "color": "red"}], "Do X"),
+    ([{"text": " more", "color": "#55FF55"}, {"text": "\n\n"}], "Do X more"),
+    ([{"translate": "key.of.part", "color": "#55FF55"}], "Do Xkey.of.part"),
+    (["", {}, {"text": " more", "color": "#55FF55"}], "Do X more"),
+])
+def test_extra_parts_of_the_advancement_color_are_kept(load_description, extra, expected):
+    adv = load_description({"extra": extra})
+    assert adv.description == expected
+    assert adv.description_text() == expected
+
+
+def test_extra_colors_are_compared_with_the_hex_value(load_description):
+    adv = load_description({"color": "green", "extra": [{"text": " skipped", "color": "green"}, {"text": " kept", "color": "#55FF55"}]})
+    assert adv.color.value == "#55FF55"
+    assert adv.description == "Do X kept"
+
+
+def test_description_text_translates_every_part(tmp_path, load_description):
+    lang = tmp_path / "en_us.json"
+    lang.write_text(json.dumps({"Do X": "Do the thing", "key.of.part": " translated"}), encoding="utf-8")
+    adv = load_description({"extra": [{"translate": "key.of.part", "color": "#55FF55"}, {"translate": "key.of.part"}, {"text": "\n"}]},
+                           LangIndex(lang))
+
+    # The raw description does not use the LangIndex
+    assert adv.description == "Do Xkey.of.part"
+    assert adv.description_text() == "Do the thing translated"
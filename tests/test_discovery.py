@@ -0,0 +1,93 @@
+import pickle
+import shutil
+import threading
+import zipfile
+
+import pytest
+
+from BACAP_Parser import Advancement, DatapackProfile, Item, ItemRegistry, Parser, discover_datapacks
+
+from conftest import write_json, write_pack
+
+
+@pytest.fixture
+def profiles(adv_type_manager) -> list[DatapackProfile]:
+    return [DatapackProfile("bacap", "blazeandcave", adv_type_manager, "bacap_rewards", "technical")]
+
+
+@pytest.fixture
+def world(tmp_path):
+    """
+    :return: ``datapacks`` folder with 6 copies of the test datapack.
+    """
+    root = tmp_path / "world" / "datapacks"
+    write_pack(root, "bacap_0")
+    for i in range(1, 6):
+        shutil.copytree(root / "bacap_0", root / f"bacap_{i}")
+    return root
+
+
+def test_discover_records_errors_of_unmatched_packs(world, profiles, tmp_path):
+    write_json(world / "other" / "pack.mcmeta", {"pack": {"pack_format": 61, "description": "other"}})
+    (world / "other" / "data" / "other_namespace").mkdir(parents=True)
+    (world / "broken").mkdir()
+    with zipfile.ZipFile(world / "zipped.zip", "w") as archive:
+        for path in (world / "bacap_0").rglob("*"):
+            archive.write(path, path.relative_to(world / "bacap_0"))
+
+    candidates = {candidate.name: candidate for candidate in discover_datapacks(world, profiles, extract_to=tmp_path / "extracted")}
+    assert sorted(candidates) == ["bacap_0", "bacap_1", "bacap_2", "bacap_3", "bacap_4", "bacap_5", "broken", "other", "zipped"]
+    assert candidates["other"].datapack is None and candidates["other"].profile is None
+    assert candidates["broken"].datapack is None and candidates["broken"].error is not None
+    assert candidates["zipped"].path == tmp_path / "extracted" / "zipped"
+    assert candidates["zipped"].datapack.fingerprint == candidates["bacap_0"].datapack.fingerprint
+
+    with pytest.raises(FileNotFoundError):
+        discover_datapacks(tmp_path / "missing", profiles)
+
+
+def test_threaded_discovery_shares_content(world, profiles):
+    fingerprints = set()
+    for _ in range(3):
+        parser = Parser()
+        parser.discover(world, profiles, max_workers=6)
+        assert [datapack.name for datapack in parser.datapacks] == [f"bacap_{i}" for i in range(6)]
+
+        first = {adv.mc_path: adv for adv in parser.datapacks[0].advancement_manager.adv_list}
+        for datapack in parser.datapacks[1:]:
+            for adv in datapack.advancement_manager.adv_list:
+                assert adv.json is first[adv.mc_path].json
+                if isinstance(adv, Advancement):
+                    assert adv.icon is first[adv.mc_path].icon
+                    assert adv.title is first[adv.mc_path].title
+        assert parser.symbol_table.content.stats["json"] == len(first)
+        assert len({datapack.fingerprint for datapack in parser.datapacks}) == 1
+        fingerprints.add(parser.fingerprint)
+    assert len(fingerprints) == 1
+
+    restored = pickle.loads(pickle.dumps(parser))
+    assert restored.fingerprint == parser.fingerprint
+    assert restored.symbol_table.content._symbol_table is restored.symbol_table
+
+
+def test_item_registry_returns_one_instance_to_all_threads():
+    registry = ItemRegistry()
+    barrier = threading.Barrier(8)
+    results = []
+
+    def register():
+        barrier.wait()
+        results.extend(registry.canonical(Item({"id": f"minecraft:item_{i % 10}", "components": {"a": i % 10}})) for i in range(200))
+
+    threads = [threading.Thread(target=register) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(registry) == 10
+    assert len({id(item) for item in results}) == 10
+
+    restored = pickle.loads(pickle.dumps(registry))
+    assert len(restored) == 10
+    assert restored.canonical(Item({"id": "minecraft:item_0", "components": {"a": 0}})).id == "minecraft:item_0"
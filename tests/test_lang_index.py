@@ -0,0 +1,92 @@
+import json
+import os
+import pickle
+import zipfile
+
+import pytest
+
+from BACAP_Parser import LangIndex
+
+
+def write_lang(path, translations: dict):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(translations), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def sources(tmp_path):
+    """
+    :return: Resource pack folder and zip file, the zip file overrides one key of the folder.
+    """
+    pack = tmp_path / "pack"
+    write_lang(pack / "assets" / "minecraft" / "lang" / "en_us.json", {"a": "A", "b": "B", "only.english": "English"})
+    write_lang(pack / "assets" / "minecraft" / "lang" / "de_de.json", {"a": "A (de)"})
+    with zipfile.ZipFile(tmp_path / "addon.zip", "w") as archive:
+        archive.writestr("assets/addon/lang/en_us.json", json.dumps({"b": "B (addon)", "c": "C"}))
+    return pack, tmp_path / "addon.zip"
+
+
+def test_lookups(sources):
+    lang_index = LangIndex(*sources)
+    assert lang_index.locales == ["de_de", "en_us"] and "EN_US" in lang_index
+    assert lang_index.loaded_locales == []
+
+    assert lang_index.get("a") == "A"
+    # Later sources win
+    assert lang_index.get("b") == "B (addon)" and lang_index.get("c") == "C"
+    assert lang_index.get("a", "de_de") == "A (de)"
+    # Missing keys fall back to the fallback locale, then to the default
+    assert lang_index.get("only.english", "de_de") == "English"
+    assert lang_index.get("missing", "de_de", "default") == "default"
+    assert lang_index.translate("missing") == "missing"
+    assert LangIndex(*sources, fallback_locale=None).get("only.english", "de_de") is None
+
+    assert lang_index.loaded_locales == ["de_de", "en_us"]
+    lang_index.unload("de_de")
+    assert lang_index.loaded_locales == ["en_us"]
+
+    restored = pickle.loads(pickle.dumps(lang_index))
+    assert restored.loaded_locales == [] and restored.get("c") == "C"
+
+    with pytest.raises(FileNotFoundError):
+        LangIndex(sources[0] / "missing")
+
+
+def test_stored_tables_are_reused(sources, tmp_path):
+    storage = tmp_path / "storage"
+    first = LangIndex(*sources, storage=storage)
+    first.load()
+    tables = sorted(path.name for path in storage.iterdir())
+    assert len(tables) == 2 and all(name.endswith(".lang.bin") for name in tables)
+    first.unload()
+
+    mtimes = {path.name: path.stat().st_mtime_ns for path in storage.iterdir()}
+    second = LangIndex(*sources, storage=storage)
+    assert second.get("b") == "B (addon)"
+    assert {path.name: path.stat().st_mtime_ns for path in storage.iterdir()} == mtimes
+    second.unload()
+
+
+def test_stored_tables_are_rebuilt_when_sources_change(sources, tmp_path):
+    storage = tmp_path / "storage"
+    pack, addon = sources
+    lang_index = LangIndex(pack, addon, storage=storage)
+    assert lang_index.get("b") == "B (addon)"
+    lang_index.unload()
+    old_tables = set(storage.glob("en_us.*.lang.bin"))
+
+    # A changed source gets a new table, the old one is removed
+    lang_file = write_lang(pack / "assets" / "minecraft" / "lang" / "en_us.json", {"a": "Changed A"})
+    stat = lang_file.stat()
+    os.utime(lang_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    lang_index = LangIndex(pack, addon, storage=storage)
+    assert lang_index.get("a") == "Changed A" and lang_index.get("only.english") is None
+    lang_index.unload()
+    tables = set(storage.glob("en_us.*.lang.bin"))
+    assert len(tables) == 1 and not tables & old_tables
+
+    # Another source list gets another table as well
+    lang_index = LangIndex(pack, storage=storage)
+    assert lang_index.get("b") is None and lang_index.get("a") == "Changed A"
+    lang_index.unload()
@@ -0,0 +1,31 @@
+from types import ModuleType
+
+import pytest
+
+import BACAP_Parser
+
+from conftest import run_python
+
+
+def test_import_is_lazy():
+    code = "import sys, BACAP_Parser; print(sorted(name for name in sys.modules if name.startswith('BACAP_Parser.')))"
+    assert run_python(code).stdout.strip() == "[]"
+
+
+def test_public_names_are_not_submodules_after_submodule_imports():
+    # Imports submodules first, like the ``bacap-parser`` entry point, before the names are used
+    code = ("import BACAP_Parser.Advancement, BACAP_Parser.Color, BACAP_Parser.cli, BACAP_Parser; from types import ModuleType; "
+            "from BACAP_Parser import Color, Parser; "
+            "print(isinstance(Color, type), isinstance(Parser, type), "
+            "[name for name in BACAP_Parser.__all__ if isinstance(vars(BACAP_Parser).get(name), ModuleType)])")
+    assert run_python(code).stdout.strip() == "True True []"
+
+
+def test_public_names_resolve():
+    for name in BACAP_Parser.__all__:
+        value = getattr(BACAP_Parser, name)
+        assert not isinstance(value, ModuleType), name
+    assert set(BACAP_Parser.__all__) <= set(dir(BACAP_Parser))
+
+    with pytest.raises(AttributeError):
+        _ = BACAP_Parser.missing_name
@@ -0,0 +1,47 @@
+import pytest
+
+from BACAP_Parser import LoadObserver, ProfileCollector
+from BACAP_Parser.constants import LOAD_STAGES
+
+
+def test_base_observer_ignores_stages(make_datapack):
+    class SilentObserver(LoadObserver):
+        pass
+
+    observer = SilentObserver()
+    observer.on_stage("walk", 0.0, 0.1)
+    datapack = make_datapack(observer=observer)
+    assert datapack.advancement_manager.adv_list
+
+
+def test_collector_profiles_a_load(make_datapack):
+    collector = ProfileCollector(slowest=3, trace=True)
+    datapack = make_datapack(observer=collector)
+    profile = collector.as_dict()
+
+    advancements = len(datapack.advancement_manager.adv_list)
+    assert profile["stages"]["advancement"]["count"] == advancements
+    assert profile["stages"]["json_decode"]["count"] == advancements
+    assert all(values["total"] >= 0 and values["count"] > 0 for values in profile["stages"].values())
+
+    slowest = collector.slowest_files
+    assert len(slowest) == 3
+    assert [duration for _, duration in slowest] == sorted((duration for _, duration in slowest), reverse=True)
+
+    events = collector.to_chrome_trace()["traceEvents"]
+    assert len(events) == sum(values["count"] for values in profile["stages"].values())
+
+    collector.reset()
+    assert collector.as_dict() == {"stages": {}, "slowest_files": []}
+    with pytest.raises(ValueError):
+        ProfileCollector().to_chrome_trace()
+
+
+def test_index_and_walk_are_separate_stages(make_datapack):
+    collector = ProfileCollector()
+    make_datapack(observer=collector)
+    stages = collector.as_dict()["stages"]
+    assert set(stages) <= set(LOAD_STAGES)
+    # The DataIndex scan runs once per datapack, the walk over the indexed advancement files is reported on its own
+    assert stages["index"]["count"] == 1
+    assert "walk" in stages
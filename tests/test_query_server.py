@@ -0,0 +1,137 @@
+import gzip
+import json
+import sys
+import urllib.error
+import urllib.request
+
+import pytest
+
+from BACAP_Parser import QueryServer
+
+from conftest import advancement_json, write_json
+
+# ``BACAP_Parser.QueryServer`` is the class, the module is only in sys.modules
+query_server = sys.modules["BACAP_Parser.QueryServer"]
+
+
+def get(url: str, headers: dict | None = None) -> tuple[int, dict, object]:
+    """
+    :return: Status, headers and the decoded JSON body (None for responses without a body).
+    """
+    try:
+        with urllib.request.urlopen(urllib.request.Request(url, headers=headers or {})) as response:
+            body = response.read()
+            if response.headers.get("Content-Encoding") == "gzip":
+                body = gzip.decompress(body)
+            return response.status, dict(response.headers), json.loads(body) if body else None
+    except urllib.error.HTTPError as e:
+        body = e.read()
+        return e.code, dict(e.headers), json.loads(body) if body else None
+
+
+@pytest.fixture
+def server(parser):
+    with QueryServer(parser, port=0) as server:
+        yield server
+
+
+def test_endpoints(server):
+    status, _, datapacks = get(server.url + "/datapacks")
+    assert status == 200
+    assert [datapack["name"] for datapack in datapacks] == ["bacaped", "bacaped_hardcore"]
+
+    status, _, advancements = get(server.url + "/advancement/blazeandcave:adventure/adv_2?datapack=bacaped")
+    assert status == 200 and [adv["title"] for adv in advancements] == ["Adv adventure 2"]
+
+    status, _, results = get(server.url + "/search?q=mining+3&datapack=bacaped_hardcore")
+    assert status == 200 and results[0]["mc_path"] == "blazeandcave:mining/adv_3"
+
+    assert get(server.url + "/search")[0] == 400
+    assert get(server.url + "/advancements?limit=x")[0] == 400
+    assert get(server.url + "/advancement/blazeandcave:missing")[0] == 404
+    assert get(server.url + "/missing")[0] == 404
+
+
+def test_if_none_match(server):
+    status, headers, _ = get(server.url + "/datapacks")
+    etag = headers["ETag"]
+    assert etag == f"\"{server.parser.fingerprint}\""
+    assert headers["Vary"] == "Accept-Encoding"
+
+    for if_none_match in (etag, f"W/{etag}", f"\"other\", {etag}", "*"):
+        status, headers, body = get(server.url + "/datapacks", {"If-None-Match": if_none_match})
+        assert (status, headers["ETag"], body) == (304, etag, None)
+    assert get(server.url + "/datapacks", {"If-None-Match": "\"other\""})[0] == 200
+
+    # Errors are never 304, even if the tag matches the one of the parser
+    for path in ("/missing", "/advancement/blazeandcave:missing", "/search"):
+        status, headers, _ = get(server.url + path, {"If-None-Match": etag})
+        assert status in (400, 404) and "ETag" not in headers
+
+
+def test_gzip_responses_have_their_own_etag(server, monkeypatch):
+    monkeypatch.setattr(query_server, "SERVER_GZIP_MIN_SIZE", 0)
+    status, headers, identity = get(server.url + "/advancements?datapack=bacaped")
+    etag = headers["ETag"]
+    assert "Content-Encoding" not in headers
+
+    status, headers, compressed = get(server.url + "/advancements?datapack=bacaped", {"Accept-Encoding": "gzip"})
+    assert headers["Content-Encoding"] == "gzip"
+    assert headers["ETag"] == etag[:-1] + "-gzip\""
+    assert compressed == identity
+
+    assert get(server.url + "/advancements?datapack=bacaped", {"Accept-Encoding": "gzip", "If-None-Match": headers["ETag"]})[0] == 304
+    # The gzip tag does not validate the identity body and the other way round
+    assert get(server.url + "/advancements?datapack=bacaped", {"If-None-Match": headers["ETag"]})[0] == 200
+    assert get(server.url + "/advancements?datapack=bacaped", {"Accept-Encoding": "gzip", "If-None-Match": etag})[0] == 200
+
+
+def test_reload_in_place_changes_the_responses(server, packs):
+    url = server.url + "/advancement/blazeandcave:adventure/adv_2?datapack=bacaped"
+    _, headers, advancements = get(url)
+    etag = headers["ETag"]
+    assert advancements[0]["title"] == "Adv adventure 2"
+
+    adv_json = advancement_json("adventure", 2)
+    adv_json["display"]["title"]["translate"] = "Changed title"
+    write_json(packs / "bacaped" / "data" / "blazeandcave" / "advancement" / "adventure" / "adv_2.json", adv_json)
+    server.parser.reload()
+
+    status, headers, advancements = get(url, {"If-None-Match": etag})
+    assert status == 200 and headers["ETag"] != etag
+    assert advancements[0]["title"] == "Changed title"
+
+
+def test_response_cache_evicts_least_recently_used(parser, monkeypatch):
+    monkeypatch.setattr(query_server, "SERVER_CACHE_SIZE", 2)
+    model = query_server._Model(parser)
+    etag = model.refresh()
+    for path in ("/a", "/b"):
+        model.store(path, (etag, path.encode(), None))
+
+    assert model.response("/a", etag) is not None
+    model.store("/c", (etag, b"/c", None))
+    assert list(model._responses) == ["/a", "/c"]
+    assert model.response("/b", etag) is None
+    assert model.response("/a", "other") is None
+
+
+def test_parser_fingerprint_is_cached(parser, packs):
+    fingerprint = parser.fingerprint
+    cached = parser._fingerprint
+    assert parser.fingerprint is fingerprint and parser._fingerprint is cached
+
+    # Reloading without changes gives the same fingerprint, changed files a new one
+    parser.reload()
+    assert parser.fingerprint == fingerprint and parser._fingerprint is not cached
+    adv_json = advancement_json("adventure", 2)
+    adv_json["display"]["hidden"] = True
+    write_json(packs / "bacaped" / "data" / "blazeandcave" / "advancement" / "adventure" / "adv_2.json", adv_json)
+    parser.reload("bacaped")
+    assert parser.fingerprint != fingerprint
+
+    removed = parser.remove_datapack("bacaped_hardcore")
+    without = parser.fingerprint
+    assert without != fingerprint
+    parser.add_datapack(removed)
+    assert parser.fingerprint != without
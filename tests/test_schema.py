@@ -0,0 +1,140 @@
+import pickle
+
+import pytest
+
+from BACAP_Parser import (Advancement, AdvancementRecord, AdvancementSchema, DEFAULT_ADVANCEMENT_SCHEMA, InvalidAdvancement, SchemaError,
+                          SchemaField)
+from BACAP_Parser.Advancement import InvalidRewardFunction, MalformedAdvancement, MissingDescriptionField, MissingTitleField
+
+from conftest import advancement_json, write_json
+
+ICON = {"id": "minecraft:stone"}
+
+
+@pytest.fixture
+def adv_json() -> dict:
+    return advancement_json("mining", 4)
+
+
+def test_extract_default_fields(adv_json):
+    record = DEFAULT_ADVANCEMENT_SCHEMA.extract(adv_json)
+    assert isinstance(record, AdvancementRecord)
+    assert record.as_dict() == {
+        "reward_function": "bacap_rewards:mining/adv_4",
+        "title": "Adv mining 4",
+        "description": "Do thing number 4 in mining",
+        "description_color": "#75E1FF",
+        "description_extra": [{"text": "\n"}, {"text": "extra words", "color": "#75E1FF"}],
+        "icon": {"id": "minecraft:diamond_pickaxe"},
+        "frame": "goal",
+        "hidden": False,
+        "background": None,
+    }
+    assert record["title"] == record.get("title") == "Adv mining 4"
+    assert record.get("missing", 1) == 1
+    with pytest.raises(KeyError):
+        _ = record["missing"]
+    assert "icon" in record and "missing" not in record
+    assert list(record) == list(DEFAULT_ADVANCEMENT_SCHEMA.field_names)
+
+
+def test_extract_uses_the_first_existing_keypath():
+    data = {"rewards": {"function": "a:b"}, "display": {"icon": ICON, "title": {"text": "Title", "translate": "title.key"},
+                                                        "description": {"text": "Description"}}}
+    record = DEFAULT_ADVANCEMENT_SCHEMA.extract(data)
+    assert (record["title"], record["description"]) == ("title.key", "Description")
+    # Missing optional values get their defaults
+    assert (record["frame"], record["hidden"], record["description_extra"]) == (None, False, None)
+
+
+@pytest.mark.parametrize(("path", "error"), [
+    (("rewards",), InvalidRewardFunction),
+    (("display", "title"), MissingTitleField),
+    (("display", "description"), MissingDescriptionField),
+])
+def test_missing_required_values_return_field_errors(adv_json, path, error):
+    parent = adv_json
+    for key in path[:-1]:
+        parent = parent[key]
+    del parent[path[-1]]
+    assert isinstance(DEFAULT_ADVANCEMENT_SCHEMA.extract(adv_json), error)
+
+
+def test_wrong_types_and_missing_fields_return_schema_errors(adv_json):
+    adv_json["display"]["hidden"] = "yes"
+    result = DEFAULT_ADVANCEMENT_SCHEMA.extract(adv_json)
+    assert isinstance(result, SchemaError)
+    assert (result.field, result.keypath) == ("hidden", "display.hidden")
+    assert "expected bool, got str" in str(result)
+
+    del adv_json["display"]["icon"]
+    result = DEFAULT_ADVANCEMENT_SCHEMA.extract(adv_json)
+    assert isinstance(result, SchemaError) and result.field == "icon"
+
+    # Errors are returned, not raised, and survive pickling for worker processes
+    restored = pickle.loads(pickle.dumps(result))
+    assert (restored.field, restored.keypath, str(restored)) == (result.field, result.keypath, str(result))
+
+    # A non-dict value where a dict is expected is treated as missing
+    adv_json["display"] = "display"
+    assert isinstance(DEFAULT_ADVANCEMENT_SCHEMA.extract(adv_json), MissingTitleField)
+    assert isinstance(DEFAULT_ADVANCEMENT_SCHEMA.extract(None), InvalidRewardFunction)
+
+
+def test_field_and_schema_validation():
+    with pytest.raises(ValueError):
+        SchemaField("empty")
+    with pytest.raises(ValueError):
+        SchemaField("empty", ())
+    with pytest.raises(ValueError):
+        AdvancementSchema((SchemaField("a", ("a",)), SchemaField("a", ("b",))))
+    with pytest.raises(ValueError):
+        DEFAULT_ADVANCEMENT_SCHEMA.extend(SchemaField("title", ("display", "title")))
+
+
+def test_extend_adds_fields_with_shared_keypaths(adv_json):
+    schema = DEFAULT_ADVANCEMENT_SCHEMA.extend(
+        SchemaField("title_component", ("display", "title"), types=dict),
+        SchemaField("addon", ("addon", "value"), types=int, default=0),
+    )
+    assert len(schema) == len(DEFAULT_ADVANCEMENT_SCHEMA) + 2
+    assert "addon" in schema and "addon" not in DEFAULT_ADVANCEMENT_SCHEMA
+    assert schema.index("addon") == len(DEFAULT_ADVANCEMENT_SCHEMA) + 1
+
+    record = schema.extract(adv_json)
+    assert record["title"] == "Adv mining 4"
+    assert record["title_component"] == {"translate": "Adv mining 4"}
+    assert record["addon"] == 0
+    assert record != DEFAULT_ADVANCEMENT_SCHEMA.extract(adv_json)
+
+    adv_json["addon"] = {"value": 5}
+    assert schema.extract(adv_json)["addon"] == 5
+    adv_json["addon"] = {"value": "5"}
+    assert isinstance(schema.extract(adv_json), SchemaError)
+
+
+def test_records_compare_by_values_and_are_unhashable(adv_json):
+    first = DEFAULT_ADVANCEMENT_SCHEMA.extract(adv_json)
+    second = DEFAULT_ADVANCEMENT_SCHEMA.extract(advancement_json("mining", 4))
+    assert first == second
+    assert first != DEFAULT_ADVANCEMENT_SCHEMA.extract(advancement_json("mining", 5))
+    with pytest.raises(TypeError):
+        hash(first)
+
+
+def test_datapack_uses_its_schema(packs, make_datapack):
+    schema = DEFAULT_ADVANCEMENT_SCHEMA.extend(SchemaField("background_required", ("display", "background"), required=True))
+    adv_json = advancement_json("mining", 0)
+    adv_json["display"]["background"] = "minecraft:block/stone"
+    write_json(packs / "bacaped" / "data" / "blazeandcave" / "advancement" / "mining" / "adv_0.json", adv_json)
+
+    manager = make_datapack(schema=schema).advancement_manager
+    adv = manager.get("blazeandcave:mining/adv_0")
+    assert isinstance(adv, Advancement)
+    assert adv.record["background_required"] == "minecraft:block/stone"
+    assert isinstance(manager.get("blazeandcave:mining/adv_3"), InvalidAdvancement)
+    reason = manager.get("blazeandcave:mining/adv_3").reason
+    assert isinstance(reason, MalformedAdvancement) and "background_required" in str(reason)
+
+    with pytest.raises(ValueError):
+        make_datapack(schema=AdvancementSchema((SchemaField("title", ("display", "title", "text")),)))
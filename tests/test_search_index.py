@@ -0,0 +1,81 @@
+from BACAP_Parser import SearchIndex
+from BACAP_Parser.SearchIndex import tokenize
+
+
+def _paths(results) -> list[tuple[str, str]]:
+    return [(adv.datapack.name, adv.mc_path) for adv, _ in results]
+
+
+def test_tokenize():
+    assert tokenize("Hot Tourist Destinations!") == ["hot", "tourist", "destinations"]
+    assert tokenize("") == [] and tokenize(None) == []
+
+
+def test_search_ranks_matching_fields(parser):
+    results = parser.search("adv mining 3", limit=None)
+    assert _paths(results[:2]) == [("bacaped", "blazeandcave:mining/adv_3"), ("bacaped_hardcore", "blazeandcave:mining/adv_3")]
+    assert results[0][1] == results[1][1]
+    assert all(score > 0 for _, score in results)
+    assert [score for _, score in results] == sorted((score for _, score in results), reverse=True)
+
+    # Trophy names are indexed
+    assert {adv.mc_path for adv, _ in parser.search("trophy", limit=None)} == \
+           {"blazeandcave:adventure/adv_2", "blazeandcave:adventure/adv_5", "blazeandcave:adventure/adv_8"}
+
+
+def test_search_options(parser):
+    assert _paths(parser.search("mining 3", datapack="bacaped_hardcore")) == [("bacaped_hardcore", "blazeandcave:mining/adv_3")]
+    assert len(parser.search("adv", limit=3)) == 3
+
+    # Every query word must match unless require_all is False
+    assert parser.search("mining missingword") == []
+    assert parser.search("mining missingword", limit=None, require_all=False) == parser.search("mining", limit=None)
+
+    # Query words match as prefixes unless prefix is False
+    assert len(parser.search("minin", limit=None)) == len(parser.search("mining", limit=None)) > 0
+    assert parser.search("minin", prefix=False) == []
+
+    assert parser.search("") == []
+    assert SearchIndex().search("mining") == []
+
+
+def test_technical_advancements_are_not_indexed(parser):
+    index = parser.search_index
+    assert len(index) == sum(len(datapack.advancement_manager.filtered_list()) for datapack in parser.datapacks)
+
+
+def test_removed_ids_are_reused(parser):
+    advancements = parser.datapacks[0].advancement_manager.filtered_list()
+    index = SearchIndex(advancements)
+    results = _paths(index.search("adv", limit=None))
+    docs = len(index._docs)
+
+    index.remove(advancements[:4])
+    assert len(index) == len(advancements) - 4
+    assert all(adv.mc_path not in {a.mc_path for a in advancements[:4]} for adv, _ in index.search("adv", limit=None))
+    index.remove(advancements[:4])
+    assert len(index) == len(advancements) - 4
+
+    index.add(advancements[:4])
+    index.add(advancements[:4])
+    assert len(index._docs) == docs
+    assert index._free_ids == []
+    assert _paths(index.search("adv", limit=None)) == results
+
+
+def test_reloads_do_not_grow_the_index(parser):
+    index = parser.search_index
+    results = _paths(parser.search("adv building", limit=None))
+    docs, terms = len(index._docs), len(index._postings)
+
+    for _ in range(5):
+        parser.reload()
+        assert (len(index._docs), len(index._postings)) == (docs, terms)
+        assert _paths(parser.search("adv building", limit=None)) == results
+
+    # Removed datapacks leave free ids, the next datapack reuses them
+    removed = parser.remove_datapack("bacaped_hardcore")
+    assert _paths(parser.search("adv building", limit=None)) == [result for result in results if result[0] == "bacaped"]
+    parser.add_datapack(removed)
+    assert len(index._docs) == docs
+    assert sorted(_paths(parser.search("adv building", limit=None))) == sorted(results)
@@ -0,0 +1,74 @@
+from multiprocessing import resource_tracker, shared_memory
+
+import pytest
+
+from BACAP_Parser import Advancement, InvalidAdvancement, SharedModel, TechnicalAdvancement
+from conftest import run_python
+
+
+def _criteria(advancement) -> list[tuple]:
+    return [(criteria.name, criteria.trigger, criteria.conditions) for criteria in advancement.criteria_list]
+
+
+def test_records_match_parsed_advancements(parser):
+    with parser.to_shared_memory() as model:
+        assert model.datapack_names == [datapack.name for datapack in parser.datapacks]
+        assert len(model) == sum(len(datapack.advancement_manager.adv_list) for datapack in parser.datapacks)
+
+        for datapack in parser.datapacks:
+            for adv in datapack.advancement_manager.adv_list:
+                shared = model.get(datapack.name, adv.mc_path)
+                assert shared.datapack == datapack.name
+                assert (shared.path, shared.mc_path, shared.namespace, shared.filename, shared.parent) == \
+                       (adv.path, adv.mc_path, adv.namespace, adv.filename, adv.parent)
+                assert shared.json == adv.json
+                assert _criteria(shared) == _criteria(adv)
+                assert shared.is_technical == isinstance(adv, TechnicalAdvancement)
+                assert shared.is_invalid == isinstance(adv, InvalidAdvancement)
+                if not isinstance(adv, Advancement):
+                    continue
+
+                assert (shared.title, shared.description, shared.tab, shared.frame, shared.hidden, shared.background) == \
+                       (adv.title, adv.description, adv.tab, adv.frame, adv.hidden, adv.background)
+                assert shared.type == adv.type.name
+                assert shared.color.value == adv.color.value
+                assert (shared.icon.id, shared.icon.components) == (adv.icon.id, adv.icon.components)
+                assert shared.exp.value == adv.exp.value
+                assert (shared.reward is None) == (adv.reward is None)
+                if adv.reward is not None:
+                    assert (shared.reward.item.id, shared.reward.item.amount) == (adv.reward.item.id, adv.reward.item.amount)
+                assert (shared.trophy is None) == (adv.trophy is None)
+                if adv.trophy is not None:
+                    assert (shared.trophy.mcpath, shared.trophy.item.name, shared.trophy.item.description) == \
+                           (adv.trophy.mcpath, adv.trophy.item.name, adv.trophy.item.description)
+
+
+def test_get_and_filtered_list(parser):
+    with parser.to_shared_memory() as model:
+        assert model.get("bacaped", "blazeandcave:missing/adv") is None
+        filtered = model.filtered_list("bacaped")
+        assert filtered and all(not adv.is_technical and not adv.is_invalid for adv in filtered)
+        assert [adv.mc_path for adv in model.adv_list("bacaped")] == [adv.mc_path for adv in model.iterator("bacaped")]
+
+
+def test_attach_from_other_processes_keeps_the_block(parser):
+    code = ("import sys; from BACAP_Parser import SharedModel; m = SharedModel.attach(sys.argv[1]); "
+            "print(m.get('bacaped', 'blazeandcave:mining/adv_0').title); m.close()")
+    with parser.to_shared_memory() as model:
+        # The first worker must not unlink the block when it exits, so the second one can still attach
+        for _ in range(2):
+            result = run_python(code, model.name)
+            assert result.stdout.strip() == "Adv mining 0"
+            assert "leaked" not in result.stderr
+
+
+def test_attach_rejects_other_blocks(monkeypatch):
+    block = shared_memory.SharedMemory(create=True, size=64)
+    # The block belongs to this process, attaching must not drop it from the resource tracker before it is unlinked
+    monkeypatch.setattr(resource_tracker, "unregister", lambda name, rtype: None)
+    try:
+        with pytest.raises(ValueError):
+            SharedModel.attach(block.name)
+    finally:
+        block.close()
+        block.unlink()
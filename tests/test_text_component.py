@@ -0,0 +1,68 @@
+import gc
+import json
+import sys
+from collections import OrderedDict
+
+import pytest
+
+from BACAP_Parser import LangIndex, TextComponent
+
+
+@pytest.fixture
+def cache(monkeypatch) -> OrderedDict:
+    """
+    :return: Empty cache of ``TextComponent.of`` that holds at most 2 components.
+    """
+    cache = OrderedDict()
+    monkeypatch.setattr(TextComponent, "_cache", cache)
+    monkeypatch.setattr(sys.modules["BACAP_Parser.TextComponent"], "TEXT_COMPONENT_CACHE_SIZE", 2)
+    return cache
+
+
+def _lang_index(tmp_path, name: str, translations: dict) -> LangIndex:
+    folder = tmp_path / name
+    folder.mkdir()
+    (folder / "en_us.json").write_text(json.dumps(translations), encoding="utf-8")
+    return LangIndex(folder / "en_us.json")
+
+
+def test_plain_text_of_nested_components():
+    component = {"text": "A", "extra": [{"translate": "key", "fallback": "B"}, "C", {"text": "D", "extra": [{"text": "E"}]}]}
+    assert TextComponent(component).plain == "ABCDE"
+    assert TextComponent("text").plain == "text"
+    assert TextComponent(["A", {"text": "B"}]).plain == "AB"
+
+
+def test_of_memoizes_by_component_and_lang_index(tmp_path, cache):
+    component = {"translate": "key"}
+    first = _lang_index(tmp_path, "first", {"key": "First"})
+
+    rendered = TextComponent.of(component, first)
+    assert rendered.plain == "First"
+    assert TextComponent.of(component, first) is rendered
+    assert TextComponent.of(component).plain == "key"
+    assert TextComponent.of(component, first, "de_de") is not rendered
+
+    # The cache keeps the LangIndex, so another LangIndex cannot get its id while the entry exists
+    del first
+    gc.collect()
+    second = _lang_index(tmp_path, "second", {"key": "Second"})
+    assert TextComponent.of(component, second).plain == "Second"
+
+
+def test_equal_components_are_rendered_separately(cache):
+    first, second = {"text": "A"}, {"text": "A"}
+    assert TextComponent.of(first) is not TextComponent.of(second)
+
+
+def test_of_evicts_least_recently_used_components(cache):
+    first, second, third = {"text": "1"}, {"text": "2"}, {"text": "3"}
+    rendered_first = TextComponent.of(first)
+    rendered_second = TextComponent.of(second)
+
+    # A hit makes the first component the most recently used one, so the second one is evicted
+    assert TextComponent.of(first) is rendered_first
+    TextComponent.of(third)
+    assert len(cache) == 2
+    assert TextComponent.of(first) is rendered_first
+    assert TextComponent.of(second) is not rendered_second